@@ -0,0 +1 @@
+"""Offline performance benchmarks for SaaS TESA."""
@@ -0,0 +1,52 @@
+import json
+import statistics
+import time
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+
+def summarize(samples: list[float]) -> dict[str, float]:
+    return {
+        "min_ms": round(min(samples), 2),
+        "median_ms": round(statistics.median(samples), 2),
+        "max_ms": round(max(samples), 2),
+    }
+
+
+def time_calls(call: Callable[[], object], repeat: int) -> list[float]:
+    samples: list[float] = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        call()
+        samples.append((time.perf_counter() - started) * 1000)
+    return samples
+
+
+def load_report(path: Path) -> dict[str, Any]:
+    return dict(json.loads(path.read_text(encoding="utf-8")))
+
+
+def compare_reports(
+    current: dict[str, Any], baseline: dict[str, Any], max_regression_pct: float
+) -> dict[str, Any]:
+    changes: dict[str, dict[str, float]] = {}
+    regressions: list[str] = []
+    baseline_results = baseline.get("results", {})
+    for name, result in current.get("results", {}).items():
+        previous = baseline_results.get(name)
+        if previous is None or not previous.get("median_ms"):
+            continue
+        change_pct = (result["median_ms"] - previous["median_ms"]) / previous["median_ms"] * 100
+        changes[name] = {
+            "baseline_median_ms": previous["median_ms"],
+            "median_ms": result["median_ms"],
+            "change_pct": round(change_pct, 1),
+        }
+        if change_pct > max_regression_pct:
+            regressions.append(name)
+    return {
+        "max_regression_pct": max_regression_pct,
+        "changes": changes,
+        "regressions": regressions,
+    }
@@ -0,0 +1,95 @@
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from collections.abc import Sequence
+from pathlib import Path
+from typing import Any
+
+from benchmarks.report import summarize
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+
+_COLD_START_PROBE = """
+import json, sys, time
+started = time.perf_counter()
+sys.path.insert(0, {root!r})
+import runpy
+module = runpy.run_path({entrypoint!r})
+imported = time.perf_counter()
+from fastapi.testclient import TestClient
+client = TestClient(module["app"])
+client.get("/health").raise_for_status()
+health = time.perf_counter()
+client.get("/api/v1/summary").raise_for_status()
+first_query = time.perf_counter()
+print(json.dumps({{
+    "import_ms": (imported - started) * 1000,
+    "health_ms": (health - imported) * 1000,
+    "first_query_ms": (first_query - health) * 1000,
+}}))
+"""
+
+
+def _timed_subprocess(command: list[str], env: dict[str, str]) -> tuple[float, str]:
+    started = time.perf_counter()
+    completed = subprocess.run(command, env=env, check=True, capture_output=True, text=True)
+    return (time.perf_counter() - started) * 1000, completed.stdout
+
+
+def run(repeat: int) -> dict[str, Any]:
+    with tempfile.TemporaryDirectory() as workdir:
+        env = {
+            **os.environ,
+            "PYTHONPATH": os.pathsep.join([str(ROOT_DIR / "src"), str(ROOT_DIR)]),
+            "TESA_DATABASE_URL": f"sqlite+pysqlite:///{Path(workdir) / 'startup.db'}",
+        }
+        env.pop("PYTEST_CURRENT_TEST", None)
+
+        cli_import: list[float] = []
+        cli_help: list[float] = []
+        cold_total: list[float] = []
+        cold_phases: dict[str, list[float]] = {
+            "import_ms": [],
+            "health_ms": [],
+            "first_query_ms": [],
+        }
+        probe = _COLD_START_PROBE.format(
+            root=str(ROOT_DIR), entrypoint=str(ROOT_DIR / "api" / "index.py")
+        )
+
+        for _ in range(repeat):
+            import_command = [sys.executable, "-c", "import saastesa.cli"]
+            help_command = [sys.executable, "-m", "saastesa.cli", "--help"]
+            cli_import.append(_timed_subprocess(import_command, env)[0])
+            cli_help.append(_timed_subprocess(help_command, env)[0])
+            elapsed, output = _timed_subprocess([sys.executable, "-c", probe], env)
+            cold_total.append(elapsed)
+            for phase, value in json.loads(output).items():
+                cold_phases[phase].append(float(value))
+
+    return {
+        "benchmark": "startup",
+        "repeat": repeat,
+        "results": {
+            "cli_import": summarize(cli_import),
+            "cli_help": summarize(cli_help),
+            "serverless_cold_start": summarize(cold_total),
+            **{f"serverless_{phase}": summarize(values) for phase, values in cold_phases.items()},
+        },
+    }
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Measure CLI and serverless cold-start time")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args(argv)
+    print(json.dumps(run(max(args.repeat, 1)), indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,346 @@
+import argparse
+import json
+import os
+import platform
+import random
+import sys
+import tempfile
+import time
+from collections.abc import Callable, Iterator, Sequence
+from datetime import UTC, datetime, timedelta
+from importlib.util import find_spec
+from pathlib import Path
+from typing import Any
+
+from benchmarks.report import compare_reports, load_report, summarize, time_calls
+
+DEFAULT_SIZES = (1000, 10000)
+SIGNAL_TYPES = ("stale_admin_credential", "public_bucket", "sql_injection", "mfa_disabled")
+
+
+def iter_finding_batches(rows: int, batch_size: int, seed: int) -> Iterator[list[Any]]:
+    from saastesa.api.importer import findings_from_payload
+    from saastesa.api.schemas import SecurityFindingOut
+    from saastesa.demo.seed import iter_demo_findings
+    from saastesa.pipelines.ingest import chunked
+
+    payloads = iter_demo_findings(count=rows, rng=random.Random(seed))
+    for batch in chunked(payloads, batch_size):
+        yield findings_from_payload(SecurityFindingOut.model_validate(payload) for payload in batch)
+
+
+def iter_signal_batches(rows: int, batch_size: int, seed: int) -> Iterator[list[Any]]:
+    from saastesa.core.models import ThreatSignal
+
+    rng = random.Random(seed)
+    started = datetime(2026, 1, 1, tzinfo=UTC)
+    for offset in range(0, rows, batch_size):
+        yield [
+            ThreatSignal(
+                source=rng.choice(("iam", "cspm", "sast", "edr")),
+                signal_type=rng.choice(SIGNAL_TYPES),
+                severity=rng.randint(1, 5),
+                detected_at=started + timedelta(seconds=index),
+                metadata={"asset_id": f"asset-{rng.randint(1, 5000)}", "privileged_access": True},
+            )
+            for index in range(offset, min(offset + batch_size, rows))
+        ]
+
+
+def bench_analyze(rows: int, batch_size: int, seed: int) -> dict[str, Any]:
+    from saastesa.pipelines.analyze import analyze_signals
+
+    samples: list[float] = []
+    for batch in iter_signal_batches(rows, batch_size, seed):
+        started = time.perf_counter()
+        analyze_signals(batch)
+        samples.append((time.perf_counter() - started) * 1000)
+    return _throughput(samples, rows)
+
+
+def bench_columnar(rows: int, batch_size: int, repeat: int, seed: int) -> dict[str, Any]:
+    from saastesa.api.columnar import ColumnarFindingStore
+    from saastesa.core.contracts import FindingStatus
+
+    store = ColumnarFindingStore(capacity=max(rows, 1))
+    insert_samples = _time_batches(store.add, list(iter_finding_batches(rows, batch_size, seed)))
+    return {
+        "columnar_insert": _throughput(insert_samples, rows),
+        "columnar_list_100": summarize(time_calls(lambda: store.list(limit=100), repeat)),
+        "columnar_summary": summarize(time_calls(store.summary, repeat)),
+        "columnar_summary_open": summarize(
+            time_calls(lambda: store.summary(statuses=(FindingStatus.OPEN,)), repeat)
+        ),
+    }
+
+
+def bench_wire(rows: int, batch_size: int, repeat: int, seed: int) -> dict[str, Any]:
+    from saastesa.sdk.api_client import TESAApiClient
+    from saastesa.wire import packb, unpackb
+
+    signals = next(iter_signal_batches(min(rows, batch_size), batch_size, seed))
+    json_client = TESAApiClient("http://bench")
+    msgpack_client = TESAApiClient("http://bench", wire_format="msgpack")
+    json_payload = {"signals": [json_client._serialize_signal(signal) for signal in signals]}
+    msgpack_payload = {"signals": [msgpack_client._serialize_signal(signal) for signal in signals]}
+    json_body = json.dumps(json_payload).encode()
+    msgpack_body = packb(msgpack_payload)
+    return {
+        "wire_json_encode": {
+            **summarize(time_calls(lambda: json.dumps(json_payload).encode(), repeat)),
+            "bytes": len(json_body),
+        },
+        "wire_json_decode": summarize(time_calls(lambda: json.loads(json_body), repeat)),
+        "wire_msgpack_encode": {
+            **summarize(time_calls(lambda: packb(msgpack_payload), repeat)),
+            "bytes": len(msgpack_body),
+        },
+        "wire_msgpack_decode": summarize(time_calls(lambda: unpackb(msgpack_body), repeat)),
+    }
+
+
+def bench_store(
+    database_url: str, rows: int, batch_size: int, repeat: int, seed: int
+) -> dict[str, dict[str, Any]]:
+    from fastapi.testclient import TestClient
+
+    from saastesa.api.cache import FindingCache
+    from saastesa.api.dashboard import DASHBOARD_FIELDS
+    from saastesa.api.db import create_db_engine
+    from saastesa.api.db_models import Base
+    from saastesa.api.importer import import_findings
+    from saastesa.api.main import create_app
+    from saastesa.api.projection import FINDING_FACETS
+    from saastesa.api.store import SQLAlchemyFindingStore
+    from saastesa.demo.seed import generate_demo_findings
+
+    engine = create_db_engine(database_url)
+    Base.metadata.drop_all(engine)
+    store = SQLAlchemyFindingStore(engine)
+    store.init()
+
+    results: dict[str, dict[str, Any]] = {}
+    insert_samples: list[float] = []
+    upsert_batches: list[list[Any]] = []
+    for batch in iter_finding_batches(rows, batch_size, seed):
+        if len(upsert_batches) < 10:
+            upsert_batches.append(batch)
+        started = time.perf_counter()
+        store.add(batch)
+        insert_samples.append((time.perf_counter() - started) * 1000)
+    results["store_insert"] = _throughput(insert_samples, rows)
+
+    upsert_samples = _time_batches(store.add, upsert_batches)
+    results["store_upsert"] = _throughput(
+        upsert_samples, sum(len(batch) for batch in upsert_batches)
+    )
+    started = time.perf_counter()
+    import_findings(
+        engine,
+        "bulk-import",
+        (finding for batch in iter_finding_batches(rows, batch_size, seed) for finding in batch),
+    )
+    results["store_bulk_import"] = _throughput([(time.perf_counter() - started) * 1000], rows)
+    results["store_list_100"] = summarize(time_calls(lambda: store.list(limit=100), repeat))
+    results["store_list_1000"] = summarize(time_calls(lambda: store.list(limit=1000), repeat))
+    results["store_summary"] = summarize(time_calls(store.summary, repeat))
+    results["store_facets"] = summarize(
+        time_calls(lambda: store.facets(FINDING_FACETS), repeat)
+    )
+    results["store_dashboard"] = summarize(
+        time_calls(lambda: store.dashboard(DASHBOARD_FIELDS, recent_limit=500), repeat)
+    )
+    results["store_search_20"] = summarize(
+        time_calls(lambda: store.search("weak kms policy", limit=20), repeat)
+    )
+    cached = SQLAlchemyFindingStore(engine, cache=FindingCache(max(rows, 1000)))
+    cached.list(limit=1000)
+    results["store_list_100_cached"] = summarize(
+        time_calls(lambda: cached.list(limit=100), repeat)
+    )
+    results["store_list_1000_cached"] = summarize(
+        time_calls(lambda: cached.list(limit=1000), repeat)
+    )
+
+    if find_spec("pyarrow") is not None:
+        from saastesa.api.export import write_export
+        from saastesa.api.projection import FINDING_FIELDS
+
+        with tempfile.TemporaryDirectory() as directory:
+            target = Path(directory) / "findings.parquet"
+            export_samples = time_calls(
+                lambda: write_export(
+                    store.iter_fields(FINDING_FIELDS, raw_data_as_text=True),
+                    FINDING_FIELDS,
+                    target,
+                    "parquet",
+                ),
+                repeat,
+            )
+        results["store_export_parquet"] = _throughput(export_samples, rows * repeat)
+
+    client = TestClient(create_app(database_url=database_url))
+    http_payload = {"findings": generate_demo_findings(count=100, seed=seed + 1)}
+    results["http_list_100"] = summarize(
+        time_calls(lambda: client.get("/api/v1/findings?limit=100").raise_for_status(), repeat)
+    )
+    results["http_list_1000"] = summarize(
+        time_calls(lambda: client.get("/api/v1/findings?limit=1000").raise_for_status(), repeat)
+    )
+    results["http_list_100_fields"] = summarize(
+        time_calls(
+            lambda: client.get(
+                "/api/v1/findings?limit=100&fields=title,severity,risk_score,domain,source,time"
+            ).raise_for_status(),
+            repeat,
+        )
+    )
+    results["http_search_20"] = summarize(
+        time_calls(
+            lambda: client.get("/api/v1/findings/search?q=weak+kms+policy").raise_for_status(),
+            repeat,
+        )
+    )
+    if find_spec("pyarrow") is not None:
+        results["http_export_arrow"] = _throughput(
+            time_calls(
+                lambda: client.get("/api/v1/findings/export").raise_for_status(), repeat
+            ),
+            rows * repeat,
+        )
+    results["http_summary"] = summarize(
+        time_calls(lambda: client.get("/api/v1/summary").raise_for_status(), repeat)
+    )
+    results["http_dashboard_cached"] = summarize(
+        time_calls(lambda: client.get("/api/v1/dashboard?limit=500").raise_for_status(), repeat)
+    )
+    results["http_ingest_100"] = summarize(
+        time_calls(
+            lambda: client.post("/api/v1/findings", json=http_payload).raise_for_status(), repeat
+        )
+    )
+    if find_spec("msgpack") is not None:
+        from saastesa.wire import MSGPACK_MEDIA_TYPE, packb
+
+        msgpack_body = packb(http_payload)
+        results["http_ingest_100_msgpack"] = summarize(
+            time_calls(
+                lambda: client.post(
+                    "/api/v1/findings",
+                    content=msgpack_body,
+                    headers={"Content-Type": MSGPACK_MEDIA_TYPE},
+                ).raise_for_status(),
+                repeat,
+            )
+        )
+    engine.dispose()
+    return results
+
+
+def run(
+    sizes: Sequence[int],
+    database_urls: dict[str, str],
+    batch_size: int,
+    repeat: int,
+    seed: int,
+) -> dict[str, Any]:
+    results: dict[str, dict[str, Any]] = {}
+    for rows in sizes:
+        results[f"analyze/{rows}/analyze_signals"] = bench_analyze(rows, batch_size, seed)
+        for name, result in bench_columnar(rows, batch_size, repeat, seed).items():
+            results[f"memory/{rows}/{name}"] = result
+        if find_spec("msgpack") is not None:
+            for name, result in bench_wire(rows, batch_size, repeat, seed).items():
+                results[f"wire/{rows}/{name}"] = result
+        for backend, database_url in database_urls.items():
+            for name, result in bench_store(database_url, rows, batch_size, repeat, seed).items():
+                results[f"{backend}/{rows}/{name}"] = result
+
+    return {
+        "benchmark": "suite",
+        "environment": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "backends": sorted(database_urls),
+        },
+        "parameters": {
+            "sizes": list(sizes),
+            "batch_size": batch_size,
+            "repeat": repeat,
+            "seed": seed,
+        },
+        "results": results,
+    }
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark scoring, store and HTTP paths")
+    parser.add_argument("--sizes", default=",".join(str(size) for size in DEFAULT_SIZES))
+    parser.add_argument("--batch-size", type=int, default=500)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=1337)
+    parser.add_argument(
+        "--postgres-url",
+        default=os.getenv("TESA_BENCH_POSTGRES_URL", ""),
+        help="Throwaway PostgreSQL database; its SaaS TESA tables are dropped first.",
+    )
+    parser.add_argument("--skip-sqlite", action="store_true")
+    parser.add_argument("--include-startup", action="store_true")
+    parser.add_argument("--output", type=Path)
+    parser.add_argument("--baseline", type=Path)
+    parser.add_argument("--max-regression-pct", type=float, default=20.0)
+    args = parser.parse_args(argv)
+
+    sizes = [int(size) for size in args.sizes.split(",") if size.strip()]
+    os.environ.pop("PYTEST_CURRENT_TEST", None)
+    os.environ.setdefault("TESA_INGEST_RATE_PER_SECOND", "0")
+    os.environ.setdefault("TESA_INGEST_MAX_IN_FLIGHT", "0")
+    with tempfile.TemporaryDirectory() as workdir:
+        database_urls: dict[str, str] = {}
+        if not args.skip_sqlite:
+            database_urls["sqlite"] = f"sqlite+pysqlite:///{Path(workdir) / 'bench.db'}"
+        if args.postgres_url:
+            database_urls["postgresql"] = args.postgres_url
+        report = run(sizes, database_urls, max(args.batch_size, 1), max(args.repeat, 1), args.seed)
+
+    if args.include_startup:
+        from benchmarks import startup
+
+        for name, result in startup.run(max(args.repeat, 1))["results"].items():
+            report["results"][f"startup/{name}"] = result
+
+    exit_code = 0
+    if args.baseline is not None:
+        report["comparison"] = compare_reports(
+            report, load_report(args.baseline), args.max_regression_pct
+        )
+        exit_code = 1 if report["comparison"]["regressions"] else 0
+
+    rendered = json.dumps(report, indent=2)
+    if args.output is not None:
+        args.output.write_text(rendered + "\n", encoding="utf-8")
+    print(rendered)
+    return exit_code
+
+
+def _throughput(samples: list[float], rows: int) -> dict[str, Any]:
+    total_ms = sum(samples)
+    return {
+        **summarize(samples),
+        "total_ms": round(total_ms, 2),
+        "rows": rows,
+        "rows_per_second": round(rows / (total_ms / 1000), 1) if total_ms else 0.0,
+    }
+
+
+def _time_batches(call: Callable[[list[Any]], object], batches: list[list[Any]]) -> list[float]:
+    samples: list[float] = []
+    for batch in batches:
+        started = time.perf_counter()
+        call(batch)
+        samples.append((time.perf_counter() - started) * 1000)
+    return samples
+
+
+if __name__ == "__main__":
+    sys.exit(main())
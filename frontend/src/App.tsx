@@ -6,7 +6,7 @@ import { useQuery } from "@tanstack/react-query";
 import { Analytics } from "@vercel/analytics/react";
 import { SpeedInsights } from "@vercel/speed-insights/react";
 
-import { API_BASE_URL, getFindings, getSummary } from "./api";
+import { API_BASE_URL, getDashboard } from "./api";
 import { DomainChart } from "./components/DomainChart";
 import { FindingsChart } from "./components/FindingsChart";
 import { FindingsTable } from "./components/FindingsTable";
@@ -23,18 +23,11 @@ export default function App({ mode, onToggleTheme }: Props) {
   const [loadingWarning, setLoadingWarning] = useState(false);
 
   const {
-    data: summary,
-    isLoading: summaryLoading,
-    isError: summaryError,
-    error: summaryErrorDetails,
-  } = useQuery({ queryKey: ["summary"], queryFn: getSummary, refetchInterval: 15000 });
-
-  const {
-    data: findings,
-    isLoading: findingsLoading,
-    isError: findingsError,
-    error: findingsErrorDetails,
-  } = useQuery({ queryKey: ["findings"], queryFn: () => getFindings(500), refetchInterval: 15000 });
+    data: dashboard,
+    isLoading,
+    isError,
+    error: dashboardError,
+  } = useQuery({ queryKey: ["dashboard"], queryFn: () => getDashboard(500), refetchInterval: 15000 });
 
   useEffect(() => {
     const timer = window.setTimeout(() => setLoadingWarning(true), 10000);
@@ -48,7 +41,7 @@ export default function App({ mode, onToggleTheme }: Props) {
     return "Unknown error";
   };
 
-  if (summaryLoading || findingsLoading) {
+  if (isLoading) {
     return (
       <Container sx={{ py: 4 }}>
         <Box sx={{ minHeight: "30vh", display: "flex", alignItems: "center", justifyContent: "center" }}>
@@ -63,7 +56,7 @@ export default function App({ mode, onToggleTheme }: Props) {
     );
   }
 
-  if (summaryError || findingsError || !summary || !findings) {
+  if (isError || !dashboard) {
     return (
       <Container sx={{ py: 4 }}>
         <Alert severity="error" sx={{ mb: 2 }}>
@@ -72,14 +65,14 @@ export default function App({ mode, onToggleTheme }: Props) {
         <Alert severity="info">
           API base URL: {API_BASE_URL}
           <br />
-          Summary error: {getErrorMessage(summaryErrorDetails)}
-          <br />
-          Findings error: {getErrorMessage(findingsErrorDetails)}
+          Dashboard error: {getErrorMessage(dashboardError)}
         </Alert>
       </Container>
     );
   }
 
+  const { summary, facets, recent: findings } = dashboard;
+
   return (
     <Container
       maxWidth="xl"
@@ -121,10 +114,10 @@ export default function App({ mode, onToggleTheme }: Props) {
           <FindingsChart summary={summary} />
         </Grid>
         <Grid size={{ xs: 12, md: 6, lg: 4 }}>
-          <DomainChart findings={findings} />
+          <DomainChart counts={facets.domain} />
         </Grid>
         <Grid size={{ xs: 12, lg: 4 }}>
-          <SourceChart findings={findings} />
+          <SourceChart counts={facets.source} />
         </Grid>
         <Grid size={{ xs: 12, lg: 5 }}>
           <TrendChart findings={findings} />
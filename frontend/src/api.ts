@@ -1,4 +1,4 @@
-import { FindingsSummary, SecurityFinding } from "./types";
+import { Dashboard, FINDING_LIST_FIELDS, FindingFacets, FindingListItem, FindingsSummary, SecurityFinding } from "./types";
 
 const REQUEST_TIMEOUT_MS = 12000;
 
@@ -57,6 +57,20 @@ export function getSummary(): Promise<FindingsSummary> {
   return fetchJson<FindingsSummary>("/api/v1/summary");
 }
 
-export function getFindings(limit = 200): Promise<SecurityFinding[]> {
-  return fetchJson<SecurityFinding[]>(`/api/v1/findings?limit=${limit}`);
+export function getDashboard(limit = 500): Promise<Dashboard> {
+  return fetchJson<Dashboard>(`/api/v1/dashboard?limit=${limit}`);
+}
+
+export function getFacets(facets?: string[]): Promise<FindingFacets> {
+  const query = facets?.length ? `?facets=${facets.join(",")}` : "";
+  return fetchJson<{ facets: FindingFacets }>(`/api/v1/facets${query}`).then(({ facets }) => facets);
+}
+
+export function getFindings(limit = 200): Promise<FindingListItem[]> {
+  const fields = FINDING_LIST_FIELDS.join(",");
+  return fetchJson<FindingListItem[]>(`/api/v1/findings?limit=${limit}&fields=${fields}`);
+}
+
+export function getFinding(findingUid: string): Promise<SecurityFinding> {
+  return fetchJson<SecurityFinding>(`/api/v1/findings/${encodeURIComponent(findingUid)}`);
 }
@@ -2,16 +2,16 @@ import { Card, CardContent, CardHeader } from "@mui/material";
 import { useTheme } from "@mui/material/styles";
 import { Bar, BarChart, CartesianGrid, ResponsiveContainer, Tooltip, XAxis, YAxis } from "recharts";
 
-import { SecurityFinding } from "../types";
-import { countByDomain } from "../lib/insights";
+import { FacetCounts } from "../types";
+import { facetEntries } from "../lib/insights";
 
 type Props = {
-  findings: SecurityFinding[];
+  counts: FacetCounts;
 };
 
-export function DomainChart({ findings }: Props) {
+export function DomainChart({ counts }: Props) {
   const theme = useTheme();
-  const data = countByDomain(findings);
+  const data = facetEntries(counts).map(({ value, count }) => ({ domain: value, count }));
 
   return (
     <Card elevation={0} variant="outlined">
@@ -1,13 +1,13 @@
 import { Card, CardContent, CardHeader, Chip } from "@mui/material";
 import { DataGrid, GridColDef } from "@mui/x-data-grid";
 
-import { SecurityFinding } from "../types";
+import { FindingListItem } from "../types";
 
 type Props = {
-  findings: SecurityFinding[];
+  findings: FindingListItem[];
 };
 
-const columns: GridColDef<SecurityFinding>[] = [
+const columns: GridColDef<FindingListItem>[] = [
   { field: "title", headerName: "Title", flex: 1.3, minWidth: 220 },
   {
     field: "severity",
@@ -2,16 +2,18 @@ import { Card, CardContent, CardHeader } from "@mui/material";
 import { useTheme } from "@mui/material/styles";
 import { Bar, BarChart, CartesianGrid, ResponsiveContainer, Tooltip, XAxis, YAxis } from "recharts";
 
-import { countBySource } from "../lib/insights";
-import { SecurityFinding } from "../types";
+import { facetEntries } from "../lib/insights";
+import { FacetCounts } from "../types";
 
 type Props = {
-  findings: SecurityFinding[];
+  counts: FacetCounts;
 };
 
-export function SourceChart({ findings }: Props) {
+export function SourceChart({ counts }: Props) {
   const theme = useTheme();
-  const data = countBySource(findings);
+  const data = facetEntries(counts)
+    .slice(0, 8)
+    .map(({ value, count }) => ({ source: value, count }));
 
   return (
     <Card elevation={0} variant="outlined">
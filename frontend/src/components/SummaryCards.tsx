@@ -2,12 +2,12 @@ import { Grid, Paper, Typography } from "@mui/material";
 import { alpha } from "@mui/material/styles";
 
 import { executiveMetrics } from "../lib/insights";
-import { SecurityFinding } from "../types";
+import { FindingListItem } from "../types";
 import { FindingsSummary } from "../types";
 
 type Props = {
   summary: FindingsSummary;
-  findings: SecurityFinding[];
+  findings: FindingListItem[];
 };
 
 export function SummaryCards({ summary, findings }: Props) {
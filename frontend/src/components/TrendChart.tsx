@@ -3,10 +3,10 @@ import { alpha, useTheme } from "@mui/material/styles";
 import { Area, AreaChart, CartesianGrid, ResponsiveContainer, Tooltip, XAxis, YAxis } from "recharts";
 
 import { findingsTrend } from "../lib/insights";
-import { SecurityFinding } from "../types";
+import { FindingListItem } from "../types";
 
 type Props = {
-  findings: SecurityFinding[];
+  findings: FindingListItem[];
 };
 
 export function TrendChart({ findings }: Props) {
@@ -1,34 +1,17 @@
-import { FindingsSummary, SecurityFinding } from "../types";
+import { FacetCounts, FindingListItem, FindingsSummary } from "../types";
 
 export type TimeSeriesPoint = {
   date: string;
   count: number;
 };
 
-export function countByDomain(findings: SecurityFinding[]): Array<{ domain: string; count: number }> {
-  const totals = new Map<string, number>();
-  for (const finding of findings) {
-    const key = finding.domain || "other";
-    totals.set(key, (totals.get(key) ?? 0) + 1);
-  }
-  return [...totals.entries()]
-    .map(([domain, count]) => ({ domain, count }))
+export function facetEntries(counts: FacetCounts): Array<{ value: string; count: number }> {
+  return Object.entries(counts)
+    .map(([value, count]) => ({ value, count }))
     .sort((a, b) => b.count - a.count);
 }
 
-export function countBySource(findings: SecurityFinding[]): Array<{ source: string; count: number }> {
-  const totals = new Map<string, number>();
-  for (const finding of findings) {
-    const key = finding.source || "unknown";
-    totals.set(key, (totals.get(key) ?? 0) + 1);
-  }
-  return [...totals.entries()]
-    .map(([source, count]) => ({ source, count }))
-    .sort((a, b) => b.count - a.count)
-    .slice(0, 8);
-}
-
-export function findingsTrend(findings: SecurityFinding[], days = 14): TimeSeriesPoint[] {
+export function findingsTrend(findings: FindingListItem[], days = 14): TimeSeriesPoint[] {
   const start = new Date();
   start.setHours(0, 0, 0, 0);
   start.setDate(start.getDate() - (days - 1));
@@ -51,7 +34,7 @@ export function findingsTrend(findings: SecurityFinding[], days = 14): TimeSerie
   return [...buckets.entries()].map(([date, count]) => ({ date, count }));
 }
 
-export function executiveMetrics(summary: FindingsSummary, findings: SecurityFinding[]): {
+export function executiveMetrics(summary: FindingsSummary, findings: FindingListItem[]): {
   totalFindings: number;
   criticalRatio: string;
   averageRisk: string;
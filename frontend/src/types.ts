@@ -52,4 +52,43 @@ export type SecurityFinding = {
     mitre_attack: string[];
   };
   raw_data: Record<string, JsonValue>;
+  occurrence_count?: number;
+  last_seen?: string | null;
+};
+
+export const FINDING_LIST_FIELDS = [
+  "finding_uid",
+  "title",
+  "description",
+  "severity",
+  "risk_score",
+  "domain",
+  "type_name",
+  "source",
+  "time",
+] as const;
+
+export type FindingListItem = Pick<SecurityFinding, (typeof FINDING_LIST_FIELDS)[number]>;
+
+export type FacetCounts = Record<string, number>;
+
+export type FindingFacets = Partial<
+  Record<"domain" | "severity" | "status" | "source" | "resource.platform", FacetCounts>
+>;
+
+export type ResourceRisk = {
+  resource: SecurityFinding["resource"];
+  findings: number;
+  max_risk_score: number;
+};
+
+export type Dashboard = {
+  summary: FindingsSummary;
+  facets: {
+    domain: FacetCounts;
+    severity: FacetCounts;
+    source: FacetCounts;
+  };
+  recent: FindingListItem[];
+  top_resources: ResourceRisk[];
 };
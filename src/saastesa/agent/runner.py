@@ -3,7 +3,10 @@ from collections.abc import Sequence
 import time
 
 from saastesa.connectors.mock import MockThreatSignalProvider
+from saastesa.pipelines.ingest import chunked, iter_signals
+from saastesa.pipelines.stream import DEFAULT_CHUNK_SIZE
 from saastesa.sdk.api_client import TESAApiClient
+from saastesa.wire import WireFormat
 
 
 def build_parser() -> argparse.ArgumentParser:
@@ -11,26 +14,37 @@ def build_parser() -> argparse.ArgumentParser:
     parser.add_argument("--api-url", default="http://localhost:8080", help="SaaS TESA API base URL")
     parser.add_argument("--interval-seconds", type=int, default=30, help="Polling interval")
     parser.add_argument("--once", action="store_true", help="Send one batch and exit")
+    parser.add_argument(
+        "--batch-size", type=int, default=DEFAULT_CHUNK_SIZE, help="Signals sent per request"
+    )
+    parser.add_argument(
+        "--wire-format", choices=["json", "msgpack"], default="json", help="Request body encoding"
+    )
     return parser
 
 
-def _run_once(api_url: str) -> None:
+def _run_once(
+    api_url: str, batch_size: int = DEFAULT_CHUNK_SIZE, wire_format: WireFormat = "json"
+) -> None:
     provider = MockThreatSignalProvider()
-    client = TESAApiClient(base_url=api_url)
-    result = client.send_signals(provider.fetch_signals())
-    print(f"Agent pushed {result['ingested']} signals")
+    client = TESAApiClient(base_url=api_url, wire_format=wire_format)
+    pushed = 0
+    for batch in chunked(iter_signals(provider), batch_size):
+        result = client.send_signals(batch)
+        pushed += int(result["ingested"])
+    print(f"Agent pushed {pushed} signals")
 
 
 def main(argv: Sequence[str] | None = None) -> int:
     args = build_parser().parse_args(argv)
 
     if args.once:
-        _run_once(args.api_url)
+        _run_once(args.api_url, args.batch_size, args.wire_format)
         return 0
 
     try:
         while True:
-            _run_once(args.api_url)
+            _run_once(args.api_url, args.batch_size, args.wire_format)
             time.sleep(max(args.interval_seconds, 1))
     except KeyboardInterrupt:
         print("Agent stopped")
@@ -0,0 +1,96 @@
+import math
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from threading import Lock
+
+DEFAULT_INGEST_RATE_PER_SECOND = 20.0
+DEFAULT_INGEST_BURST = 40
+DEFAULT_INGEST_MAX_IN_FLIGHT = 8
+DEFAULT_MAX_TRACKED_CLIENTS = 10000
+
+
+class AdmissionRejectedError(RuntimeError):
+    def __init__(self, message: str, reason: str, retry_after: float) -> None:
+        super().__init__(message)
+        self.reason = reason
+        self.retry_after = retry_after
+
+    @property
+    def retry_after_header(self) -> str:
+        return str(max(math.ceil(self.retry_after), 1))
+
+
+class TokenBucket:
+    def __init__(self, rate_per_second: float, burst: float, now: float) -> None:
+        self.rate_per_second = rate_per_second
+        self.burst = max(burst, 1.0)
+        self._tokens = self.burst
+        self._updated = now
+
+    def acquire(self, now: float, cost: float = 1.0) -> float:
+        elapsed = max(now - self._updated, 0.0)
+        self._tokens = min(self.burst, self._tokens + elapsed * self.rate_per_second)
+        self._updated = now
+        if self._tokens >= cost:
+            self._tokens -= cost
+            return 0.0
+        return (cost - self._tokens) / self.rate_per_second
+
+
+class AdmissionController:
+    def __init__(
+        self,
+        rate_per_second: float = DEFAULT_INGEST_RATE_PER_SECOND,
+        burst: float = DEFAULT_INGEST_BURST,
+        max_in_flight: int = DEFAULT_INGEST_MAX_IN_FLIGHT,
+        max_clients: int = DEFAULT_MAX_TRACKED_CLIENTS,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.rate_per_second = rate_per_second
+        self.burst = burst
+        self.max_in_flight = max_in_flight
+        self.max_clients = max(max_clients, 1)
+        self._clock = clock
+        self._lock = Lock()
+        self._buckets: OrderedDict[str, TokenBucket] = OrderedDict()
+        self._in_flight = 0
+
+    @property
+    def in_flight(self) -> int:
+        with self._lock:
+            return self._in_flight
+
+    @contextmanager
+    def admit(self, client_id: str) -> Iterator[None]:
+        with self._lock:
+            if self.max_in_flight > 0 and self._in_flight >= self.max_in_flight:
+                raise AdmissionRejectedError(
+                    "Ingest capacity is saturated; retry the batch shortly.", "in_flight", 1.0
+                )
+            wait = self._take_token(client_id)
+            if wait > 0:
+                raise AdmissionRejectedError(
+                    f"Ingest rate limit exceeded for {client_id!r}.", "rate_limit", wait
+                )
+            self._in_flight += 1
+        try:
+            yield
+        finally:
+            with self._lock:
+                self._in_flight -= 1
+
+    def _take_token(self, client_id: str) -> float:
+        if self.rate_per_second <= 0:
+            return 0.0
+        now = self._clock()
+        bucket = self._buckets.get(client_id)
+        if bucket is None:
+            bucket = TokenBucket(self.rate_per_second, self.burst, now)
+            self._buckets[client_id] = bucket
+            while len(self._buckets) > self.max_clients:
+                self._buckets.popitem(last=False)
+        else:
+            self._buckets.move_to_end(client_id)
+        return bucket.acquire(now)
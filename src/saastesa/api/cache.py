@@ -0,0 +1,56 @@
+from collections import OrderedDict
+from collections.abc import Iterable, Mapping
+from threading import Lock
+
+from saastesa.core.models import SecurityFinding
+
+DEFAULT_FINDING_CACHE_SIZE = 10000
+
+RowStamp = tuple[int, int]
+
+
+class FindingCache:
+    def __init__(self, max_entries: int = DEFAULT_FINDING_CACHE_SIZE) -> None:
+        self.max_entries = max(max_entries, 0)
+        self._lock = Lock()
+        self._entries: OrderedDict[tuple[str, str], tuple[RowStamp, SecurityFinding]] = (
+            OrderedDict()
+        )
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def lookup(self, tenant_id: str, stamps: Mapping[str, RowStamp]) -> dict[str, SecurityFinding]:
+        found: dict[str, SecurityFinding] = {}
+        with self._lock:
+            for finding_uid, stamp in stamps.items():
+                key = (tenant_id, finding_uid)
+                entry = self._entries.get(key)
+                if entry is None:
+                    continue
+                if entry[0] != stamp:
+                    del self._entries[key]
+                    continue
+                self._entries.move_to_end(key)
+                found[finding_uid] = entry[1]
+        return found
+
+    def store(self, tenant_id: str, entries: Iterable[tuple[RowStamp, SecurityFinding]]) -> None:
+        if self.max_entries == 0:
+            return
+        with self._lock:
+            for stamp, finding in entries:
+                key = (tenant_id, finding.finding_uid)
+                self._entries[key] = (stamp, finding)
+                self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, tenant_id: str, finding_uids: Iterable[str]) -> None:
+        with self._lock:
+            for finding_uid in finding_uids:
+                self._entries.pop((tenant_id, finding_uid), None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
@@ -0,0 +1,314 @@
+import json
+from array import array
+from collections.abc import Callable, Hashable, Iterable, Sequence
+from datetime import UTC, datetime, timedelta
+from enum import Enum
+from threading import Lock
+from typing import Any, Generic, TypeVar, cast
+
+from saastesa.core.contracts import (
+    FindingActivity,
+    FindingClass,
+    FindingDomain,
+    FindingSeverity,
+    FindingStandard,
+    FindingStatus,
+)
+from saastesa.core.models import FindingReferences, FindingResource, SecurityFinding
+from saastesa.core.risk_scoring import RISK_BUCKETS, risk_bucket
+
+DEFAULT_CAPACITY = 100_000
+
+E = TypeVar("E", bound=Enum)
+H = TypeVar("H", bound=Hashable)
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=UTC)
+_MICROSECOND = timedelta(microseconds=1)
+_NO_TIMESTAMP = -(2**63)
+_RISK_LEVEL_MAX = 255
+_BUCKET_TABLE = bytes(RISK_BUCKETS.index(risk_bucket(level)) for level in range(256))
+_MASK_TO_EXCLUDED = bytes([0xFF]) + bytes(255)
+_STRING_COLUMNS: dict[str, Callable[[SecurityFinding], str]] = {
+    "schema_version": lambda finding: finding.schema_version,
+    "title": lambda finding: finding.title,
+    "description": lambda finding: finding.description,
+    "category_name": lambda finding: finding.category_name,
+    "type_name": lambda finding: finding.type_name,
+    "source": lambda finding: finding.source,
+    "resource_uid": lambda finding: finding.resource.uid,
+    "resource_name": lambda finding: finding.resource.name,
+    "resource_type": lambda finding: finding.resource.type,
+    "resource_platform": lambda finding: finding.resource.platform,
+    "raw_data": lambda finding: json.dumps(
+        finding.raw_data, separators=(",", ":"), sort_keys=True, default=str
+    ),
+}
+
+
+class _EnumColumn(Generic[E]):
+    def __init__(self, enum: type[E]) -> None:
+        self.members: tuple[E, ...] = tuple(enum)
+        self._codes = {member: code for code, member in enumerate(self.members)}
+        self.codes = array("B")
+
+    def encode(self, value: E) -> int:
+        return self._codes[value]
+
+    def mask(self, wanted: Iterable[E]) -> bytes:
+        table = bytearray(256)
+        for value in wanted:
+            table[self._codes[value]] = 1
+        return self.codes.tobytes().translate(table)
+
+
+class _Dictionary(Generic[H]):
+    def __init__(self) -> None:
+        self.values: list[H | None] = []
+        self._codes: dict[H, int] = {}
+        self._refs = array("I")
+        self._free: list[int] = []
+
+    def __len__(self) -> int:
+        return len(self._codes)
+
+    def encode(self, value: H) -> int:
+        code = self._codes.get(value)
+        if code is None:
+            if self._free:
+                code = self._free.pop()
+                self.values[code] = value
+                self._refs[code] = 0
+            else:
+                code = len(self.values)
+                self.values.append(value)
+                self._refs.append(0)
+            self._codes[value] = code
+        self._refs[code] += 1
+        return code
+
+    def decode(self, code: int) -> H:
+        return cast(H, self.values[code])
+
+    def release(self, code: int) -> None:
+        self._refs[code] -= 1
+        if self._refs[code] == 0:
+            del self._codes[cast(H, self.values[code])]
+            self.values[code] = None
+            self._free.append(code)
+
+
+class ColumnarFindingStore:
+    def __init__(self, capacity: int = DEFAULT_CAPACITY) -> None:
+        if capacity <= 0:
+            raise ValueError("Columnar store capacity must be positive.")
+        self.capacity = capacity
+        self._lock = Lock()
+        self._start = 0
+        self._finding_uids: list[str] = []
+        self._risk_scores = array("q")
+        self._risk_levels = array("B")
+        self._severity_ids = array("q")
+        self._occurrence_counts = array("q")
+        self._times = array("q")
+        self._last_seen = array("q")
+        self._standard = _EnumColumn(FindingStandard)
+        self._status = _EnumColumn(FindingStatus)
+        self._severity = _EnumColumn(FindingSeverity)
+        self._class_name = _EnumColumn(FindingClass)
+        self._domain = _EnumColumn(FindingDomain)
+        self._activity_name = _EnumColumn(FindingActivity)
+        self._strings: _Dictionary[str] = _Dictionary()
+        self._references: _Dictionary[FindingReferences] = _Dictionary()
+        self._string_codes = {name: array("I") for name in _STRING_COLUMNS}
+        self._reference_codes = array("I")
+
+    def __len__(self) -> int:
+        return len(self._finding_uids)
+
+    def add(self, findings: Iterable[SecurityFinding]) -> None:
+        with self._lock:
+            for finding in findings:
+                if len(self._finding_uids) < self.capacity:
+                    self._append(finding)
+                else:
+                    self._release(self._start)
+                    self._write(self._start, finding)
+                    self._start = (self._start + 1) % self.capacity
+
+    def list(
+        self,
+        limit: int = 100,
+        statuses: Sequence[FindingStatus] = (),
+        domains: Sequence[FindingDomain] = (),
+        min_risk_score: int | None = None,
+    ) -> list[SecurityFinding]:
+        if limit <= 0:
+            return []
+        with self._lock:
+            mask = self._mask(statuses, domains, min_risk_score)
+            slots = _newest_slots(mask, self._start, len(self._finding_uids), limit)
+            findings = [self._read(slot) for slot in slots]
+        findings.reverse()
+        return findings
+
+    def summary(
+        self,
+        statuses: Sequence[FindingStatus] = (),
+        domains: Sequence[FindingDomain] = (),
+        min_risk_score: int | None = None,
+    ) -> dict[str, int]:
+        with self._lock:
+            buckets = self._risk_levels.tobytes().translate(_BUCKET_TABLE)
+            mask = self._mask(statuses, domains, min_risk_score)
+        if mask is not None:
+            buckets = _or_bytes(buckets, mask.translate(_MASK_TO_EXCLUDED))
+        return {name: buckets.count(code) for code, name in enumerate(RISK_BUCKETS)}
+
+    def _append(self, finding: SecurityFinding) -> None:
+        self._finding_uids.append("")
+        for column in (
+            self._risk_scores,
+            self._risk_levels,
+            self._severity_ids,
+            self._occurrence_counts,
+            self._times,
+            self._last_seen,
+            self._reference_codes,
+            *self._string_codes.values(),
+            *(enum_column.codes for enum_column in self._enum_columns()),
+        ):
+            column.append(0)
+        self._write(len(self._finding_uids) - 1, finding)
+
+    def _write(self, slot: int, finding: SecurityFinding) -> None:
+        self._finding_uids[slot] = finding.finding_uid
+        self._risk_scores[slot] = finding.risk_score
+        self._risk_levels[slot] = min(max(finding.risk_score, 0), _RISK_LEVEL_MAX)
+        self._severity_ids[slot] = finding.severity_id
+        self._occurrence_counts[slot] = finding.occurrence_count
+        self._times[slot] = _to_micros(finding.time)
+        self._last_seen[slot] = (
+            _NO_TIMESTAMP if finding.last_seen is None else _to_micros(finding.last_seen)
+        )
+        for column, value in zip(
+            self._enum_columns(),
+            (
+                finding.standard,
+                finding.status,
+                finding.severity,
+                finding.class_name,
+                finding.domain,
+                finding.activity_name,
+            ),
+            strict=True,
+        ):
+            column.codes[slot] = column.encode(value)
+        for name, codes in self._string_codes.items():
+            codes[slot] = self._strings.encode(_STRING_COLUMNS[name](finding))
+        self._reference_codes[slot] = self._references.encode(finding.references)
+
+    def _release(self, slot: int) -> None:
+        for codes in self._string_codes.values():
+            self._strings.release(codes[slot])
+        self._references.release(self._reference_codes[slot])
+
+    def _read(self, slot: int) -> SecurityFinding:
+        strings = {
+            name: self._strings.decode(codes[slot]) for name, codes in self._string_codes.items()
+        }
+        last_seen = self._last_seen[slot]
+        return SecurityFinding(
+            finding_uid=self._finding_uids[slot],
+            standard=self._standard.members[self._standard.codes[slot]],
+            schema_version=cast(Any, strings["schema_version"]),
+            status=self._status.members[self._status.codes[slot]],
+            severity_id=self._severity_ids[slot],
+            severity=self._severity.members[self._severity.codes[slot]],
+            risk_score=self._risk_scores[slot],
+            title=strings["title"],
+            description=strings["description"],
+            category_name=strings["category_name"],
+            class_name=self._class_name.members[self._class_name.codes[slot]],
+            type_name=strings["type_name"],
+            domain=self._domain.members[self._domain.codes[slot]],
+            activity_name=self._activity_name.members[self._activity_name.codes[slot]],
+            time=_from_micros(self._times[slot]),
+            source=strings["source"],
+            resource=FindingResource(
+                uid=strings["resource_uid"],
+                name=strings["resource_name"],
+                type=strings["resource_type"],
+                platform=strings["resource_platform"],
+            ),
+            references=self._references.decode(self._reference_codes[slot]),
+            raw_data=json.loads(strings["raw_data"]),
+            occurrence_count=self._occurrence_counts[slot],
+            last_seen=None if last_seen == _NO_TIMESTAMP else _from_micros(last_seen),
+        )
+
+    def _enum_columns(self) -> tuple[_EnumColumn[Any], ...]:
+        return (
+            self._standard,
+            self._status,
+            self._severity,
+            self._class_name,
+            self._domain,
+            self._activity_name,
+        )
+
+    def _mask(
+        self,
+        statuses: Sequence[FindingStatus],
+        domains: Sequence[FindingDomain],
+        min_risk_score: int | None,
+    ) -> bytes | None:
+        masks: list[bytes] = []
+        if statuses:
+            masks.append(self._status.mask(statuses))
+        if domains:
+            masks.append(self._domain.mask(domains))
+        if min_risk_score is not None and min_risk_score > 0:
+            if min_risk_score > _RISK_LEVEL_MAX:
+                masks.append(bytes(score >= min_risk_score for score in self._risk_scores))
+            else:
+                table = bytes(int(level >= min_risk_score) for level in range(256))
+                masks.append(self._risk_levels.tobytes().translate(table))
+        if not masks:
+            return None
+        combined = masks[0]
+        for mask in masks[1:]:
+            combined = _and_bytes(combined, mask)
+        return combined
+
+
+def _newest_slots(mask: bytes | None, start: int, size: int, limit: int) -> list[int]:
+    slots: list[int] = []
+    for low, high in ((0, start), (start, size)):
+        if len(slots) >= limit:
+            break
+        if mask is None:
+            slots.extend(range(high - 1, max(low, high - (limit - len(slots))) - 1, -1))
+            continue
+        end = high
+        while len(slots) < limit and (slot := mask.rfind(1, low, end)) != -1:
+            slots.append(slot)
+            end = slot
+    return slots
+
+
+def _to_micros(value: datetime) -> int:
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=UTC)
+    return (value - _EPOCH) // _MICROSECOND
+
+
+def _from_micros(value: int) -> datetime:
+    return _EPOCH + timedelta(microseconds=value)
+
+
+def _and_bytes(left: bytes, right: bytes) -> bytes:
+    return (int.from_bytes(left) & int.from_bytes(right)).to_bytes(len(left))
+
+
+def _or_bytes(left: bytes, right: bytes) -> bytes:
+    return (int.from_bytes(left) | int.from_bytes(right)).to_bytes(len(left))
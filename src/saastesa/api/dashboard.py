@@ -0,0 +1,59 @@
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from threading import Lock
+
+from saastesa.metrics import record_cache_lookup
+
+DEFAULT_DASHBOARD_CACHE_SECONDS = 10.0
+DEFAULT_DASHBOARD_CACHE_SIZE = 256
+DASHBOARD_FACETS = ("domain", "severity", "source")
+DASHBOARD_FIELDS = (
+    "finding_uid",
+    "title",
+    "description",
+    "severity",
+    "risk_score",
+    "domain",
+    "type_name",
+    "source",
+    "time",
+)
+
+
+class DashboardCache:
+    def __init__(
+        self,
+        max_age_seconds: float = DEFAULT_DASHBOARD_CACHE_SECONDS,
+        max_entries: int = DEFAULT_DASHBOARD_CACHE_SIZE,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.max_age_seconds = max_age_seconds
+        self.max_entries = max(max_entries, 0)
+        self._clock = clock
+        self._lock = Lock()
+        self._entries: OrderedDict[Hashable, tuple[int, float, bytes]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get_or_build(self, key: Hashable, version: int, build: Callable[[], bytes]) -> bytes:
+        if self.max_age_seconds <= 0 or self.max_entries == 0:
+            return build()
+
+        now = self._clock()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] == version and entry[1] > now:
+                self._entries.move_to_end(key)
+                record_cache_lookup("dashboard", True)
+                return entry[2]
+
+        record_cache_lookup("dashboard", False)
+        body = build()
+        with self._lock:
+            self._entries[key] = (version, now + self.max_age_seconds, body)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return body
@@ -1,9 +1,11 @@
 import os
-from sqlalchemy import Engine, create_engine
-from sqlalchemy.pool import StaticPool
+from typing import TYPE_CHECKING
 
 from saastesa.config import load_settings
 
+if TYPE_CHECKING:
+    from sqlalchemy import Engine
+
 
 def resolve_database_url() -> str:
     configured_url = os.getenv("TESA_DATABASE_URL", "").strip()
@@ -23,7 +25,14 @@ def resolve_database_url() -> str:
     return f"postgresql+psycopg://{pg_user}:{pg_password}@{pg_host}:{pg_port}/{pg_name}"
 
 
-def create_db_engine(database_url: str) -> Engine:
+def resolve_read_database_url() -> str | None:
+    return os.getenv("TESA_DATABASE_READ_URL", "").strip() or None
+
+
+def create_db_engine(database_url: str) -> "Engine":
+    from sqlalchemy import create_engine
+    from sqlalchemy.pool import StaticPool
+
     normalized_url = _normalize_database_url(database_url)
 
     if normalized_url.startswith("sqlite"):
@@ -1,8 +1,22 @@
 from datetime import datetime
-from sqlalchemy import DateTime, Enum as SAEnum, ForeignKey, Integer, JSON, String, UniqueConstraint
+from sqlalchemy import (
+    DDL,
+    DateTime,
+    Enum as SAEnum,
+    ForeignKey,
+    Index,
+    Integer,
+    JSON,
+    String,
+    UniqueConstraint,
+    event,
+    text,
+)
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, relationship
 
 from saastesa.core.contracts import (
+    DEFAULT_TENANT_ID,
     FindingActivity,
     FindingClass,
     FindingDomain,
@@ -13,11 +27,24 @@ from saastesa.core.contracts import (
     JSONValue,
 )
 
+SEARCH_CONFIG = "english"
+SEARCH_TABLE = "security_findings_fts"
+SEARCH_VECTOR = "search_vector"
+
 
 class Base(DeclarativeBase):
     pass
 
 
+class SchemaMigrationRecord(Base):
+    __tablename__ = "schema_migrations"
+
+    version: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=False)
+    name: Mapped[str] = mapped_column(String(128))
+    applied_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
+    backfill_cursor: Mapped[int | None] = mapped_column(Integer, nullable=True)
+
+
 class FindingResourceRecord(Base):
     __tablename__ = "finding_resources"
     __table_args__ = (
@@ -31,7 +58,7 @@ class FindingResourceRecord(Base):
     )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
-    uid: Mapped[str] = mapped_column(String(256), index=True)
+    uid: Mapped[str] = mapped_column(String(256))
     name: Mapped[str] = mapped_column(String(256))
     type: Mapped[str] = mapped_column(String(128))
     platform: Mapped[str] = mapped_column(String(128))
@@ -39,9 +66,35 @@ class FindingResourceRecord(Base):
 
 class SecurityFindingRecord(Base):
     __tablename__ = "security_findings"
+    __table_args__ = (
+        Index("uq_security_findings_tenant_uid", "tenant_id", "finding_uid", unique=True),
+        Index("ix_security_findings_tenant_time_id", "tenant_id", "time", "id"),
+        Index("ix_security_findings_tenant_domain_time", "tenant_id", "domain", "time"),
+        Index(
+            "ix_security_findings_tenant_status_risk_score", "tenant_id", "status", "risk_score"
+        ),
+        Index(
+            "ix_security_findings_tenant_open_time",
+            "tenant_id",
+            "time",
+            sqlite_where=text("status = 'OPEN'"),
+            postgresql_where=text("status = 'OPEN'"),
+        ),
+        Index("ix_security_findings_tenant_fingerprint", "tenant_id", "fingerprint"),
+        Index("ix_security_findings_tenant_source", "tenant_id", "source"),
+        Index(
+            "ix_security_findings_raw_data",
+            "raw_data",
+            postgresql_using="gin",
+            postgresql_ops={"raw_data": "jsonb_path_ops"},
+        ).ddl_if(dialect="postgresql"),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
-    finding_uid: Mapped[str] = mapped_column(String(128), unique=True, index=True)
+    tenant_id: Mapped[str] = mapped_column(
+        String(64), default=DEFAULT_TENANT_ID, server_default=DEFAULT_TENANT_ID
+    )
+    finding_uid: Mapped[str] = mapped_column(String(128))
     standard: Mapped[FindingStandard] = mapped_column(
         SAEnum(FindingStandard, name="finding_standard", native_enum=False)
     )
@@ -55,23 +108,29 @@ class SecurityFindingRecord(Base):
     )
     risk_score: Mapped[int] = mapped_column(Integer)
     title: Mapped[str] = mapped_column(String(256))
-    description: Mapped[str] = mapped_column(String(1024))
+    description: Mapped[str] = mapped_column(String(1024), deferred=True)
     category_name: Mapped[str] = mapped_column(String(128))
     class_name: Mapped[FindingClass] = mapped_column(
         SAEnum(FindingClass, name="finding_class", native_enum=False)
     )
     type_name: Mapped[str] = mapped_column(String(128))
     domain: Mapped[FindingDomain] = mapped_column(
-        SAEnum(FindingDomain, name="finding_domain", native_enum=False), index=True
+        SAEnum(FindingDomain, name="finding_domain", native_enum=False)
     )
     activity_name: Mapped[FindingActivity] = mapped_column(
         SAEnum(FindingActivity, name="finding_activity", native_enum=False)
     )
-    time: Mapped[datetime] = mapped_column(DateTime(timezone=True), index=True)
-    source: Mapped[str] = mapped_column(String(128), index=True)
+    time: Mapped[datetime] = mapped_column(DateTime(timezone=True))
+    source: Mapped[str] = mapped_column(String(128))
+    fingerprint: Mapped[str | None] = mapped_column(String(64), nullable=True)
+    last_seen: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
+    occurrence_count: Mapped[int] = mapped_column(Integer, default=1, server_default="1")
+    row_version: Mapped[int] = mapped_column(Integer, default=1, server_default="1")
 
     resource_id: Mapped[int] = mapped_column(ForeignKey("finding_resources.id"), index=True)
-    raw_data: Mapped[dict[str, JSONValue]] = mapped_column(JSON)
+    raw_data: Mapped[dict[str, JSONValue]] = mapped_column(
+        JSON().with_variant(JSONB(), "postgresql"), deferred=True
+    )
     resource: Mapped[FindingResourceRecord] = relationship()
     reference_items: Mapped[list["FindingReferenceItemRecord"]] = relationship(
         back_populates="finding", cascade="all, delete-orphan"
@@ -82,14 +141,64 @@ class FindingReferenceItemRecord(Base):
     __tablename__ = "finding_reference_items"
     __table_args__ = (
         UniqueConstraint("finding_id", "reference_type", "reference_value", name="uq_finding_reference_item"),
+        Index("ix_finding_reference_items_value_type", "reference_value", "reference_type"),
     )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
-    finding_id: Mapped[int] = mapped_column(ForeignKey("security_findings.id"), index=True)
+    finding_id: Mapped[int] = mapped_column(ForeignKey("security_findings.id"))
     reference_type: Mapped[FindingReferenceType] = mapped_column(
-        SAEnum(FindingReferenceType, name="finding_reference_type", native_enum=False),
-        index=True,
+        SAEnum(FindingReferenceType, name="finding_reference_type", native_enum=False)
     )
-    reference_value: Mapped[str] = mapped_column(String(256), index=True)
+    reference_value: Mapped[str] = mapped_column(String(256))
 
     finding: Mapped[SecurityFindingRecord] = relationship(back_populates="reference_items")
+
+
+class IdempotencyKeyRecord(Base):
+    __tablename__ = "idempotency_keys"
+    __table_args__ = (
+        UniqueConstraint("tenant_id", "route", "key", name="uq_idempotency_keys_tenant_route_key"),
+        Index("ix_idempotency_keys_tenant_expires_at", "tenant_id", "expires_at"),
+    )
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    tenant_id: Mapped[str] = mapped_column(String(64))
+    route: Mapped[str] = mapped_column(String(128))
+    key: Mapped[str] = mapped_column(String(255))
+    fingerprint: Mapped[str] = mapped_column(String(64))
+    response: Mapped[dict[str, JSONValue] | None] = mapped_column(
+        JSON().with_variant(JSONB(), "postgresql"), nullable=True
+    )
+    expires_at: Mapped[datetime] = mapped_column(DateTime(timezone=True))
+
+
+SEARCH_INDEX_DDL: dict[str, tuple[DDL, ...]] = {
+    "sqlite": (
+        DDL(
+            f"CREATE VIRTUAL TABLE IF NOT EXISTS {SEARCH_TABLE} "
+            "USING fts5(title, description, type_name, tokenize='porter unicode61')"
+        ),
+    ),
+    "postgresql": (
+        DDL(
+            f"ALTER TABLE security_findings ADD COLUMN IF NOT EXISTS {SEARCH_VECTOR} tsvector "
+            f"GENERATED ALWAYS AS (to_tsvector('{SEARCH_CONFIG}', "
+            "title || ' ' || description || ' ' || type_name)) STORED"
+        ),
+        DDL(
+            "CREATE INDEX IF NOT EXISTS ix_security_findings_search "
+            f"ON security_findings USING gin ({SEARCH_VECTOR})"
+        ),
+    ),
+}
+
+for dialect, statements in SEARCH_INDEX_DDL.items():
+    for statement in statements:
+        event.listen(
+            SecurityFindingRecord.__table__, "after_create", statement.execute_if(dialect=dialect)
+        )
+event.listen(
+    SecurityFindingRecord.__table__,
+    "after_drop",
+    DDL(f"DROP TABLE IF EXISTS {SEARCH_TABLE}").execute_if(dialect="sqlite"),
+)
@@ -0,0 +1,178 @@
+import io
+import json
+from collections.abc import Iterable, Iterator, Sequence
+from datetime import UTC, datetime
+from enum import StrEnum
+from pathlib import Path
+from typing import Any
+
+from saastesa.core.contracts import (
+    FindingActivity,
+    FindingClass,
+    FindingDomain,
+    FindingReferenceType,
+    FindingSeverity,
+    FindingStandard,
+    FindingStatus,
+)
+
+ARROW_STREAM_MEDIA_TYPE = "application/vnd.apache.arrow.stream"
+DEFAULT_EXPORT_BATCH_SIZE = 10000
+
+_ENUM_FIELDS: dict[str, type[StrEnum]] = {
+    "standard": FindingStandard,
+    "status": FindingStatus,
+    "severity": FindingSeverity,
+    "class_name": FindingClass,
+    "domain": FindingDomain,
+    "activity_name": FindingActivity,
+}
+_INTEGER_FIELDS = frozenset({"severity_id", "risk_score", "occurrence_count"})
+_TIMESTAMP_FIELDS = frozenset({"time", "last_seen"})
+_RESOURCE_FIELDS = ("uid", "name", "type", "platform")
+
+
+class ExportUnavailableError(RuntimeError):
+    pass
+
+
+def export_format(path: Path, requested: str | None = None) -> str:
+    if requested is not None:
+        return requested
+    return "parquet" if path.suffix.lower() == ".parquet" else "arrow"
+
+
+def export_schema(fields: Sequence[str]) -> Any:
+    pa = _pyarrow()
+    return pa.schema([_arrow_field(pa, name) for name in fields])
+
+
+def record_batches(chunks: Iterable[list[dict[str, Any]]], fields: Sequence[str]) -> Iterator[Any]:
+    pa = _pyarrow()
+    schema = export_schema(fields)
+    for rows in chunks:
+        if rows:
+            yield pa.RecordBatch.from_arrays(
+                [_column(pa, schema.field(name).type, name, rows) for name in fields],
+                schema=schema,
+            )
+
+
+def write_export(
+    chunks: Iterable[list[dict[str, Any]]], fields: Sequence[str], path: Path, file_format: str
+) -> int:
+    pa = _pyarrow()
+    schema = export_schema(fields)
+    exported = 0
+    if file_format == "parquet":
+        import pyarrow.parquet as pq
+
+        with pq.ParquetWriter(path, schema, compression="zstd") as writer:
+            for batch in record_batches(chunks, fields):
+                writer.write_batch(batch)
+                exported += batch.num_rows
+        return exported
+
+    with path.open("wb") as handle, pa.ipc.new_stream(handle, schema) as writer:
+        for batch in record_batches(chunks, fields):
+            writer.write_batch(batch)
+            exported += batch.num_rows
+    return exported
+
+
+def iter_arrow_stream(
+    chunks: Iterable[list[dict[str, Any]]], fields: Sequence[str]
+) -> Iterator[bytes]:
+    pa = _pyarrow()
+    buffer = io.BytesIO()
+    with pa.ipc.new_stream(buffer, export_schema(fields)) as writer:
+        for batch in record_batches(chunks, fields):
+            writer.write_batch(batch)
+            yield _drain(buffer)
+    yield _drain(buffer)
+
+
+def _pyarrow() -> Any:
+    try:
+        import pyarrow
+    except ImportError as error:
+        raise ExportUnavailableError(
+            "Arrow export requires pyarrow; install saastesa[analytics]."
+        ) from error
+    return pyarrow
+
+
+def _arrow_field(pa: Any, name: str) -> Any:
+    if name in _ENUM_FIELDS:
+        return pa.field(name, pa.dictionary(pa.int8(), pa.string()), nullable=False)
+    if name in _INTEGER_FIELDS:
+        return pa.field(name, pa.int32(), nullable=False)
+    if name in _TIMESTAMP_FIELDS:
+        return pa.field(name, pa.timestamp("us", tz="UTC"), nullable=name == "last_seen")
+    if name == "resource":
+        return pa.field(
+            name, pa.struct([(key, pa.string()) for key in _RESOURCE_FIELDS]), nullable=False
+        )
+    if name == "references":
+        return pa.field(
+            name,
+            pa.struct([(kind.value, pa.list_(pa.string())) for kind in FindingReferenceType]),
+            nullable=False,
+        )
+    if name == "raw_data":
+        return pa.field(name, pa.string(), nullable=False, metadata={"encoding": "json"})
+    return pa.field(name, pa.string(), nullable=False)
+
+
+def _column(pa: Any, arrow_type: Any, name: str, rows: list[dict[str, Any]]) -> Any:
+    values = [row[name] for row in rows]
+    if name in _ENUM_FIELDS:
+        members = list(_ENUM_FIELDS[name])
+        codes = {member: code for code, member in enumerate(members)}
+        return pa.DictionaryArray.from_arrays(
+            pa.array([codes[value] for value in values], pa.int8()),
+            pa.array([member.value for member in members], pa.string()),
+        )
+    if name in _TIMESTAMP_FIELDS:
+        return pa.array([_as_utc(value) for value in values], arrow_type)
+    if name == "resource":
+        return pa.StructArray.from_arrays(
+            [
+                pa.array([getattr(resource, key) for resource in values], pa.string())
+                for key in _RESOURCE_FIELDS
+            ],
+            fields=list(arrow_type),
+        )
+    if name == "references":
+        return pa.StructArray.from_arrays(
+            [
+                pa.array(
+                    [list(getattr(references, kind.value)) for references in values],
+                    pa.list_(pa.string()),
+                )
+                for kind in FindingReferenceType
+            ],
+            fields=list(arrow_type),
+        )
+    if name == "raw_data":
+        return pa.array(
+            [
+                value if isinstance(value, str) else json.dumps(value, separators=(",", ":"))
+                for value in values
+            ],
+            pa.string(),
+        )
+    return pa.array(values, arrow_type)
+
+
+def _as_utc(value: datetime | None) -> datetime | None:
+    if value is None or value.tzinfo is not None:
+        return value
+    return value.replace(tzinfo=UTC)
+
+
+def _drain(buffer: io.BytesIO) -> bytes:
+    data = buffer.getvalue()
+    buffer.seek(0)
+    buffer.truncate()
+    return data
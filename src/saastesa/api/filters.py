@@ -0,0 +1,94 @@
+import json
+import re
+from collections.abc import Iterable
+from dataclasses import dataclass
+
+from sqlalchemy import ColumnElement, cast, func, literal, or_, type_coerce
+from sqlalchemy.dialects.postgresql import JSONB
+
+from saastesa.api.db_models import SecurityFindingRecord
+from saastesa.core.contracts import JSONValue
+
+RAW_FILTER_PREFIX = "raw."
+
+_RAW_KEY = re.compile(r"^[A-Za-z0-9_-]+(\.[A-Za-z0-9_-]+)*$")
+
+
+class InvalidFilterError(ValueError):
+    pass
+
+
+@dataclass(frozen=True)
+class RawDataFilter:
+    path: tuple[str, ...]
+    value: str
+
+    def candidates(self) -> tuple[JSONValue, ...]:
+        try:
+            literal = json.loads(self.value, parse_constant=_reject_constant)
+        except ValueError:
+            return (self.value,)
+        if isinstance(literal, (dict, list, str)):
+            return (self.value,)
+        return (self.value, literal)
+
+    def document(self, value: JSONValue) -> dict[str, JSONValue]:
+        nested: dict[str, JSONValue] = {self.path[-1]: value}
+        for key in reversed(self.path[:-1]):
+            nested = {key: nested}
+        return nested
+
+
+@dataclass(frozen=True)
+class FindingFilters:
+    raw_data: tuple[RawDataFilter, ...] = ()
+
+    @property
+    def active(self) -> bool:
+        return bool(self.raw_data)
+
+
+NO_FILTERS = FindingFilters()
+
+
+def parse_finding_filters(params: Iterable[tuple[str, str]]) -> FindingFilters:
+    raw_filters: list[RawDataFilter] = []
+    for name, value in params:
+        if not name.startswith(RAW_FILTER_PREFIX):
+            continue
+        key = name.removeprefix(RAW_FILTER_PREFIX)
+        if not _RAW_KEY.match(key):
+            raise InvalidFilterError(
+                f"Invalid raw_data filter {name!r}; use raw.<key>[.<key>...]=<value>."
+            )
+        raw_filters.append(RawDataFilter(tuple(key.split(".")), value))
+    return FindingFilters(raw_data=tuple(raw_filters))
+
+
+def finding_filter_clauses(filters: FindingFilters, dialect: str) -> list[ColumnElement[bool]]:
+    return [_raw_data_clause(raw_filter, dialect) for raw_filter in filters.raw_data]
+
+
+def _raw_data_clause(raw_filter: RawDataFilter, dialect: str) -> ColumnElement[bool]:
+    if dialect == "postgresql":
+        column = type_coerce(SecurityFindingRecord.raw_data, JSONB)
+        return or_(
+            *(
+                column.contains(cast(literal(json.dumps(raw_filter.document(value))), JSONB))
+                for value in raw_filter.candidates()
+            )
+        )
+
+    path = "$" + "".join(f'."{key}"' for key in raw_filter.path)
+    clauses: list[ColumnElement[bool]] = []
+    for value in raw_filter.candidates():
+        if value is None or isinstance(value, bool):
+            json_type = "null" if value is None else str(value).lower()
+            clauses.append(func.json_type(SecurityFindingRecord.raw_data, path) == json_type)
+        else:
+            clauses.append(func.json_extract(SecurityFindingRecord.raw_data, path) == value)
+    return or_(*clauses)
+
+
+def _reject_constant(constant: str) -> JSONValue:
+    raise ValueError(f"{constant} is not valid JSON")
@@ -0,0 +1,161 @@
+import hashlib
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta
+from typing import Annotated, Any, TypeVar, cast
+
+from fastapi import Header, HTTPException, Request
+from pydantic import BaseModel
+from sqlalchemy import Engine, and_, delete, insert, select, update
+from sqlalchemy.exc import IntegrityError
+
+from saastesa.api.db_models import IdempotencyKeyRecord
+from saastesa.wire import IDEMPOTENCY_HEADER
+
+DEFAULT_IDEMPOTENCY_TTL_SECONDS = 3600.0
+DEFAULT_IDEMPOTENCY_CLAIM_SECONDS = 300.0
+MAX_IDEMPOTENCY_KEY_LENGTH = 255
+
+ResponseT = TypeVar("ResponseT", bound=BaseModel)
+
+
+class IdempotencyError(RuntimeError):
+    pass
+
+
+class IdempotencyKeyInUseError(IdempotencyError):
+    pass
+
+
+class IdempotencyKeyReusedError(IdempotencyError):
+    pass
+
+
+@dataclass(frozen=True)
+class IdempotencyKey:
+    route: str
+    key: str
+    fingerprint: str
+
+
+def _utcnow() -> datetime:
+    return datetime.now(tz=UTC)
+
+
+class IdempotencyStore:
+    def __init__(
+        self,
+        ttl_seconds: float = DEFAULT_IDEMPOTENCY_TTL_SECONDS,
+        claim_seconds: float = DEFAULT_IDEMPOTENCY_CLAIM_SECONDS,
+        clock: Callable[[], datetime] = _utcnow,
+    ) -> None:
+        self.ttl_seconds = ttl_seconds
+        self.claim_seconds = claim_seconds
+        self._clock = clock
+
+    @property
+    def enabled(self) -> bool:
+        return self.ttl_seconds > 0
+
+    def run(
+        self,
+        engine: Engine,
+        tenant_id: str,
+        key: IdempotencyKey | None,
+        response_type: type[ResponseT],
+        work: Callable[[], ResponseT],
+    ) -> ResponseT:
+        if key is None or not self.enabled:
+            return work()
+
+        stored = self._claim(engine, tenant_id, key)
+        if stored is not None:
+            return response_type.model_validate(stored)
+
+        keys = cast(Any, IdempotencyKeyRecord.__table__)
+        claimed = and_(
+            keys.c.tenant_id == tenant_id,
+            keys.c.route == key.route,
+            keys.c.key == key.key,
+            keys.c.fingerprint == key.fingerprint,
+            keys.c.response.is_(None),
+        )
+        try:
+            response = work()
+        except BaseException:
+            with engine.begin() as connection:
+                connection.execute(delete(keys).where(claimed))
+            raise
+
+        with engine.begin() as connection:
+            connection.execute(
+                update(keys)
+                .where(claimed)
+                .values(
+                    response=response.model_dump(mode="json"),
+                    expires_at=self._clock() + timedelta(seconds=self.ttl_seconds),
+                )
+            )
+        return response
+
+    def _claim(
+        self, engine: Engine, tenant_id: str, key: IdempotencyKey
+    ) -> dict[str, Any] | None:
+        keys = cast(Any, IdempotencyKeyRecord.__table__)
+        now = self._clock()
+        claim_seconds = min(self.claim_seconds, self.ttl_seconds)
+        try:
+            with engine.begin() as connection:
+                connection.execute(
+                    delete(keys).where(keys.c.tenant_id == tenant_id, keys.c.expires_at <= now)
+                )
+                connection.execute(
+                    insert(keys).values(
+                        tenant_id=tenant_id,
+                        route=key.route,
+                        key=key.key,
+                        fingerprint=key.fingerprint,
+                        expires_at=now + timedelta(seconds=claim_seconds),
+                    )
+                )
+            return None
+        except IntegrityError:
+            pass
+
+        with engine.connect() as connection:
+            existing = connection.execute(
+                select(keys.c.fingerprint, keys.c.response).where(
+                    keys.c.tenant_id == tenant_id,
+                    keys.c.route == key.route,
+                    keys.c.key == key.key,
+                )
+            ).first()
+        if existing is None:
+            raise IdempotencyKeyInUseError(
+                f"A batch with {IDEMPOTENCY_HEADER} {key.key!r} is still being processed."
+            )
+        if existing.fingerprint != key.fingerprint:
+            raise IdempotencyKeyReusedError(
+                f"{IDEMPOTENCY_HEADER} {key.key!r} was already used for a different batch."
+            )
+        if existing.response is None:
+            raise IdempotencyKeyInUseError(
+                f"A batch with {IDEMPOTENCY_HEADER} {key.key!r} is still being processed."
+            )
+        return cast(dict[str, Any], existing.response)
+
+
+async def idempotency_key(
+    request: Request,
+    key: Annotated[str | None, Header(alias=IDEMPOTENCY_HEADER)] = None,
+) -> IdempotencyKey | None:
+    if key is None:
+        return None
+    key = key.strip()
+    if not key or len(key) > MAX_IDEMPOTENCY_KEY_LENGTH:
+        raise HTTPException(
+            status_code=400,
+            detail=f"{IDEMPOTENCY_HEADER} must be 1-{MAX_IDEMPOTENCY_KEY_LENGTH} characters.",
+        )
+    fingerprint = hashlib.sha256(await request.body()).hexdigest()
+    return IdempotencyKey(route=request.url.path, key=key, fingerprint=fingerprint)
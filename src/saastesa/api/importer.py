@@ -0,0 +1,462 @@
+import gzip
+import json
+import time
+from collections.abc import Callable, Iterable, Iterator, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import IO, Any, cast
+
+from pydantic import ValidationError
+from sqlalchemy import (
+    JSON,
+    Column,
+    Connection,
+    DateTime,
+    Engine,
+    Index,
+    Integer,
+    MetaData,
+    String,
+    Table,
+    and_,
+    case,
+    delete,
+    exists,
+    func,
+    insert,
+    literal,
+    select,
+    update,
+)
+from sqlalchemy.dialects.postgresql import JSONB
+
+from saastesa.api.db_models import (
+    FindingReferenceItemRecord,
+    FindingResourceRecord,
+    SecurityFindingRecord,
+)
+from saastesa.api.retention import ensure_monthly_partitions
+from saastesa.api.schemas import SecurityFindingOut
+from saastesa.api.search import reindex_for_search
+from saastesa.core.models import FindingReferences, FindingResource, SecurityFinding
+from saastesa.core.risk_scoring import finding_fingerprint
+from saastesa.pipelines.ingest import chunked
+
+DEFAULT_IMPORT_BATCH_SIZE = 50000
+
+_GZIP_MAGIC = b"\x1f\x8b"
+_FINDING_COLUMNS = (
+    "finding_uid",
+    "standard",
+    "schema_version",
+    "status",
+    "severity_id",
+    "severity",
+    "risk_score",
+    "title",
+    "description",
+    "category_name",
+    "class_name",
+    "type_name",
+    "domain",
+    "activity_name",
+    "time",
+    "source",
+    "fingerprint",
+    "last_seen",
+    "occurrence_count",
+    "raw_data",
+)
+_RESOURCE_COLUMNS = ("resource_uid", "resource_name", "resource_type", "resource_platform")
+_STAGED_COLUMNS = (
+    "position",
+    *(name for name in _FINDING_COLUMNS if name != "raw_data"),
+    *_RESOURCE_COLUMNS,
+    "raw_data",
+)
+_UPDATED_COLUMNS = tuple(
+    name
+    for name in _FINDING_COLUMNS
+    if name not in {"finding_uid", "time", "last_seen", "occurrence_count"}
+)
+
+_staging = MetaData()
+_STAGED_FINDINGS = Table(
+    "import_findings",
+    _staging,
+    Column("position", Integer, primary_key=True, autoincrement=False),
+    Column("finding_uid", String(128), nullable=False),
+    Column("standard", String(32)),
+    Column("schema_version", String(32)),
+    Column("status", String(32)),
+    Column("severity_id", Integer),
+    Column("severity", String(32)),
+    Column("risk_score", Integer),
+    Column("title", String(256)),
+    Column("description", String(1024)),
+    Column("category_name", String(128)),
+    Column("class_name", String(64)),
+    Column("type_name", String(128)),
+    Column("domain", String(32)),
+    Column("activity_name", String(32)),
+    Column("time", DateTime(timezone=True)),
+    Column("source", String(128)),
+    Column("fingerprint", String(64)),
+    Column("last_seen", DateTime(timezone=True)),
+    Column("occurrence_count", Integer),
+    Column("raw_data", JSON().with_variant(JSONB(), "postgresql")),
+    Column("resource_uid", String(256)),
+    Column("resource_name", String(256)),
+    Column("resource_type", String(128)),
+    Column("resource_platform", String(128)),
+    Index("ix_import_findings_finding_uid", "finding_uid"),
+    prefixes=["TEMPORARY"],
+)
+_STAGED_REFERENCES = Table(
+    "import_reference_items",
+    _staging,
+    Column("finding_uid", String(128), nullable=False),
+    Column("reference_type", String(32), nullable=False),
+    Column("reference_value", String(256), nullable=False),
+    Column("finding_id", Integer),
+    Index(
+        "ix_import_reference_items_finding",
+        "finding_id",
+        "reference_type",
+        "reference_value",
+    ),
+    prefixes=["TEMPORARY"],
+)
+
+ImportProgress = Callable[[str], None]
+
+
+@dataclass(frozen=True)
+class _StagedBatch:
+    size: int
+    earliest: datetime
+    latest: datetime
+    finding_rows: list[tuple[Any, ...]]
+    reference_rows: list[tuple[str, str, str]]
+
+
+class ImportFormatError(ValueError):
+    pass
+
+
+def findings_from_payload(payload_findings: Iterable[SecurityFindingOut]) -> list[SecurityFinding]:
+    return [
+        SecurityFinding(
+            finding_uid=finding.finding_uid,
+            standard=finding.standard,
+            schema_version=finding.schema_version,
+            status=finding.status,
+            severity_id=finding.severity_id,
+            severity=finding.severity,
+            risk_score=finding.risk_score,
+            title=finding.title,
+            description=finding.description,
+            category_name=finding.category_name,
+            class_name=finding.class_name,
+            type_name=finding.type_name,
+            domain=finding.domain,
+            activity_name=finding.activity_name,
+            time=finding.time,
+            source=finding.source,
+            resource=FindingResource(
+                uid=finding.resource.uid,
+                name=finding.resource.name,
+                type=finding.resource.type,
+                platform=finding.resource.platform,
+            ),
+            references=FindingReferences(
+                cve=tuple(finding.references.cve),
+                cwe=tuple(finding.references.cwe),
+                owasp=tuple(finding.references.owasp),
+                mitre_attack=tuple(finding.references.mitre_attack),
+            ),
+            raw_data=finding.raw_data,
+            occurrence_count=finding.occurrence_count,
+            last_seen=finding.last_seen,
+        )
+        for finding in payload_findings
+    ]
+
+
+def read_findings(paths: Iterable[Path]) -> Iterator[SecurityFinding]:
+    for path in paths:
+        with _open(path) as handle:
+            for line_number, line in enumerate(handle, start=1):
+                if not line.strip():
+                    continue
+                try:
+                    payload = SecurityFindingOut.model_validate_json(line)
+                except ValidationError as error:
+                    raise ImportFormatError(
+                        f"{path}:{line_number}: {error.errors()[0]['msg']}"
+                    ) from error
+                yield from findings_from_payload([payload])
+
+
+def import_findings(
+    engine: Engine,
+    tenant_id: str,
+    findings: Iterable[SecurityFinding],
+    batch_size: int = DEFAULT_IMPORT_BATCH_SIZE,
+    progress: ImportProgress | None = None,
+) -> int:
+    imported = 0
+    started = time.perf_counter()
+    batches = (_prepare(batch) for batch in chunked(findings, max(batch_size, 1)))
+    with engine.connect() as connection, ThreadPoolExecutor(max_workers=1) as reader:
+        _staging.create_all(connection)
+        connection.commit()
+        try:
+            pending = reader.submit(next, batches, None)
+            while (staged_batches := pending.result()) is not None:
+                pending = reader.submit(next, batches, None)
+                for batch in staged_batches:
+                    _ensure_partitions(engine, batch)
+                with connection.begin():
+                    for batch in staged_batches:
+                        _stage(connection, batch)
+                        _merge(connection, tenant_id)
+                imported += sum(batch.size for batch in staged_batches)
+                if progress is not None:
+                    rate = imported / max(time.perf_counter() - started, 1e-9)
+                    progress(f"Imported {imported} findings ({rate:,.0f} rows/s)")
+        finally:
+            _staging.drop_all(connection)
+            connection.commit()
+    return imported
+
+
+def _open(path: Path) -> IO[str]:
+    with path.open("rb") as probe:
+        compressed = probe.read(2) == _GZIP_MAGIC
+    if compressed:
+        return gzip.open(path, "rt", encoding="utf-8")
+    return path.open(encoding="utf-8")
+
+
+def _generations(batch: list[SecurityFinding]) -> list[list[SecurityFinding]]:
+    generations: list[list[SecurityFinding]] = []
+    repeats: dict[str, int] = {}
+    for finding in batch:
+        depth = repeats.get(finding.finding_uid, 0)
+        repeats[finding.finding_uid] = depth + 1
+        if depth == len(generations):
+            generations.append([])
+        generations[depth].append(finding)
+    return generations
+
+
+def _prepare(batch: list[SecurityFinding]) -> list[_StagedBatch]:
+    return [
+        _StagedBatch(
+            size=len(generation),
+            earliest=min(finding.time for finding in generation),
+            latest=max(finding.time for finding in generation),
+            finding_rows=[
+                _finding_row(position, finding) for position, finding in enumerate(generation)
+            ],
+            reference_rows=[row for finding in generation for row in _reference_rows(finding)],
+        )
+        for generation in _generations(batch)
+    ]
+
+
+def _ensure_partitions(engine: Engine, batch: _StagedBatch) -> None:
+    if engine.dialect.name != "postgresql":
+        return
+    earliest, latest = batch.earliest, batch.latest
+    months = (latest.year - earliest.year) * 12 + latest.month - earliest.month
+    ensure_monthly_partitions(engine, now=earliest, months_ahead=months)
+
+
+def _finding_row(position: int, finding: SecurityFinding) -> tuple[Any, ...]:
+    resource = finding.resource
+    return (
+        position,
+        finding.finding_uid,
+        finding.standard.name,
+        finding.schema_version,
+        finding.status.name,
+        finding.severity_id,
+        finding.severity.name,
+        finding.risk_score,
+        finding.title,
+        finding.description,
+        finding.category_name,
+        finding.class_name.name,
+        finding.type_name,
+        finding.domain.name,
+        finding.activity_name.name,
+        finding.time,
+        finding.source,
+        finding_fingerprint(finding),
+        finding.last_seen or finding.time,
+        finding.occurrence_count,
+        resource.uid,
+        resource.name,
+        resource.type,
+        resource.platform,
+        finding.raw_data,
+    )
+
+
+def _reference_rows(finding: SecurityFinding) -> Iterator[tuple[str, str, str]]:
+    references = finding.references
+    for reference_type, values in (
+        ("CVE", references.cve),
+        ("CWE", references.cwe),
+        ("OWASP", references.owasp),
+        ("MITRE_ATTACK", references.mitre_attack),
+    ):
+        for value in sorted(set(values)):
+            yield finding.finding_uid, reference_type, value
+
+
+def _stage(connection: Connection, batch: _StagedBatch) -> None:
+    connection.execute(delete(_STAGED_FINDINGS))
+    connection.execute(delete(_STAGED_REFERENCES))
+    finding_rows, reference_rows = batch.finding_rows, batch.reference_rows
+    reference_columns = ("finding_uid", "reference_type", "reference_value")
+    if connection.dialect.name == "postgresql":
+        _copy(
+            connection,
+            _STAGED_FINDINGS.name,
+            _STAGED_COLUMNS,
+            ((*row[:-1], json.dumps(row[-1], separators=(",", ":"))) for row in finding_rows),
+        )
+        _copy(connection, _STAGED_REFERENCES.name, reference_columns, reference_rows)
+        return
+
+    for columns, table, rows in (
+        (_STAGED_COLUMNS, _STAGED_FINDINGS, finding_rows),
+        (reference_columns, _STAGED_REFERENCES, reference_rows),
+    ):
+        for chunk in chunked(rows, 1000):
+            connection.execute(
+                insert(table), [dict(zip(columns, row, strict=True)) for row in chunk]
+            )
+
+
+def _copy(
+    connection: Connection,
+    table_name: str,
+    columns: Sequence[str],
+    rows: Iterable[tuple[Any, ...]],
+) -> None:
+    cursor = connection.connection.driver_connection.cursor()  # type: ignore[union-attr]
+    with cursor, cursor.copy(f"COPY {table_name} ({', '.join(columns)}) FROM STDIN") as copy:
+        for row in rows:
+            copy.write_row(row)
+
+
+def _merge(connection: Connection, tenant_id: str) -> None:
+    findings = cast(Any, SecurityFindingRecord.__table__)
+    resources = cast(Any, FindingResourceRecord.__table__)
+    references = cast(Any, FindingReferenceItemRecord.__table__)
+    staged = _STAGED_FINDINGS
+    staged_references = _STAGED_REFERENCES
+    same_resource = and_(
+        resources.c.uid == staged.c.resource_uid,
+        resources.c.name == staged.c.resource_name,
+        resources.c.type == staged.c.resource_type,
+        resources.c.platform == staged.c.resource_platform,
+    )
+    same_finding = and_(
+        findings.c.tenant_id == tenant_id, findings.c.finding_uid == staged.c.finding_uid
+    )
+
+    connection.execute(
+        insert(resources).from_select(
+            ["uid", "name", "type", "platform"],
+            select(*(staged.c[name] for name in _RESOURCE_COLUMNS))
+            .distinct()
+            .where(~exists().where(same_resource)),
+        )
+    )
+    last_seen = func.coalesce(findings.c.last_seen, findings.c.time)
+    occurrence_count = func.coalesce(findings.c.occurrence_count, 1)
+    newer_sighting = staged.c.last_seen > last_seen
+    connection.execute(
+        update(findings)
+        .where(same_finding, same_resource)
+        .values(
+            {
+                **{name: staged.c[name] for name in _UPDATED_COLUMNS},
+                "last_seen": case((newer_sighting, staged.c.last_seen), else_=last_seen),
+                "occurrence_count": case(
+                    (newer_sighting, occurrence_count + staged.c.occurrence_count),
+                    (staged.c.occurrence_count > occurrence_count, staged.c.occurrence_count),
+                    else_=occurrence_count,
+                ),
+                "row_version": findings.c.row_version + 1,
+                "resource_id": resources.c.id,
+            }
+        )
+    )
+    connection.execute(
+        insert(findings).from_select(
+            ["tenant_id", *_FINDING_COLUMNS, "resource_id"],
+            select(
+                literal(tenant_id, String(64)),
+                *(staged.c[name] for name in _FINDING_COLUMNS),
+                resources.c.id,
+            )
+            .join(resources, same_resource)
+            .where(~exists().where(same_finding))
+            .order_by(staged.c.position),
+        )
+    )
+
+    connection.execute(
+        update(staged_references)
+        .where(
+            findings.c.tenant_id == tenant_id,
+            findings.c.finding_uid == staged_references.c.finding_uid,
+        )
+        .values(finding_id=findings.c.id)
+    )
+    imported_ids = (
+        select(findings.c.id)
+        .join(staged, staged.c.finding_uid == findings.c.finding_uid)
+        .where(findings.c.tenant_id == tenant_id)
+    )
+    connection.execute(
+        delete(references).where(
+            references.c.finding_id.in_(imported_ids),
+            ~exists().where(
+                staged_references.c.finding_id == references.c.finding_id,
+                staged_references.c.reference_type == references.c.reference_type,
+                staged_references.c.reference_value == references.c.reference_value,
+            ),
+        )
+    )
+    connection.execute(
+        insert(references).from_select(
+            ["finding_id", "reference_type", "reference_value"],
+            select(
+                staged_references.c.finding_id,
+                staged_references.c.reference_type,
+                staged_references.c.reference_value,
+            )
+            .where(
+                ~exists().where(
+                    references.c.finding_id == staged_references.c.finding_id,
+                    references.c.reference_type == staged_references.c.reference_type,
+                    references.c.reference_value == staged_references.c.reference_value,
+                )
+            )
+            .order_by(
+                staged_references.c.finding_id,
+                staged_references.c.reference_type,
+                staged_references.c.reference_value,
+            ),
+        )
+    )
+    reindex_for_search(connection, connection.dialect.name, imported_ids)
@@ -0,0 +1,49 @@
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from threading import Condition
+
+
+class DrainingError(RuntimeError):
+    pass
+
+
+class IngestDrain:
+    def __init__(self) -> None:
+        self._condition = Condition()
+        self._in_flight = 0
+        self._draining = False
+
+    @property
+    def in_flight(self) -> int:
+        with self._condition:
+            return self._in_flight
+
+    @property
+    def draining(self) -> bool:
+        with self._condition:
+            return self._draining
+
+    @contextmanager
+    def track(self) -> Iterator[None]:
+        with self._condition:
+            if self._draining:
+                raise DrainingError("Server is shutting down; retry the batch on another worker.")
+            self._in_flight += 1
+        try:
+            yield
+        finally:
+            with self._condition:
+                self._in_flight -= 1
+                self._condition.notify_all()
+
+    def drain(self, timeout: float) -> bool:
+        deadline = time.monotonic() + max(timeout, 0.0)
+        with self._condition:
+            self._draining = True
+            while self._in_flight > 0:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return False
+                self._condition.wait(remaining)
+            return True
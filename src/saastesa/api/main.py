@@ -1,26 +1,106 @@
-from collections.abc import Iterable
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterable
+from contextlib import asynccontextmanager
+from datetime import timedelta
 import os
+from threading import Lock
+import time
 from urllib.parse import urlsplit
-from typing import Any
+from typing import TYPE_CHECKING, Annotated, Any
 
-from fastapi import FastAPI, Query
+from fastapi import Depends, FastAPI, Header, HTTPException, Query, Request
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse, PlainTextResponse, Response, StreamingResponse
+from pydantic import TypeAdapter
+from starlette.concurrency import run_in_threadpool
 import uvicorn
 
-from saastesa.api.db import create_db_engine, resolve_database_url
+from saastesa.api.admission import AdmissionController, AdmissionRejectedError
+from saastesa.api.cache import FindingCache
+from saastesa.api.dashboard import DASHBOARD_FACETS, DASHBOARD_FIELDS, DashboardCache
+from saastesa.api.db import resolve_database_url, resolve_read_database_url
+from saastesa.api.export import (
+    ARROW_STREAM_MEDIA_TYPE,
+    DEFAULT_EXPORT_BATCH_SIZE,
+    ExportUnavailableError,
+    export_schema,
+    iter_arrow_stream,
+)
+from saastesa.api.filters import FindingFilters, InvalidFilterError, parse_finding_filters
+from saastesa.api.idempotency import (
+    IdempotencyKey,
+    IdempotencyKeyInUseError,
+    IdempotencyKeyReusedError,
+    IdempotencyStore,
+    idempotency_key,
+)
+from saastesa.api.importer import findings_from_payload
+from saastesa.api.lifecycle import DrainingError, IngestDrain
+from saastesa.api.negotiation import MessagePackRoute, negotiated, response_format
+from saastesa.api.profiling import (
+    PROFILE_HEADER,
+    install_query_profiler,
+    profile_queries,
+    profiling_requested,
+)
+from saastesa.api.replicas import (
+    READ_YOUR_WRITES_COOKIE,
+    is_sticky,
+    primary_reads,
+    sticky_until,
+)
+from saastesa.api.projection import (
+    FINDING_FIELDS,
+    UnknownFacetError,
+    UnknownFieldError,
+    parse_facets,
+    parse_fields,
+)
+from saastesa.api.search import InvalidCursorError, SearchCursor
+from saastesa.api.tenancy import (
+    TENANT_HEADER,
+    InvalidTenantError,
+    TenantStoreRouter,
+    default_tenant_id,
+    load_shard_map,
+    normalize_tenant_id,
+)
 from saastesa.api.schemas import (
+    DashboardOut,
+    FindingFacetsOut,
+    FindingProjectionOut,
     FindingReferencesOut,
     FindingResourceOut,
+    FindingSearchOut,
     FindingsSummaryOut,
     IngestFindingsRequest,
     IngestFindingsResponse,
     IngestSignalsRequest,
     IngestSignalsResponse,
+    ResourceRiskOut,
     SecurityFindingOut,
+    TenantsOut,
+    TenantsSummaryOut,
 )
-from saastesa.api.store import SQLAlchemyFindingStore
-from saastesa.core.models import FindingReferences, FindingResource, SecurityFinding, ThreatSignal
-from saastesa.pipelines.analyze import analyze_signals
+from saastesa.config import load_settings
+from saastesa.core.models import SecurityFinding, ThreatSignal
+from saastesa.metrics import (
+    DB_QUERIES_PER_REQUEST,
+    REGISTRY,
+    REQUEST_LATENCY,
+    configure_metrics,
+    instrument_engine,
+    record_ingest_batch,
+    record_shed_request,
+    stage_timer,
+    track_request_queries,
+)
+from saastesa.pipelines.analyze import FindingCoalescer, analyze_signals
+from saastesa.wire import WireFormat
+
+if TYPE_CHECKING:
+    from sqlalchemy import Engine
+
+_INGEST_ROUTES = frozenset({"/api/v1/signals", "/api/v1/findings"})
 
 
 def _to_findings_out(findings: Iterable[SecurityFinding]) -> list[SecurityFindingOut]:
@@ -55,55 +135,177 @@ def _to_findings_out(findings: Iterable[SecurityFinding]) -> list[SecurityFindin
                 mitre_attack=list(finding.references.mitre_attack),
             ),
             raw_data=finding.raw_data,
+            occurrence_count=finding.occurrence_count,
+            last_seen=finding.last_seen,
         )
         for finding in findings
     ]
 
 
-def _from_findings_in(payload_findings: list[SecurityFindingOut]) -> list[SecurityFinding]:
-    return [
-        SecurityFinding(
-            finding_uid=finding.finding_uid,
-            standard=finding.standard,
-            schema_version=finding.schema_version,
-            status=finding.status,
-            severity_id=finding.severity_id,
-            severity=finding.severity,
-            risk_score=finding.risk_score,
-            title=finding.title,
-            description=finding.description,
-            category_name=finding.category_name,
-            class_name=finding.class_name,
-            type_name=finding.type_name,
-            domain=finding.domain,
-            activity_name=finding.activity_name,
-            time=finding.time,
-            source=finding.source,
-            resource=FindingResource(
-                uid=finding.resource.uid,
-                name=finding.resource.name,
-                type=finding.resource.type,
-                platform=finding.resource.platform,
-            ),
-            references=FindingReferences(
-                cve=tuple(finding.references.cve),
-                cwe=tuple(finding.references.cwe),
-                owasp=tuple(finding.references.owasp),
-                mitre_attack=tuple(finding.references.mitre_attack),
-            ),
-            raw_data=finding.raw_data,
+_PROJECTIONS = TypeAdapter(list[FindingProjectionOut])
+
+
+def _to_projection_out(values: dict[str, Any]) -> FindingProjectionOut:
+    resource = values.get("resource")
+    if resource is not None:
+        values["resource"] = FindingResourceOut(
+            uid=resource.uid, name=resource.name, type=resource.type, platform=resource.platform
         )
-        for finding in payload_findings
-    ]
+    references = values.get("references")
+    if references is not None:
+        values["references"] = FindingReferencesOut(
+            cve=list(references.cve),
+            cwe=list(references.cwe),
+            owasp=list(references.owasp),
+            mitre_attack=list(references.mitre_attack),
+        )
+    return FindingProjectionOut(**values)
+
 
+def _to_dashboard_out(snapshot: dict[str, Any]) -> DashboardOut:
+    return DashboardOut(
+        summary=FindingsSummaryOut(**snapshot["summary"]),
+        facets=snapshot["facets"],
+        recent=[_to_projection_out(values) for values in snapshot["recent"]],
+        top_resources=[
+            ResourceRiskOut(
+                resource=FindingResourceOut(
+                    uid=entry["resource"].uid,
+                    name=entry["resource"].name,
+                    type=entry["resource"].type,
+                    platform=entry["resource"].platform,
+                ),
+                findings=entry["findings"],
+                max_risk_score=entry["max_risk_score"],
+            )
+            for entry in snapshot["top_resources"]
+        ],
+    )
 
-def create_app(database_url: str | None = None) -> FastAPI:
-    app = FastAPI(title="SaaS TESA API", version="0.1.0")
+
+def create_app(
+    database_url: str | None = None, read_database_url: str | None = None
+) -> FastAPI:
+    settings = load_settings()
+    configure_metrics(settings.metrics_enabled)
     effective_database_url = database_url or resolve_database_url()
+    effective_read_url = read_database_url
     if database_url is None and "PYTEST_CURRENT_TEST" in os.environ:
         effective_database_url = "sqlite+pysqlite:///:memory:"
-    store = SQLAlchemyFindingStore(create_db_engine(effective_database_url))
-    store.init()
+    elif database_url is None and read_database_url is None:
+        effective_read_url = resolve_read_database_url()
+    stores = TenantStoreRouter(
+        effective_database_url,
+        auto_migrate=settings.auto_migrate,
+        read_database_url=effective_read_url,
+        shard_map=load_shard_map() if database_url is None else None,
+        default_tenant=default_tenant_id(),
+        configure_engine=_configure_engine,
+        finding_cache=FindingCache(settings.finding_cache_size),
+    )
+    drain = IngestDrain()
+    idempotency = IdempotencyStore(ttl_seconds=settings.idempotency_ttl_seconds)
+    dashboard_cache = DashboardCache(max_age_seconds=settings.dashboard_cache_seconds)
+    admission = AdmissionController(
+        rate_per_second=settings.ingest_rate_per_second,
+        burst=settings.ingest_burst,
+        max_in_flight=settings.ingest_max_in_flight,
+    )
+    drain_timeout = float(os.getenv("TESA_SHUTDOWN_GRACE_SECONDS", "30"))
+
+    @asynccontextmanager
+    async def lifespan(_: FastAPI) -> AsyncIterator[None]:
+        from saastesa.api.retention import RetentionPruner, load_retention_policy
+
+        pruners: list[RetentionPruner] = []
+        retention_policy = load_retention_policy()
+        if retention_policy is not None:
+            pruners = [
+                RetentionPruner(
+                    engine,
+                    retention_policy,
+                    interval_seconds=float(os.getenv("TESA_RETENTION_INTERVAL_SECONDS", "3600")),
+                )
+                for engine in stores.shard_engines()
+            ]
+            for pruner in pruners:
+                pruner.start()
+        try:
+            yield
+        finally:
+            for pruner in pruners:
+                pruner.stop(timeout=5.0)
+            await run_in_threadpool(drain.drain, drain_timeout)
+            stores.dispose()
+
+    app = FastAPI(title="SaaS TESA API", version="0.1.0", lifespan=lifespan)
+    app.router.route_class = MessagePackRoute
+
+    @app.exception_handler(DrainingError)
+    async def draining_handler(_: Request, error: DrainingError) -> JSONResponse:
+        return JSONResponse(
+            status_code=503, content={"detail": str(error)}, headers={"Retry-After": "1"}
+        )
+
+    @app.exception_handler(IdempotencyKeyInUseError)
+    async def idempotency_in_use_handler(
+        _: Request, error: IdempotencyKeyInUseError
+    ) -> JSONResponse:
+        return JSONResponse(
+            status_code=409, content={"detail": str(error)}, headers={"Retry-After": "1"}
+        )
+
+    @app.exception_handler(IdempotencyKeyReusedError)
+    async def idempotency_reused_handler(
+        _: Request, error: IdempotencyKeyReusedError
+    ) -> JSONResponse:
+        return JSONResponse(status_code=422, content={"detail": str(error)})
+
+    coalescer = FindingCoalescer(
+        window=timedelta(seconds=settings.dedup_window_seconds),
+        max_entries=settings.dedup_cache_size,
+    )
+
+    def request_tenant(
+        organization: Annotated[str | None, Header(alias=TENANT_HEADER)] = None,
+    ) -> str:
+        if organization is None:
+            return stores.default_tenant
+        try:
+            return normalize_tenant_id(organization)
+        except InvalidTenantError as error:
+            raise HTTPException(status_code=400, detail=str(error)) from error
+
+    Tenant = Annotated[str, Depends(request_tenant)]
+
+    def request_filters(request: Request) -> FindingFilters:
+        try:
+            return parse_finding_filters(request.query_params.multi_items())
+        except InvalidFilterError as error:
+            raise HTTPException(status_code=400, detail=str(error)) from error
+
+    Filters = Annotated[FindingFilters, Depends(request_filters)]
+    Wire = Annotated[WireFormat, Depends(response_format)]
+    Idempotency = Annotated[IdempotencyKey | None, Depends(idempotency_key)]
+
+    @app.middleware("http")
+    async def admit_ingest(
+        request: Request, call_next: Callable[[Request], Awaitable[Response]]
+    ) -> Response:
+        if request.method != "POST" or request.url.path not in _INGEST_ROUTES:
+            return await call_next(request)
+
+        client_host = request.client.host if request.client else "unknown"
+        try:
+            with admission.admit(client_host):
+                return await call_next(request)
+        except AdmissionRejectedError as error:
+            record_shed_request(error.reason)
+            return JSONResponse(
+                status_code=429,
+                content={"detail": str(error)},
+                headers={"Retry-After": error.retry_after_header},
+            )
 
     cors_origins = os.getenv(
         "TESA_CORS_ORIGINS",
@@ -120,47 +322,290 @@ def create_app(database_url: str | None = None) -> FastAPI:
         allow_credentials=True,
         allow_methods=["*"],
         allow_headers=["*"],
+        expose_headers=["Server-Timing"],
     )
 
     db_engine = _database_engine_name(effective_database_url)
 
+    @app.middleware("http")
+    async def profile_request_queries(
+        request: Request, call_next: Callable[[Request], Awaitable[Response]]
+    ) -> Response:
+        if not profiling_requested(request.headers.get(PROFILE_HEADER), settings.profile_sql):
+            return await call_next(request)
+
+        started = time.perf_counter()
+        request_label = f"{request.method} {request.url.path}"
+        with profile_queries(settings.slow_query_ms, request_label) as profile:
+            response = await call_next(request)
+        response.headers["Server-Timing"] = profile.server_timing(time.perf_counter() - started)
+        return response
+
+    if effective_read_url:
+
+        @app.middleware("http")
+        async def route_reads(
+            request: Request, call_next: Callable[[Request], Awaitable[Response]]
+        ) -> Response:
+            is_read = request.method in {"GET", "HEAD"}
+            use_primary = not is_read or is_sticky(request.cookies.get(READ_YOUR_WRITES_COOKIE))
+            with primary_reads(use_primary):
+                response = await call_next(request)
+            if not is_read and response.status_code < 400:
+                response.set_cookie(
+                    READ_YOUR_WRITES_COOKIE,
+                    sticky_until(settings.read_your_writes_seconds),
+                    max_age=max(int(settings.read_your_writes_seconds), 1),
+                    httponly=True,
+                    samesite="lax",
+                )
+            return response
+
+    if settings.metrics_enabled:
+
+        @app.middleware("http")
+        async def record_request_metrics(
+            request: Request, call_next: Callable[[Request], Awaitable[Response]]
+        ) -> Response:
+            started = time.perf_counter()
+            with track_request_queries() as queries:
+                response = await call_next(request)
+            route = request.scope.get("route")
+            route_path = getattr(route, "path", "unmatched")
+            REQUEST_LATENCY.observe(
+                time.perf_counter() - started,
+                method=request.method,
+                route=route_path,
+                status=str(response.status_code),
+            )
+            DB_QUERIES_PER_REQUEST.observe(queries[0], route=route_path)
+            return response
+
+        @app.get("/metrics", include_in_schema=False)
+        def metrics() -> PlainTextResponse:
+            return PlainTextResponse(REGISTRY.render(), media_type="text/plain; version=0.0.4")
+
     @app.get("/health")
     def health() -> dict[str, Any]:
-        return {"status": "ok", "database_engine": db_engine}
+        return {
+            "status": "ok",
+            "database_engine": db_engine,
+            "metrics_enabled": settings.metrics_enabled,
+            "read_replica": effective_read_url is not None,
+        }
 
     @app.post("/api/v1/signals", response_model=IngestSignalsResponse)
-    def ingest_signals(request: IngestSignalsRequest) -> IngestSignalsResponse:
-        signals = [
-            ThreatSignal(
-                source=signal.source,
-                signal_type=signal.signal_type,
-                severity=signal.severity,
-                detected_at=signal.detected_at,
-                metadata=signal.metadata,
+    def ingest_signals(
+        request: IngestSignalsRequest, tenant: Tenant, wire: Wire, key: Idempotency
+    ) -> IngestSignalsResponse | Response:
+        response = idempotency.run(
+            stores.get(tenant).engine,
+            tenant,
+            key,
+            IngestSignalsResponse,
+            lambda: _ingest_signals(request, tenant),
+        )
+        return negotiated(wire, response) or response
+
+    def _ingest_signals(request: IngestSignalsRequest, tenant: str) -> IngestSignalsResponse:
+        with stage_timer("validate"):
+            signals = [
+                ThreatSignal(
+                    source=signal.source,
+                    signal_type=signal.signal_type,
+                    severity=signal.severity,
+                    detected_at=signal.detected_at,
+                    metadata=signal.metadata,
+                )
+                for signal in request.signals
+            ]
+        with drain.track():
+            store = stores.get(tenant)
+            with stage_timer("score"):
+                findings = coalescer.coalesce(
+                    analyze_signals(signals),
+                    tenant_id=tenant,
+                    lookup=store.find_recent_by_fingerprints,
+                )
+            store.add(findings)
+        record_ingest_batch(len(findings))
+        with stage_timer("serialize"):
+            return IngestSignalsResponse(
+                ingested=len(signals), findings=_to_findings_out(findings)
             )
-            for signal in request.signals
-        ]
-        findings = analyze_signals(signals)
-        store.add(findings)
-        return IngestSignalsResponse(ingested=len(signals), findings=_to_findings_out(findings))
 
     @app.post("/api/v1/findings", response_model=IngestFindingsResponse)
-    def ingest_findings(request: IngestFindingsRequest) -> IngestFindingsResponse:
-        findings = _from_findings_in(request.findings)
-        store.add(findings)
+    def ingest_findings(
+        request: IngestFindingsRequest, tenant: Tenant, wire: Wire, key: Idempotency
+    ) -> IngestFindingsResponse | Response:
+        response = idempotency.run(
+            stores.get(tenant).engine,
+            tenant,
+            key,
+            IngestFindingsResponse,
+            lambda: _ingest_findings(request, tenant),
+        )
+        return negotiated(wire, response) or response
+
+    def _ingest_findings(request: IngestFindingsRequest, tenant: str) -> IngestFindingsResponse:
+        with drain.track():
+            with stage_timer("validate"):
+                findings = findings_from_payload(request.findings)
+            stores.get(tenant).add(findings)
+        record_ingest_batch(len(findings))
         return IngestFindingsResponse(ingested=len(findings))
 
     @app.get("/api/v1/findings", response_model=list[SecurityFindingOut])
-    def list_findings(limit: int = Query(default=100, ge=1, le=1000)) -> list[SecurityFindingOut]:
-        return _to_findings_out(store.list(limit=limit))
+    def list_findings(
+        tenant: Tenant,
+        filters: Filters,
+        wire: Wire,
+        limit: int = Query(default=100, ge=1, le=1000),
+        fields: str | None = Query(default=None),
+    ) -> list[SecurityFindingOut] | Response:
+        try:
+            selected = parse_fields(fields)
+        except UnknownFieldError as error:
+            raise HTTPException(status_code=400, detail=str(error)) from error
+
+        store = stores.get(tenant)
+        if selected is None:
+            findings = store.list(limit=limit, filters=filters)
+            with stage_timer("serialize"):
+                findings_out = _to_findings_out(findings)
+                return negotiated(wire, findings_out) or findings_out
+
+        rows = store.list_fields(selected, limit=limit, filters=filters)
+        with stage_timer("serialize"):
+            projected = [_to_projection_out(values) for values in rows]
+            return negotiated(wire, projected, exclude_unset=True) or Response(
+                _PROJECTIONS.dump_json(projected, exclude_unset=True),
+                media_type="application/json",
+            )
+
+    @app.get("/api/v1/findings/export", response_class=StreamingResponse)
+    def export_findings(
+        tenant: Tenant,
+        filters: Filters,
+        fields: str | None = Query(default=None),
+        batch_size: int = Query(default=DEFAULT_EXPORT_BATCH_SIZE, ge=100, le=100000),
+    ) -> StreamingResponse:
+        try:
+            selected = parse_fields(fields) or FINDING_FIELDS
+            export_schema(selected)
+        except UnknownFieldError as error:
+            raise HTTPException(status_code=400, detail=str(error)) from error
+        except ExportUnavailableError as error:
+            raise HTTPException(status_code=501, detail=str(error)) from error
+
+        chunks = stores.get(tenant).iter_fields(
+            selected, batch_size=batch_size, filters=filters, raw_data_as_text=True
+        )
+        return StreamingResponse(
+            iter_arrow_stream(chunks, selected), media_type=ARROW_STREAM_MEDIA_TYPE
+        )
+
+    @app.get("/api/v1/findings/search", response_model=FindingSearchOut)
+    def search_findings(
+        tenant: Tenant,
+        filters: Filters,
+        q: str = Query(min_length=1, max_length=256),
+        limit: int = Query(default=20, ge=1, le=100),
+        cursor: str | None = Query(default=None),
+    ) -> FindingSearchOut:
+        try:
+            after = SearchCursor.decode(cursor) if cursor else None
+        except InvalidCursorError as error:
+            raise HTTPException(status_code=400, detail=str(error)) from error
+
+        findings, next_cursor = stores.get(tenant).search(
+            q, limit=limit, cursor=after, filters=filters
+        )
+        with stage_timer("serialize"):
+            return FindingSearchOut(
+                findings=_to_findings_out(findings),
+                next_cursor=next_cursor.encode() if next_cursor else None,
+            )
+
+    @app.get("/api/v1/findings/{finding_uid}", response_model=SecurityFindingOut)
+    def get_finding(finding_uid: str, tenant: Tenant) -> SecurityFindingOut:
+        finding = stores.get(tenant).get(finding_uid)
+        if finding is None:
+            raise HTTPException(status_code=404, detail=f"Finding {finding_uid!r} not found.")
+        return _to_findings_out([finding])[0]
 
     @app.get("/api/v1/summary", response_model=FindingsSummaryOut)
-    def findings_summary() -> FindingsSummaryOut:
-        return FindingsSummaryOut(**store.summary())
+    def findings_summary(tenant: Tenant, filters: Filters) -> FindingsSummaryOut:
+        return FindingsSummaryOut(**stores.get(tenant).summary(filters))
+
+    @app.get("/api/v1/facets", response_model=FindingFacetsOut)
+    def finding_facets(
+        tenant: Tenant, filters: Filters, facets: str | None = Query(default=None)
+    ) -> FindingFacetsOut:
+        try:
+            selected = parse_facets(facets)
+        except UnknownFacetError as error:
+            raise HTTPException(status_code=400, detail=str(error)) from error
+        return FindingFacetsOut(facets=stores.get(tenant).facets(selected, filters=filters))
+
+    @app.get("/api/v1/dashboard", response_model=DashboardOut)
+    def dashboard(
+        tenant: Tenant,
+        filters: Filters,
+        limit: int = Query(default=100, ge=1, le=1000),
+        top_resources: int = Query(default=10, ge=1, le=100),
+    ) -> Response:
+        store = stores.get(tenant)
+
+        def build() -> bytes:
+            snapshot = store.dashboard(
+                DASHBOARD_FIELDS,
+                recent_limit=limit,
+                top_resources=top_resources,
+                facets=DASHBOARD_FACETS,
+                filters=filters,
+            )
+            with stage_timer("serialize"):
+                return _to_dashboard_out(snapshot).model_dump_json(exclude_unset=True).encode()
+
+        body = dashboard_cache.get_or_build(
+            (tenant, limit, top_resources, filters), store.write_version, build
+        )
+        return Response(body, media_type="application/json")
+
+    if settings.admin_routes_enabled:
+
+        @app.get("/api/v1/admin/tenants", response_model=TenantsOut)
+        def list_tenants() -> TenantsOut:
+            return TenantsOut(tenants=stores.tenants())
+
+        @app.get("/api/v1/admin/summary", response_model=TenantsSummaryOut)
+        def tenants_summary() -> TenantsSummaryOut:
+            per_tenant = stores.fan_out(lambda store: store.summary())
+            return TenantsSummaryOut(
+                total=FindingsSummaryOut(**_merge_summaries(per_tenant.values())),
+                tenants={
+                    tenant: FindingsSummaryOut(**summary) for tenant, summary in per_tenant.items()
+                },
+            )
 
     return app
 
 
+def _configure_engine(engine: "Engine") -> None:
+    install_query_profiler(engine)
+    if REGISTRY.enabled:
+        instrument_engine(engine)
+
+
+def _merge_summaries(summaries: Iterable[dict[str, int]]) -> dict[str, int]:
+    merged = {"low": 0, "medium": 0, "high": 0, "critical": 0}
+    for summary in summaries:
+        for bucket, count in summary.items():
+            merged[bucket] = merged.get(bucket, 0) + count
+    return merged
+
+
 def _database_engine_name(database_url: str) -> str:
     scheme = urlsplit(database_url).scheme.lower()
     if scheme.startswith("sqlite"):
@@ -170,13 +615,76 @@ def _database_engine_name(database_url: str) -> str:
     return scheme or "unknown"
 
 
-app = create_app()
+_app: FastAPI | None = None
+_app_lock = Lock()
+
 
+def get_app() -> FastAPI:
+    global _app
+    if _app is None:
+        with _app_lock:
+            if _app is None:
+                _app = create_app()
+    return _app
 
-def serve() -> None:
+
+def __getattr__(name: str) -> Any:
+    if name == "app":
+        return get_app()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def serve(workers: int | None = None, server: str | None = None) -> None:
     host = os.getenv("TESA_API_HOST", "0.0.0.0")
     port = int(os.getenv("TESA_API_PORT", "8080"))
-    uvicorn.run("saastesa.api.main:app", host=host, port=port, reload=False)
+    worker_count = max(workers or int(os.getenv("TESA_API_WORKERS", "1")), 1)
+    server_name = (server or os.getenv("TESA_API_SERVER") or "uvicorn").lower()
+    grace_seconds = int(float(os.getenv("TESA_SHUTDOWN_GRACE_SECONDS", "30")))
+
+    if server_name not in {"uvicorn", "gunicorn"}:
+        raise ValueError(f"Unsupported server {server_name!r}; expected 'uvicorn' or 'gunicorn'.")
+
+    migrate_before_serving()
+    if server_name == "gunicorn":
+        command = gunicorn_command(host, port, worker_count, grace_seconds)
+        os.execvp(command[0], command)
+
+    uvicorn.run(
+        "saastesa.api.main:get_app",
+        host=host,
+        port=port,
+        reload=False,
+        factory=True,
+        workers=worker_count,
+        timeout_graceful_shutdown=grace_seconds,
+    )
+
+
+def migrate_before_serving() -> None:
+    router = TenantStoreRouter(
+        resolve_database_url(),
+        auto_migrate=load_settings().auto_migrate,
+        shard_map=load_shard_map(),
+    )
+    try:
+        router.shard_engines()
+    finally:
+        router.dispose()
+
+
+def gunicorn_command(host: str, port: int, workers: int, grace_seconds: int) -> list[str]:
+    return [
+        "gunicorn",
+        "saastesa.api.main:get_app()",
+        "--worker-class",
+        "uvicorn.workers.UvicornWorker",
+        "--workers",
+        str(workers),
+        "--bind",
+        f"{host}:{port}",
+        "--graceful-timeout",
+        str(grace_seconds),
+    ]
 
 
 if __name__ == "__main__":
@@ -1,118 +1,568 @@
 import json
-from datetime import datetime
+from collections.abc import Callable, Iterator, Sequence
+from contextlib import contextmanager
+from dataclasses import dataclass
+from datetime import UTC, datetime
 from typing import Any, cast
+from weakref import WeakSet
 
-from sqlalchemy import Engine, inspect, text
+from sqlalchemy import Engine, func, inspect, select, text, update
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.exc import OperationalError, ProgrammingError
 
 from saastesa.api.db_models import (
+    SEARCH_INDEX_DDL,
     Base,
     FindingReferenceItemRecord,
     FindingResourceRecord,
+    IdempotencyKeyRecord,
+    SchemaMigrationRecord,
     SecurityFindingRecord,
 )
-from saastesa.core.contracts import FindingReferenceType
+from saastesa.api.retention import is_partitioned
+from saastesa.api.search import index_for_search
+from saastesa.api.tenancy import default_tenant_id
+from saastesa.core.contracts import DEFAULT_TENANT_ID, FindingReferenceType
+
+ProgressCallback = Callable[[str], None]
+
+DEFAULT_BACKFILL_CHUNK_SIZE = 1000
+MIGRATION_LOCK_KEY = 7_400_001
 
 _LEGACY_REFERENCE_COLUMN = "references_json"
 _LEGACY_RESOURCE_COLUMNS = {"resource_uid", "resource_name", "resource_type", "resource_platform"}
+_LEGACY_TABLE = "security_findings_legacy"
+_REDUNDANT_INDEXES = (
+    ("security_findings", "ix_security_findings_time"),
+    ("security_findings", "ix_security_findings_domain"),
+    ("finding_resources", "ix_finding_resources_uid"),
+    ("finding_reference_items", "ix_finding_reference_items_finding_id"),
+    ("finding_reference_items", "ix_finding_reference_items_reference_type"),
+    ("finding_reference_items", "ix_finding_reference_items_reference_value"),
+)
+_TENANT_REPLACED_INDEXES = (
+    ("security_findings", "ix_security_findings_finding_uid"),
+    ("security_findings", "ix_security_findings_time_id"),
+    ("security_findings", "ix_security_findings_domain_time"),
+    ("security_findings", "ix_security_findings_status_risk_score"),
+    ("security_findings", "ix_security_findings_open_time"),
+    ("security_findings", "ix_security_findings_fingerprint"),
+    ("security_findings", "ix_security_findings_source"),
+)
+_CURRENT_ENGINES: WeakSet[Engine] = WeakSet()
+_ADDED_FINDING_COLUMNS = {
+    "fingerprint": "VARCHAR(64)",
+    "last_seen": "TIMESTAMP",
+    "occurrence_count": "INTEGER NOT NULL DEFAULT 1",
+}
+
+
+@dataclass(frozen=True)
+class MigrationContext:
+    engine: Engine
+    version: int
+    chunk_size: int
+    progress: ProgressCallback
+
+
+@dataclass(frozen=True)
+class Migration:
+    version: int
+    name: str
+    upgrade: Callable[[MigrationContext], None]
 
 
 def migrate_schema(engine: Engine) -> None:
-    with engine.begin() as connection:
+    run_migrations(engine)
+
+
+def run_migrations(
+    engine: Engine,
+    chunk_size: int = DEFAULT_BACKFILL_CHUNK_SIZE,
+    progress: ProgressCallback | None = None,
+) -> list[Migration]:
+    report = progress or _ignore_progress
+
+    with _migration_lock(engine):
+        with engine.begin() as connection:
+            table_names = set(inspect(connection).get_table_names())
+            if "security_findings" not in table_names and _LEGACY_TABLE not in table_names:
+                Base.metadata.create_all(connection)
+                _stamp(connection, MIGRATIONS)
+                return []
+            cast(Any, SchemaMigrationRecord.__table__).create(connection, checkfirst=True)
+
+        applied = _applied_versions(engine)
+        pending = [migration for migration in MIGRATIONS if migration.version not in applied]
+        for migration in pending:
+            report(f"Applying migration {migration.version}: {migration.name}")
+            with engine.begin() as connection:
+                _start(connection, migration)
+            migration.upgrade(
+                MigrationContext(engine, migration.version, max(chunk_size, 1), report)
+            )
+            with engine.begin() as connection:
+                connection.execute(
+                    update(SchemaMigrationRecord)
+                    .where(SchemaMigrationRecord.version == migration.version)
+                    .values(applied_at=datetime.now(tz=UTC))
+                )
+    return pending
+
+
+def current_schema_version(engine: Engine) -> int:
+    try:
+        with engine.connect() as connection:
+            version = connection.scalar(
+                select(func.max(SchemaMigrationRecord.version)).where(
+                    SchemaMigrationRecord.applied_at.is_not(None)
+                )
+            )
+    except (OperationalError, ProgrammingError):
+        return 0
+    return int(version or 0)
+
+
+def ensure_schema_current(engine: Engine, auto_migrate: bool = True) -> int:
+    if engine in _CURRENT_ENGINES:
+        return LATEST_SCHEMA_VERSION
+
+    version = current_schema_version(engine)
+    if version >= LATEST_SCHEMA_VERSION:
+        _CURRENT_ENGINES.add(engine)
+        return version
+
+    if auto_migrate or _is_empty_database(engine):
+        run_migrations(engine)
+        _CURRENT_ENGINES.add(engine)
+        return LATEST_SCHEMA_VERSION
+
+    raise RuntimeError(
+        f"Database schema is at version {version} but {LATEST_SCHEMA_VERSION} is required; "
+        "run `saastesa migrate` before starting the API."
+    )
+
+
+def _ignore_progress(_: str) -> None:
+    return None
+
+
+@contextmanager
+def _migration_lock(engine: Engine) -> Iterator[None]:
+    if engine.dialect.name != "postgresql":
+        yield
+        return
+
+    with engine.connect() as connection:
+        connection.execute(text("SELECT pg_advisory_lock(:key)"), {"key": MIGRATION_LOCK_KEY})
+        connection.commit()
+        try:
+            yield
+        finally:
+            connection.execute(
+                text("SELECT pg_advisory_unlock(:key)"), {"key": MIGRATION_LOCK_KEY}
+            )
+            connection.commit()
+
+
+def _is_empty_database(engine: Engine) -> bool:
+    table_names = set(inspect(engine).get_table_names())
+    return "security_findings" not in table_names and _LEGACY_TABLE not in table_names
+
+
+def _applied_versions(engine: Engine) -> set[int]:
+    with engine.connect() as connection:
+        return set(
+            connection.scalars(
+                select(SchemaMigrationRecord.version).where(
+                    SchemaMigrationRecord.applied_at.is_not(None)
+                )
+            )
+        )
+
+
+def _start(connection: Any, migration: Migration) -> None:
+    exists = connection.scalar(
+        select(SchemaMigrationRecord.version).where(
+            SchemaMigrationRecord.version == migration.version
+        )
+    )
+    if exists is None:
+        connection.execute(
+            cast(Any, SchemaMigrationRecord.__table__).insert().values(
+                version=migration.version, name=migration.name
+            )
+        )
+
+
+def _stamp(connection: Any, migrations: Sequence[Migration]) -> None:
+    applied_at = datetime.now(tz=UTC)
+    connection.execute(
+        cast(Any, SchemaMigrationRecord.__table__).insert(),
+        [
+            {"version": migration.version, "name": migration.name, "applied_at": applied_at}
+            for migration in migrations
+        ],
+    )
+
+
+def _load_cursor(engine: Engine, version: int) -> int:
+    with engine.connect() as connection:
+        cursor = connection.scalar(
+            select(SchemaMigrationRecord.backfill_cursor).where(
+                SchemaMigrationRecord.version == version
+            )
+        )
+    return int(cursor or 0)
+
+
+def _save_cursor(connection: Any, version: int, cursor: int) -> None:
+    connection.execute(
+        update(SchemaMigrationRecord)
+        .where(SchemaMigrationRecord.version == version)
+        .values(backfill_cursor=cursor)
+    )
+
+
+def _normalize_findings(context: MigrationContext) -> None:
+    with context.engine.begin() as connection:
         inspector = inspect(connection)
         table_names = set(inspector.get_table_names())
+        if "security_findings" in table_names:
+            columns = {
+                column_info["name"] for column_info in inspector.get_columns("security_findings")
+            }
+            if _is_legacy_findings_table(columns):
+                connection.execute(text(f"ALTER TABLE security_findings RENAME TO {_LEGACY_TABLE}"))
+                _drop_legacy_indexes(connection)
+                table_names.add(_LEGACY_TABLE)
+            elif "resource_id" not in columns:
+                raise RuntimeError(
+                    "Unsupported schema detected for security_findings; "
+                    "cannot migrate automatically."
+                )
+        Base.metadata.create_all(connection)
+
+    if _LEGACY_TABLE in table_names:
+        _backfill_legacy_findings(context)
 
-        if "security_findings" not in table_names:
-            Base.metadata.create_all(connection)
-            return
 
-        security_findings_columns = {
-            column_info["name"] for column_info in inspector.get_columns("security_findings")
+def _add_finding_dedup_columns(context: MigrationContext) -> None:
+    with context.engine.begin() as connection:
+        columns = {
+            column_info["name"]
+            for column_info in inspect(connection).get_columns("security_findings")
         }
-        if "resource_id" in security_findings_columns:
-            Base.metadata.create_all(connection)
-            return
+        _add_missing_finding_columns(connection, columns)
+
 
-        if not _is_legacy_findings_table(security_findings_columns):
-            raise RuntimeError(
-                "Unsupported schema detected for security_findings; cannot migrate automatically."
+def _sync_query_indexes(context: MigrationContext) -> None:
+    with context.engine.begin() as connection:
+        _sync_indexes(connection)
+
+
+def _scope_findings_by_tenant(context: MigrationContext) -> None:
+    with context.engine.begin() as connection:
+        columns = {
+            column_info["name"]
+            for column_info in inspect(connection).get_columns("security_findings")
+        }
+        if "tenant_id" not in columns:
+            connection.execute(
+                text(
+                    "ALTER TABLE security_findings ADD COLUMN tenant_id VARCHAR(64) "
+                    f"NOT NULL DEFAULT '{DEFAULT_TENANT_ID}'"
+                )
             )
 
-        _migrate_legacy_security_findings(connection)
-        _sync_identity_sequences(connection, engine.dialect.name)
+    tenant_id = default_tenant_id()
+    if tenant_id != DEFAULT_TENANT_ID:
+        _assign_default_tenant(context, tenant_id)
 
+    with context.engine.begin() as connection:
+        _sync_indexes(connection, _TENANT_REPLACED_INDEXES)
 
-def _is_legacy_findings_table(column_names: set[str]) -> bool:
-    return _LEGACY_REFERENCE_COLUMN in column_names and _LEGACY_RESOURCE_COLUMNS.issubset(column_names)
 
+def _use_jsonb_raw_data(context: MigrationContext) -> None:
+    with context.engine.begin() as connection:
+        if connection.dialect.name == "postgresql":
+            data_type = connection.scalar(
+                text(
+                    "SELECT data_type FROM information_schema.columns "
+                    "WHERE table_name = 'security_findings' AND column_name = 'raw_data'"
+                )
+            )
+            if data_type == "json":
+                context.progress("Converting security_findings.raw_data to JSONB")
+                connection.execute(
+                    text(
+                        "ALTER TABLE security_findings "
+                        "ALTER COLUMN raw_data TYPE JSONB USING raw_data::jsonb"
+                    )
+                )
+        _sync_indexes(connection)
 
-def _migrate_legacy_security_findings(connection: Any) -> None:
-    connection.execute(text("ALTER TABLE security_findings RENAME TO security_findings_legacy"))
-    _drop_legacy_indexes(connection)
-    Base.metadata.create_all(connection)
 
-    legacy_rows = connection.execute(text("SELECT * FROM security_findings_legacy")).mappings().all()
-    if not legacy_rows:
-        connection.execute(text("DROP TABLE security_findings_legacy"))
+def _add_finding_search_index(context: MigrationContext) -> None:
+    dialect = context.engine.dialect.name
+    with context.engine.begin() as connection:
+        if dialect == "postgresql":
+            context.progress("Adding security_findings.search_vector and its GIN index")
+        for statement in SEARCH_INDEX_DDL.get(dialect, ()):
+            connection.execute(statement)
+    if dialect != "sqlite":
         return
 
-    resource_id_cache: dict[tuple[str, str, str, str], int] = {}
+    cursor = _load_cursor(context.engine, context.version)
+    indexed = 0
+    while True:
+        with context.engine.begin() as connection:
+            rows = connection.execute(
+                select(
+                    SecurityFindingRecord.id,
+                    SecurityFindingRecord.title,
+                    SecurityFindingRecord.description,
+                    SecurityFindingRecord.type_name,
+                )
+                .where(SecurityFindingRecord.id > cursor)
+                .order_by(SecurityFindingRecord.id)
+                .limit(context.chunk_size)
+            ).all()
+            if not rows:
+                break
+            index_for_search(
+                connection,
+                "sqlite",
+                [(row.id, row.title, row.description, row.type_name) for row in rows],
+            )
+            cursor = int(rows[-1][0])
+            _save_cursor(connection, context.version, cursor)
 
-    for row in legacy_rows:
-        resource_key = (
-            str(row["resource_uid"]),
-            str(row["resource_name"]),
-            str(row["resource_type"]),
-            str(row["resource_platform"]),
-        )
-        resource_id = resource_id_cache.get(resource_key)
-        if resource_id is None:
-            resource_insert = connection.execute(
-                cast(Any, FindingResourceRecord.__table__).insert().values(
-                    uid=resource_key[0],
-                    name=resource_key[1],
-                    type=resource_key[2],
-                    platform=resource_key[3],
+        indexed += len(rows)
+        context.progress(f"Indexed {indexed} findings for search (through id {cursor})")
+
+
+def _add_finding_row_version(context: MigrationContext) -> None:
+    with context.engine.begin() as connection:
+        columns = inspect(connection).get_columns("security_findings")
+        if "row_version" not in {column_info["name"] for column_info in columns}:
+            connection.execute(
+                text(
+                    "ALTER TABLE security_findings "
+                    "ADD COLUMN row_version INTEGER NOT NULL DEFAULT 1"
                 )
             )
-            resource_id = int(resource_insert.inserted_primary_key[0])
-            resource_id_cache[resource_key] = resource_id
 
+
+def _add_idempotency_keys(context: MigrationContext) -> None:
+    with context.engine.begin() as connection:
+        cast(Any, IdempotencyKeyRecord.__table__).create(connection, checkfirst=True)
+
+
+MIGRATIONS: tuple[Migration, ...] = (
+    Migration(1, "normalized_findings", _normalize_findings),
+    Migration(2, "finding_dedup_columns", _add_finding_dedup_columns),
+    Migration(3, "query_shape_indexes", _sync_query_indexes),
+    Migration(4, "tenant_scoped_findings", _scope_findings_by_tenant),
+    Migration(5, "jsonb_raw_data", _use_jsonb_raw_data),
+    Migration(6, "finding_search_index", _add_finding_search_index),
+    Migration(7, "idempotency_keys", _add_idempotency_keys),
+    Migration(8, "finding_row_version", _add_finding_row_version),
+)
+LATEST_SCHEMA_VERSION = MIGRATIONS[-1].version
+
+
+def _is_legacy_findings_table(column_names: set[str]) -> bool:
+    return _LEGACY_REFERENCE_COLUMN in column_names and _LEGACY_RESOURCE_COLUMNS.issubset(
+        column_names
+    )
+
+
+def _add_missing_finding_columns(connection: Any, existing_columns: set[str]) -> None:
+    missing = [name for name in _ADDED_FINDING_COLUMNS if name not in existing_columns]
+    for column_name in missing:
+        column_type = _ADDED_FINDING_COLUMNS[column_name]
+        if column_type == "TIMESTAMP" and connection.dialect.name == "postgresql":
+            column_type = "TIMESTAMP WITH TIME ZONE"
         connection.execute(
-            cast(Any, SecurityFindingRecord.__table__).insert().values(
-                id=row["id"],
-                finding_uid=row["finding_uid"],
-                standard=row["standard"],
-                schema_version=row["schema_version"],
-                status=row["status"],
-                severity_id=row["severity_id"],
-                severity=row["severity"],
-                risk_score=row["risk_score"],
-                title=row["title"],
-                description=row["description"],
-                category_name=row["category_name"],
-                class_name=row["class_name"],
-                type_name=row["type_name"],
-                domain=row["domain"],
-                activity_name=row["activity_name"],
-                time=_coerce_datetime(row["time"]),
-                source=row["source"],
-                resource_id=resource_id,
-                raw_data=_coerce_json_object(row["raw_data"]),
-            )
+            text(f"ALTER TABLE security_findings ADD COLUMN {column_name} {column_type}")
         )
 
-        reference_payload = _coerce_json_object(row[_LEGACY_REFERENCE_COLUMN])
-        for reference_type, reference_values in _extract_reference_values(reference_payload).items():
-            for reference_value in reference_values:
+
+def _sync_indexes(
+    connection: Any, redundant: Sequence[tuple[str, str]] = _REDUNDANT_INDEXES
+) -> None:
+    inspector = inspect(connection)
+    for table_name, index_name in redundant:
+        existing = {index.get("name") for index in inspector.get_indexes(table_name)}
+        if index_name in existing:
+            connection.execute(text(f'DROP INDEX IF EXISTS "{index_name}"'))
+
+    partitioned = is_partitioned(connection)
+    for table in Base.metadata.sorted_tables:
+        if not inspector.has_table(table.name):
+            continue
+        columns = {
+            column_info["name"]: column_info["type"]
+            for column_info in inspector.get_columns(table.name)
+        }
+        for index in table.indexes:
+            if not {column.name for column in index.columns}.issubset(columns):
+                continue
+            if index.unique and partitioned and table.name == "security_findings":
+                continue
+            if index.dialect_options["postgresql"]["using"] == "gin" and not all(
+                isinstance(columns[column.name], JSONB) for column in index.columns
+            ):
+                continue
+            index.create(connection, checkfirst=True)
+
+
+def _assign_default_tenant(context: MigrationContext, tenant_id: str) -> None:
+    pending = (
+        select(SecurityFindingRecord.id)
+        .where(SecurityFindingRecord.tenant_id == DEFAULT_TENANT_ID)
+        .limit(context.chunk_size)
+    )
+    assigned = 0
+    while True:
+        with context.engine.begin() as connection:
+            finding_ids = list(connection.scalars(pending))
+            if not finding_ids:
+                break
+            connection.execute(
+                update(SecurityFindingRecord)
+                .where(SecurityFindingRecord.id.in_(finding_ids))
+                .values(tenant_id=tenant_id)
+            )
+        assigned += len(finding_ids)
+        context.progress(f"Assigned {assigned} findings to organization {tenant_id}")
+
+
+def _backfill_legacy_findings(context: MigrationContext) -> None:
+    cursor = _load_cursor(context.engine, context.version)
+    migrated = 0
+
+    while True:
+        with context.engine.begin() as connection:
+            rows = (
                 connection.execute(
-                    cast(Any, FindingReferenceItemRecord.__table__).insert().values(
-                        finding_id=row["id"],
-                        reference_type=reference_type,
-                        reference_value=reference_value,
-                    )
+                    text(
+                        f"SELECT * FROM {_LEGACY_TABLE} "
+                        "WHERE id > :cursor ORDER BY id LIMIT :limit"
+                    ),
+                    {"cursor": cursor, "limit": context.chunk_size},
+                )
+                .mappings()
+                .all()
+            )
+            if not rows:
+                break
+
+            resource_ids = _resolve_resource_ids(connection, rows)
+            connection.execute(
+                cast(Any, SecurityFindingRecord.__table__).insert(),
+                [
+                    _legacy_finding_values(row, resource_ids[_legacy_resource_key(row)])
+                    for row in rows
+                ],
+            )
+            reference_rows = [
+                {
+                    "finding_id": row["id"],
+                    "reference_type": reference_type,
+                    "reference_value": reference_value,
+                }
+                for row in rows
+                for reference_type, reference_values in _extract_reference_values(
+                    _coerce_json_object(row[_LEGACY_REFERENCE_COLUMN])
+                ).items()
+                for reference_value in reference_values
+            ]
+            if reference_rows:
+                connection.execute(
+                    cast(Any, FindingReferenceItemRecord.__table__).insert(), reference_rows
                 )
 
-    connection.execute(text("DROP TABLE security_findings_legacy"))
+            cursor = int(rows[-1]["id"])
+            _save_cursor(connection, context.version, cursor)
+
+        migrated += len(rows)
+        context.progress(f"Backfilled {migrated} legacy findings (through id {cursor})")
+
+    with context.engine.begin() as connection:
+        connection.execute(text(f"DROP TABLE {_LEGACY_TABLE}"))
+        _sync_identity_sequences(connection, context.engine.dialect.name)
+
+
+def _legacy_resource_key(row: Any) -> tuple[str, str, str, str]:
+    return (
+        str(row["resource_uid"]),
+        str(row["resource_name"]),
+        str(row["resource_type"]),
+        str(row["resource_platform"]),
+    )
+
+
+def _resolve_resource_ids(
+    connection: Any, rows: Sequence[Any]
+) -> dict[tuple[str, str, str, str], int]:
+    keys = {_legacy_resource_key(row) for row in rows}
+    resource_ids = _existing_resource_ids(connection, keys)
+    missing = keys - resource_ids.keys()
+    if missing:
+        connection.execute(
+            cast(Any, FindingResourceRecord.__table__).insert(),
+            [
+                {"uid": key[0], "name": key[1], "type": key[2], "platform": key[3]}
+                for key in sorted(missing)
+            ],
+        )
+        resource_ids.update(_existing_resource_ids(connection, missing))
+    return resource_ids
+
+
+def _existing_resource_ids(
+    connection: Any, keys: set[tuple[str, str, str, str]]
+) -> dict[tuple[str, str, str, str], int]:
+    rows = connection.execute(
+        select(
+            FindingResourceRecord.id,
+            FindingResourceRecord.uid,
+            FindingResourceRecord.name,
+            FindingResourceRecord.type,
+            FindingResourceRecord.platform,
+        ).where(FindingResourceRecord.uid.in_({key[0] for key in keys}))
+    )
+    return {
+        (row.uid, row.name, row.type, row.platform): int(row.id)
+        for row in rows
+        if (row.uid, row.name, row.type, row.platform) in keys
+    }
+
+
+def _legacy_finding_values(row: Any, resource_id: int) -> dict[str, Any]:
+    return {
+        "id": row["id"],
+        "finding_uid": row["finding_uid"],
+        "standard": row["standard"],
+        "schema_version": row["schema_version"],
+        "status": row["status"],
+        "severity_id": row["severity_id"],
+        "severity": row["severity"],
+        "risk_score": row["risk_score"],
+        "title": row["title"],
+        "description": row["description"],
+        "category_name": row["category_name"],
+        "class_name": row["class_name"],
+        "type_name": row["type_name"],
+        "domain": row["domain"],
+        "activity_name": row["activity_name"],
+        "time": _coerce_datetime(row["time"]),
+        "source": row["source"],
+        "resource_id": resource_id,
+        "raw_data": _coerce_json_object(row["raw_data"]),
+    }
 
 
 def _extract_reference_values(payload: dict[str, Any]) -> dict[FindingReferenceType, list[str]]:
@@ -167,10 +617,10 @@ def _sync_identity_sequences(connection: Any, dialect_name: str) -> None:
     if dialect_name != "postgresql":
         return
 
-    sequence_sync_sql = [
-        "SELECT setval(pg_get_serial_sequence('finding_resources','id'), COALESCE((SELECT MAX(id) FROM finding_resources), 1), true)",
-        "SELECT setval(pg_get_serial_sequence('security_findings','id'), COALESCE((SELECT MAX(id) FROM security_findings), 1), true)",
-        "SELECT setval(pg_get_serial_sequence('finding_reference_items','id'), COALESCE((SELECT MAX(id) FROM finding_reference_items), 1), true)",
-    ]
-    for sql in sequence_sync_sql:
-        connection.execute(text(sql))
\ No newline at end of file
+    for table_name in ("finding_resources", "security_findings", "finding_reference_items"):
+        connection.execute(
+            text(
+                f"SELECT setval(pg_get_serial_sequence('{table_name}','id'), "
+                f"COALESCE((SELECT MAX(id) FROM {table_name}), 1), true)"
+            )
+        )
\ No newline at end of file
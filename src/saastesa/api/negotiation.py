@@ -0,0 +1,62 @@
+from collections.abc import Callable, Coroutine, Sequence
+from typing import Annotated, Any
+
+from fastapi import Header, HTTPException, Request, Response
+from fastapi.routing import APIRoute
+from pydantic import BaseModel
+from starlette.types import Scope
+
+from saastesa.wire import (
+    JSON_MEDIA_TYPE,
+    MSGPACK_MEDIA_TYPE,
+    WireFormat,
+    accepts_msgpack,
+    is_msgpack,
+    msgpack_available,
+    packb,
+    unpackb,
+)
+
+
+class MessagePackRequest(Request):
+    async def json(self) -> Any:
+        if not hasattr(self, "_json"):
+            self._json = unpackb(await self.body())
+        return self._json
+
+
+class MessagePackRoute(APIRoute):
+    def get_route_handler(self) -> Callable[[Request], Coroutine[Any, Any, Response]]:
+        handler = super().get_route_handler()
+
+        async def route_handler(request: Request) -> Response:
+            if is_msgpack(request.headers.get("content-type")):
+                if not msgpack_available():
+                    raise HTTPException(
+                        status_code=415, detail="MessagePack bodies are not supported here."
+                    )
+                request = MessagePackRequest(_as_json(request.scope), request.receive)
+            return await handler(request)
+
+        return route_handler
+
+
+def response_format(accept: Annotated[str | None, Header()] = None) -> WireFormat:
+    return "msgpack" if accepts_msgpack(accept) and msgpack_available() else "json"
+
+
+def negotiated(
+    wire_format: WireFormat, content: BaseModel | Sequence[BaseModel], exclude_unset: bool = False
+) -> Response | None:
+    if wire_format != "msgpack":
+        return None
+    if isinstance(content, BaseModel):
+        payload: Any = content.model_dump(exclude_unset=exclude_unset)
+    else:
+        payload = [item.model_dump(exclude_unset=exclude_unset) for item in content]
+    return Response(packb(payload), media_type=MSGPACK_MEDIA_TYPE)
+
+
+def _as_json(scope: Scope) -> Scope:
+    headers = [(name, value) for name, value in scope["headers"] if name != b"content-type"]
+    return {**scope, "headers": [*headers, (b"content-type", JSON_MEDIA_TYPE.encode())]}
@@ -0,0 +1,91 @@
+import logging
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any
+
+from saastesa.logging import log_event
+
+PROFILE_HEADER = "X-TESA-Profile"
+
+slow_query_logger = logging.getLogger("saastesa.sql.slow")
+
+
+@dataclass
+class QueryProfile:
+    slow_query_seconds: float
+    request: str = ""
+    statements: int = 0
+    db_seconds: float = 0.0
+    _started: list[float] = field(default_factory=list, repr=False)
+
+    def server_timing(self, total_seconds: float | None = None) -> str:
+        entries = [f'db;dur={self.db_seconds * 1000:.2f};desc="{self.statements} statements"']
+        if total_seconds is not None:
+            entries.append(f"app;dur={total_seconds * 1000:.2f}")
+        return ", ".join(entries)
+
+
+_active_profile: ContextVar[QueryProfile | None] = ContextVar(
+    "saastesa_query_profile", default=None
+)
+
+
+@contextmanager
+def profile_queries(slow_query_ms: float = 100.0, request: str = "") -> Iterator[QueryProfile]:
+    profile = QueryProfile(slow_query_seconds=slow_query_ms / 1000, request=request)
+    token = _active_profile.set(profile)
+    try:
+        yield profile
+    finally:
+        _active_profile.reset(token)
+
+
+def install_query_profiler(engine: Any) -> None:
+    from sqlalchemy import event
+
+    if not event.contains(engine, "before_cursor_execute", _before_cursor_execute):
+        event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+        event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+
+
+def profiling_requested(header_value: str | None, always: bool) -> bool:
+    if always:
+        return True
+    return (header_value or "").strip().lower() in {"1", "true", "yes", "on"}
+
+
+def _before_cursor_execute(*_: Any) -> None:
+    profile = _active_profile.get()
+    if profile is not None:
+        profile._started.append(time.perf_counter())
+
+
+def _after_cursor_execute(
+    _connection: Any,
+    _cursor: Any,
+    statement: str,
+    parameters: Any,
+    _context: Any,
+    executemany: bool,
+) -> None:
+    profile = _active_profile.get()
+    if profile is None or not profile._started:
+        return
+
+    elapsed = time.perf_counter() - profile._started.pop()
+    profile.statements += 1
+    profile.db_seconds += elapsed
+    if elapsed >= profile.slow_query_seconds:
+        log_event(
+            slow_query_logger,
+            "slow_query",
+            level=logging.WARNING,
+            request=profile.request,
+            duration_ms=round(elapsed * 1000, 3),
+            statement=" ".join(statement.split()),
+            executemany=executemany,
+            parameter_sets=len(parameters) if executemany else 1,
+        )
@@ -0,0 +1,41 @@
+from dataclasses import fields
+
+from saastesa.core.models import SecurityFinding
+
+FINDING_FIELDS = tuple(field.name for field in fields(SecurityFinding))
+FINDING_FACETS = ("domain", "severity", "status", "source", "resource.platform")
+
+
+class UnknownFieldError(ValueError):
+    pass
+
+
+class UnknownFacetError(ValueError):
+    pass
+
+
+def parse_fields(value: str | None) -> tuple[str, ...] | None:
+    if value is None or not value.strip():
+        return None
+
+    requested = {name.strip() for name in value.split(",") if name.strip()}
+    unknown = sorted(requested.difference(FINDING_FIELDS))
+    if unknown:
+        raise UnknownFieldError(
+            f"Unknown finding fields: {', '.join(unknown)}. "
+            f"Choose from {', '.join(FINDING_FIELDS)}."
+        )
+    return tuple(name for name in FINDING_FIELDS if name in requested or name == "finding_uid")
+
+
+def parse_facets(value: str | None) -> tuple[str, ...]:
+    if value is None or not value.strip():
+        return FINDING_FACETS
+
+    requested = {name.strip() for name in value.split(",") if name.strip()}
+    unknown = sorted(requested.difference(FINDING_FACETS))
+    if unknown:
+        raise UnknownFacetError(
+            f"Unknown facets: {', '.join(unknown)}. Choose from {', '.join(FINDING_FACETS)}."
+        )
+    return tuple(name for name in FINDING_FACETS if name in requested)
@@ -0,0 +1,35 @@
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+READ_YOUR_WRITES_COOKIE = "tesa_primary_until"
+
+_primary_reads: ContextVar[bool] = ContextVar("saastesa_primary_reads", default=False)
+
+
+def reads_use_primary() -> bool:
+    return _primary_reads.get()
+
+
+@contextmanager
+def primary_reads(enabled: bool = True) -> Iterator[None]:
+    token = _primary_reads.set(enabled)
+    try:
+        yield
+    finally:
+        _primary_reads.reset(token)
+
+
+def sticky_until(window_seconds: float, now: float | None = None) -> str:
+    return f"{(now if now is not None else time.time()) + window_seconds:.3f}"
+
+
+def is_sticky(cookie_value: str | None, now: float | None = None) -> bool:
+    if not cookie_value:
+        return False
+    try:
+        expires_at = float(cookie_value)
+    except ValueError:
+        return False
+    return expires_at > (now if now is not None else time.time())
@@ -1,26 +1,101 @@
-from collections.abc import Iterable
-from datetime import datetime
+from collections.abc import Collection, Iterable, Iterator, Sequence
+from datetime import UTC, datetime
+from enum import StrEnum
+from itertools import count
 from threading import Lock
-from typing import cast
+from typing import Any, cast
 
-from sqlalchemy import Engine, select
-from sqlalchemy.orm import Session, selectinload
+from sqlalchemy import (
+    ColumnElement,
+    Engine,
+    Row,
+    Select,
+    String,
+    Text,
+    case,
+    func,
+    literal,
+    select,
+    tuple_,
+    union_all,
+)
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session, selectinload, undefer
 
+from saastesa.api.cache import FindingCache, RowStamp
 from saastesa.api.db_models import (
     Base,
     FindingReferenceItemRecord,
     FindingResourceRecord,
     SecurityFindingRecord,
 )
-from saastesa.api.migrations import migrate_schema
+from saastesa.api.filters import NO_FILTERS, FindingFilters, finding_filter_clauses
+from saastesa.api.migrations import ensure_schema_current
+from saastesa.api.replicas import reads_use_primary
+from saastesa.api.search import (
+    SearchCursor,
+    SearchDocument,
+    index_for_search,
+    ranked_matches,
+    search_terms,
+)
+from saastesa.api.tenancy import default_tenant_id
 from saastesa.core.contracts import (
     CURRENT_FINDING_SCHEMA_VERSION,
+    FindingDomain,
     FindingReferenceType,
     FindingSchemaVersion,
+    FindingSeverity,
+    FindingStatus,
     JSONValue,
 )
 from saastesa.core.models import FindingReferences, FindingResource, SecurityFinding
-from saastesa.core.risk_scoring import summarize_scores
+from saastesa.core.risk_scoring import (
+    RISK_BUCKET_CEILINGS,
+    RISK_BUCKETS,
+    finding_fingerprint,
+    summarize_scores,
+)
+from saastesa.metrics import record_cache_lookup, stage_timer
+from saastesa.pipelines.ingest import chunked
+
+_ADD_ATTEMPTS = 3
+_WRITE_VERSIONS = count(1)
+_HYDRATE_CHUNK_SIZE = 500
+_SUMMARY_WINDOW = 100000
+_NO_REFERENCES = FindingReferences(cve=(), cwe=(), owasp=(), mitre_attack=())
+_PROJECTED_COLUMNS: dict[str, Any] = {
+    name: getattr(SecurityFindingRecord, name)
+    for name in (
+        "finding_uid",
+        "standard",
+        "status",
+        "severity_id",
+        "severity",
+        "risk_score",
+        "title",
+        "description",
+        "category_name",
+        "class_name",
+        "type_name",
+        "domain",
+        "activity_name",
+        "time",
+        "source",
+        "raw_data",
+        "occurrence_count",
+        "last_seen",
+    )
+}
+
+
+_FACET_COLUMNS: dict[str, tuple[Any, type[StrEnum] | None]] = {
+    "domain": (SecurityFindingRecord.domain, FindingDomain),
+    "severity": (SecurityFindingRecord.severity, FindingSeverity),
+    "status": (SecurityFindingRecord.status, FindingStatus),
+    "source": (SecurityFindingRecord.source, None),
+    "resource.platform": (FindingResourceRecord.platform, None),
+}
 
 
 class InMemoryFindingStore:
@@ -44,41 +119,288 @@ class InMemoryFindingStore:
 
 
 class SQLAlchemyFindingStore:
-    def __init__(self, engine: Engine) -> None:
+    def __init__(
+        self,
+        engine: Engine,
+        read_engine: Engine | None = None,
+        tenant_id: str | None = None,
+        cache: FindingCache | None = None,
+    ) -> None:
         self.engine = engine
+        self.read_engine = read_engine or engine
+        self.tenant_id = tenant_id or default_tenant_id()
+        self.cache = cache
+        self.write_version = next(_WRITE_VERSIONS)
+
+    @property
+    def has_replica(self) -> bool:
+        return self.read_engine is not self.engine
+
+    def reader(self) -> Engine:
+        if reads_use_primary():
+            return self.engine
+        return self.read_engine
+
+    def _scope(self, filters: FindingFilters) -> list[ColumnElement[bool]]:
+        return [
+            SecurityFindingRecord.tenant_id == self.tenant_id,
+            *finding_filter_clauses(filters, self.reader().dialect.name),
+        ]
 
-    def init(self) -> None:
-        migrate_schema(self.engine)
+    def init(self, auto_migrate: bool = True) -> None:
+        ensure_schema_current(self.engine, auto_migrate=auto_migrate)
 
     def add(self, findings: list[SecurityFinding]) -> None:
         if not findings:
             return
 
+        for attempt in range(_ADD_ATTEMPTS):
+            try:
+                self._add_batch(findings)
+                break
+            except IntegrityError:
+                if attempt == _ADD_ATTEMPTS - 1:
+                    raise
+        self.write_version = next(_WRITE_VERSIONS)
+        if self.cache is not None:
+            self.cache.invalidate(self.tenant_id, (finding.finding_uid for finding in findings))
+
+    def _add_batch(self, findings: list[SecurityFinding]) -> None:
         with Session(self.engine) as session:
+            written: dict[str, tuple[SecurityFindingRecord, SecurityFinding]] = {}
             for finding in findings:
-                resource = self._get_or_create_resource(session, finding.resource)
-                existing = session.scalar(
-                    select(SecurityFindingRecord).where(SecurityFindingRecord.finding_uid == finding.finding_uid)
+                with stage_timer("resolve"):
+                    resource = self._get_or_create_resource(session, finding.resource)
+                with stage_timer("upsert"):
+                    existing = session.scalar(
+                        select(SecurityFindingRecord).where(
+                            SecurityFindingRecord.tenant_id == self.tenant_id,
+                            SecurityFindingRecord.finding_uid == finding.finding_uid,
+                        )
+                    )
+                    if existing is None:
+                        record = self._to_record(finding, resource)
+                        self._set_reference_items(record, finding.references)
+                        session.add(record)
+                    else:
+                        record = existing
+                        self._update_record(record, finding, resource)
+                written[finding.finding_uid] = (record, finding)
+            with stage_timer("index"):
+                session.flush()
+                documents: list[SearchDocument] = [
+                    (record.id, finding.title, finding.description, finding.type_name)
+                    for record, finding in written.values()
+                ]
+                index_for_search(session, self.engine.dialect.name, documents)
+            with stage_timer("commit"):
+                session.commit()
+
+    def get(self, finding_uid: str) -> SecurityFinding | None:
+        with stage_timer("query"), Session(self.reader()) as session:
+            record = session.scalar(
+                self._hydrating_query().where(
+                    SecurityFindingRecord.tenant_id == self.tenant_id,
+                    SecurityFindingRecord.finding_uid == finding_uid,
                 )
-                if existing is None:
-                    record = self._to_record(finding, resource)
-                    self._set_reference_items(record, finding.references)
-                    session.add(record)
-                else:
-                    self._update_record(existing, finding, resource)
-            session.commit()
+            )
+            return self._from_record(record) if record is not None else None
 
-    def list(self, limit: int = 100) -> list[SecurityFinding]:
+    def list_fields(
+        self, fields: Sequence[str], limit: int = 100, filters: FindingFilters = NO_FILTERS
+    ) -> list[dict[str, Any]]:
         if limit <= 0:
             return []
 
-        with Session(self.engine) as session:
-            rows = session.scalars(
-                select(SecurityFindingRecord)
-                .options(
-                    selectinload(SecurityFindingRecord.resource),
-                    selectinload(SecurityFindingRecord.reference_items),
+        query, scalar_fields = self._projected_query(fields, filters)
+        with stage_timer("query"), Session(self.reader()) as session:
+            rows = session.execute(
+                query.order_by(SecurityFindingRecord.time.desc(), SecurityFindingRecord.id.desc())
+                .limit(limit)
+            ).all()
+            return self._projected_rows(session, rows[::-1], scalar_fields, fields)
+
+    def iter_fields(
+        self,
+        fields: Sequence[str],
+        batch_size: int = 10000,
+        filters: FindingFilters = NO_FILTERS,
+        raw_data_as_text: bool = False,
+    ) -> Iterator[list[dict[str, Any]]]:
+        query, scalar_fields = self._projected_query(fields, filters, raw_data_as_text)
+        with Session(self.reader()) as session:
+            result = session.execute(
+                query.order_by(SecurityFindingRecord.id).execution_options(
+                    yield_per=max(batch_size, 1)
+                )
+            )
+            for rows in result.partitions():
+                yield self._projected_rows(session, rows, scalar_fields, fields)
+
+    def _projected_query(
+        self, fields: Sequence[str], filters: FindingFilters, raw_data_as_text: bool = False
+    ) -> tuple[Select[Any], list[str]]:
+        scalar_fields = [name for name in fields if name in _PROJECTED_COLUMNS]
+        columns = [_PROJECTED_COLUMNS[name] for name in scalar_fields]
+        if raw_data_as_text and "raw_data" in scalar_fields:
+            columns[scalar_fields.index("raw_data")] = SecurityFindingRecord.raw_data.cast(
+                Text
+            ).label("raw_data")
+        query = select(SecurityFindingRecord.id, *columns)
+        if "resource" in fields:
+            query = query.join(SecurityFindingRecord.resource).add_columns(
+                FindingResourceRecord.uid,
+                FindingResourceRecord.name,
+                FindingResourceRecord.type,
+                FindingResourceRecord.platform,
+            )
+        return query.where(*self._scope(filters)), scalar_fields
+
+    def _projected_rows(
+        self,
+        session: Session,
+        rows: Sequence[Row[Any]],
+        scalar_fields: Sequence[str],
+        fields: Sequence[str],
+    ) -> list[dict[str, Any]]:
+        references = (
+            self._references_by_finding(session, [row[0] for row in rows])
+            if "references" in fields
+            else {}
+        )
+        projected: list[dict[str, Any]] = []
+        for row in rows:
+            values = dict(zip(scalar_fields, row[1 : len(scalar_fields) + 1], strict=True))
+            if "occurrence_count" in values:
+                values["occurrence_count"] = values["occurrence_count"] or 1
+            if "raw_data" in values and not isinstance(values["raw_data"], str):
+                values["raw_data"] = dict(values["raw_data"] or {})
+            if "schema_version" in fields:
+                values["schema_version"] = CURRENT_FINDING_SCHEMA_VERSION
+            if "resource" in fields:
+                uid, name, resource_type, platform = row[len(scalar_fields) + 1 :]
+                values["resource"] = FindingResource(uid, name, resource_type, platform)
+            if "references" in fields:
+                values["references"] = references.get(row[0], _NO_REFERENCES)
+            projected.append(values)
+        return projected
+
+    def _references_by_finding(
+        self, session: Session, finding_ids: Sequence[int]
+    ) -> dict[int, FindingReferences]:
+        grouped: dict[int, dict[FindingReferenceType, list[str]]] = {}
+        for chunk in chunked(finding_ids, _HYDRATE_CHUNK_SIZE):
+            items = session.execute(
+                select(
+                    FindingReferenceItemRecord.finding_id,
+                    FindingReferenceItemRecord.reference_type,
+                    FindingReferenceItemRecord.reference_value,
+                )
+                .where(FindingReferenceItemRecord.finding_id.in_(chunk))
+                .order_by(FindingReferenceItemRecord.id)
+            )
+            for finding_id, reference_type, reference_value in items:
+                by_type = grouped.setdefault(finding_id, {})
+                by_type.setdefault(reference_type, []).append(reference_value)
+        return {
+            finding_id: _references_from_items(by_type) for finding_id, by_type in grouped.items()
+        }
+
+    def _list_cached(
+        self, cache: FindingCache, limit: int, filters: FindingFilters
+    ) -> list[SecurityFinding]:
+        with stage_timer("query"), Session(self.reader()) as session:
+            rows = session.execute(
+                select(
+                    SecurityFindingRecord.id,
+                    SecurityFindingRecord.finding_uid,
+                    SecurityFindingRecord.row_version,
+                )
+                .where(*self._scope(filters))
+                .order_by(SecurityFindingRecord.time.desc(), SecurityFindingRecord.id.desc())
+                .limit(limit)
+            ).all()
+            stamps = {finding_uid: (row_id, version) for row_id, finding_uid, version in rows}
+            findings = cache.lookup(self.tenant_id, stamps)
+            missing_ids = [row_id for row_id, finding_uid, _ in rows if finding_uid not in findings]
+            hydrated: list[tuple[RowStamp, SecurityFinding]] = []
+            for chunk in chunked(missing_ids, _HYDRATE_CHUNK_SIZE):
+                for record in session.scalars(
+                    self._hydrating_query().where(SecurityFindingRecord.id.in_(chunk))
+                ):
+                    stamp = (record.id, record.row_version)
+                    hydrated.append((stamp, self._from_record(record)))
+
+        record_cache_lookup("findings", True, len(rows) - len(missing_ids))
+        record_cache_lookup("findings", False, len(missing_ids))
+        cache.store(self.tenant_id, hydrated)
+        findings.update((finding.finding_uid, finding) for _, finding in hydrated)
+        ordered = [findings[finding_uid] for _, finding_uid, _ in rows if finding_uid in findings]
+        ordered.reverse()
+        return ordered
+
+    def _hydrating_query(self) -> Select[SecurityFindingRecord]:
+        return select(SecurityFindingRecord).options(
+            undefer(SecurityFindingRecord.description),
+            undefer(SecurityFindingRecord.raw_data),
+            selectinload(SecurityFindingRecord.resource),
+            selectinload(SecurityFindingRecord.reference_items),
+        )
+
+    def search(
+        self,
+        query: str,
+        limit: int = 20,
+        cursor: SearchCursor | None = None,
+        filters: FindingFilters = NO_FILTERS,
+    ) -> tuple[list[SecurityFinding], SearchCursor | None]:
+        terms = search_terms(query)
+        if limit <= 0 or not terms:
+            return [], None
+
+        reader = self.reader()
+        ranked = ranked_matches(terms, reader.dialect.name)
+        statement = (
+            select(ranked.c.finding_id, ranked.c.score)
+            .join(SecurityFindingRecord, SecurityFindingRecord.id == ranked.c.finding_id)
+            .where(*self._scope(filters))
+            .order_by(ranked.c.score.desc(), ranked.c.finding_id.desc())
+            .limit(limit + 1)
+        )
+        if cursor is not None:
+            statement = statement.where(
+                tuple_(ranked.c.score, ranked.c.finding_id)
+                < tuple_(cursor.score, cursor.finding_id)
+            )
+
+        with stage_timer("query"), Session(reader) as session:
+            rows = session.execute(statement).all()
+            page = rows[:limit]
+            records = {
+                record.id: record
+                for record in session.scalars(
+                    self._hydrating_query().where(
+                        SecurityFindingRecord.id.in_([row.finding_id for row in page])
+                    )
                 )
+            }
+            findings = [self._from_record(records[row.finding_id]) for row in page]
+
+        next_cursor = None
+        if len(rows) > limit:
+            next_cursor = SearchCursor(float(page[-1].score), page[-1].finding_id)
+        return findings, next_cursor
+
+    def list(self, limit: int = 100, filters: FindingFilters = NO_FILTERS) -> list[SecurityFinding]:
+        if limit <= 0:
+            return []
+        if self.cache is not None and self.cache.max_entries > 0:
+            return self._list_cached(self.cache, limit, filters)
+
+        with stage_timer("query"), Session(self.reader()) as session:
+            rows = session.scalars(
+                self._hydrating_query()
+                .where(*self._scope(filters))
                 .order_by(SecurityFindingRecord.time.desc(), SecurityFindingRecord.id.desc())
                 .limit(limit)
             ).all()
@@ -87,13 +409,180 @@ class SQLAlchemyFindingStore:
         findings.reverse()
         return findings
 
-    def summary(self) -> dict[str, int]:
-        return summarize_scores(self.list(limit=100000))
+    def summary(self, filters: FindingFilters = NO_FILTERS) -> dict[str, int]:
+        with stage_timer("query"), Session(self.reader()) as session:
+            return self._summary_buckets(session, filters)
+
+    def facets(
+        self, facets: Sequence[str], filters: FindingFilters = NO_FILTERS
+    ) -> dict[str, dict[str, int]]:
+        with stage_timer("query"), Session(self.reader()) as session:
+            return self._facet_counts(session, facets, filters)
+
+    def dashboard(
+        self,
+        recent_fields: Sequence[str],
+        recent_limit: int = 100,
+        top_resources: int = 10,
+        facets: Sequence[str] = ("domain", "severity"),
+        filters: FindingFilters = NO_FILTERS,
+    ) -> dict[str, Any]:
+        reader = self.reader()
+        with stage_timer("query"), Session(reader) as session:
+            if reader.dialect.name == "postgresql":
+                session.connection(
+                    execution_options={
+                        "isolation_level": "REPEATABLE READ",
+                        "postgresql_readonly": True,
+                    }
+                )
+            summary = self._summary_buckets(session, filters)
+            facet_counts = self._facet_counts(session, facets, filters)
+            query, scalar_fields = self._projected_query(recent_fields, filters)
+            rows = session.execute(
+                query.order_by(SecurityFindingRecord.time.desc(), SecurityFindingRecord.id.desc())
+                .limit(max(recent_limit, 0))
+            ).all()
+            recent = self._projected_rows(session, rows[::-1], scalar_fields, recent_fields)
+            resources = self._top_resources(session, top_resources, filters)
+        return {
+            "summary": summary,
+            "facets": facet_counts,
+            "recent": recent,
+            "top_resources": resources,
+        }
+
+    def _summary_buckets(self, session: Session, filters: FindingFilters) -> dict[str, int]:
+        window = (
+            select(SecurityFindingRecord.risk_score)
+            .where(*self._scope(filters))
+            .order_by(SecurityFindingRecord.time.desc(), SecurityFindingRecord.id.desc())
+            .limit(_SUMMARY_WINDOW)
+            .subquery()
+        )
+        bucket = case(
+            *((window.c.risk_score <= ceiling, name) for name, ceiling in RISK_BUCKET_CEILINGS),
+            else_=RISK_BUCKETS[-1],
+        )
+        counts = dict.fromkeys(RISK_BUCKETS, 0)
+        for name, total in session.execute(select(bucket, func.count()).group_by(bucket)):
+            counts[name] = total
+        return counts
+
+    def _facet_counts(
+        self, session: Session, facets: Sequence[str], filters: FindingFilters
+    ) -> dict[str, dict[str, int]]:
+        counts: dict[str, dict[str, int]] = {facet: {} for facet in facets}
+        if not facets:
+            return counts
+
+        columns = [_FACET_COLUMNS[facet][0] for facet in facets]
+        joins_resource = "resource.platform" in facets
+        if session.get_bind().dialect.name == "postgresql":
+            statement = select(
+                *(func.grouping(column) for column in columns),
+                *(column.cast(String) for column in columns),
+                func.count(),
+            ).group_by(func.grouping_sets(*columns))
+            rows = []
+            for row in session.execute(self._faceted(statement, joins_resource, filters)):
+                position = row[: len(facets)].index(0)
+                rows.append((facets[position], row[len(facets) + position], row[-1]))
+        else:
+            rows = list(
+                session.execute(
+                    union_all(
+                        *(
+                            self._faceted(
+                                select(
+                                    literal(facet).label("facet"),
+                                    column.cast(String).label("value"),
+                                    func.count().label("count"),
+                                ).group_by(column),
+                                facet == "resource.platform",
+                                filters,
+                            )
+                            for facet, column in zip(facets, columns, strict=True)
+                        )
+                    )
+                )
+            )
+        for facet, value, total in rows:
+            enum_type = _FACET_COLUMNS[facet][1]
+            counts[facet][enum_type[value].value if enum_type else value] = total
+        return counts
+
+    def _faceted(
+        self, statement: Select[Any], joins_resource: bool, filters: FindingFilters
+    ) -> Select[Any]:
+        statement = statement.select_from(SecurityFindingRecord)
+        if joins_resource:
+            statement = statement.join(SecurityFindingRecord.resource)
+        return statement.where(*self._scope(filters))
+
+    def _top_resources(
+        self, session: Session, limit: int, filters: FindingFilters
+    ) -> Sequence[dict[str, Any]]:
+        if limit <= 0:
+            return []
+        max_risk = func.max(SecurityFindingRecord.risk_score)
+        findings = func.count(SecurityFindingRecord.id)
+        rows = session.execute(
+            select(
+                FindingResourceRecord.uid,
+                FindingResourceRecord.name,
+                FindingResourceRecord.type,
+                FindingResourceRecord.platform,
+                findings,
+                max_risk,
+            )
+            .join(SecurityFindingRecord.resource)
+            .where(*self._scope(filters))
+            .group_by(
+                FindingResourceRecord.id,
+                FindingResourceRecord.uid,
+                FindingResourceRecord.name,
+                FindingResourceRecord.type,
+                FindingResourceRecord.platform,
+            )
+            .order_by(max_risk.desc(), findings.desc(), FindingResourceRecord.uid)
+            .limit(limit)
+        )
+        return [
+            {
+                "resource": FindingResource(uid, name, resource_type, platform),
+                "findings": count,
+                "max_risk_score": risk_score,
+            }
+            for uid, name, resource_type, platform, count, risk_score in rows
+        ]
+
+    def find_recent_by_fingerprints(
+        self, fingerprints: Collection[str], since: datetime
+    ) -> dict[str, tuple[str, datetime]]:
+        last_seen = func.coalesce(SecurityFindingRecord.last_seen, SecurityFindingRecord.time)
+        recent: dict[str, tuple[str, datetime]] = {}
+        with Session(self.engine) as session:
+            rows = session.execute(
+                select(
+                    SecurityFindingRecord.fingerprint, SecurityFindingRecord.finding_uid, last_seen
+                )
+                .where(
+                    SecurityFindingRecord.tenant_id == self.tenant_id,
+                    SecurityFindingRecord.fingerprint.in_(sorted(fingerprints)),
+                    last_seen >= since,
+                )
+                .order_by(SecurityFindingRecord.id.desc())
+            )
+            for fingerprint, finding_uid, seen_at in rows:
+                recent.setdefault(cast(str, fingerprint), (finding_uid, seen_at))
+        return recent
 
     def _to_record(
         self, finding: SecurityFinding, resource: FindingResourceRecord
     ) -> SecurityFindingRecord:
         return SecurityFindingRecord(
+            tenant_id=self.tenant_id,
             finding_uid=finding.finding_uid,
             standard=finding.standard,
             schema_version=finding.schema_version,
@@ -110,6 +599,9 @@ class SQLAlchemyFindingStore:
             activity_name=finding.activity_name,
             time=finding.time,
             source=finding.source,
+            fingerprint=finding_fingerprint(finding),
+            last_seen=finding.last_seen or finding.time,
+            occurrence_count=finding.occurrence_count,
             resource=resource,
             raw_data=cast(dict[str, object], finding.raw_data),
         )
@@ -133,21 +625,28 @@ class SQLAlchemyFindingStore:
         record.type_name = finding.type_name
         record.domain = finding.domain
         record.activity_name = finding.activity_name
-        record.time = finding.time
         record.source = finding.source
+        record.fingerprint = finding_fingerprint(finding)
+        self._record_sighting(record, finding)
+        record.row_version = SecurityFindingRecord.row_version + 1
         record.resource = resource
         self._set_reference_items(record, finding.references)
         record.raw_data = cast(dict[str, object], finding.raw_data)
 
+    def _record_sighting(self, record: SecurityFindingRecord, finding: SecurityFinding) -> None:
+        seen = finding.last_seen or finding.time
+        last_seen = record.last_seen or record.time
+        occurrences = record.occurrence_count or 1
+        if _as_utc(seen) > _as_utc(last_seen):
+            record.last_seen = seen
+            record.occurrence_count = occurrences + finding.occurrence_count
+        else:
+            record.occurrence_count = max(occurrences, finding.occurrence_count)
+
     def _from_record(self, record: SecurityFindingRecord) -> SecurityFinding:
-        references_by_type: dict[FindingReferenceType, list[str]] = {
-            FindingReferenceType.CVE: [],
-            FindingReferenceType.CWE: [],
-            FindingReferenceType.OWASP: [],
-            FindingReferenceType.MITRE_ATTACK: [],
-        }
+        references_by_type: dict[FindingReferenceType, list[str]] = {}
         for item in record.reference_items:
-            references_by_type[item.reference_type].append(item.reference_value)
+            references_by_type.setdefault(item.reference_type, []).append(item.reference_value)
 
         resource = record.resource
         return SecurityFinding(
@@ -173,13 +672,10 @@ class SQLAlchemyFindingStore:
                 type=resource.type,
                 platform=resource.platform,
             ),
-            references=FindingReferences(
-                cve=tuple(references_by_type[FindingReferenceType.CVE]),
-                cwe=tuple(references_by_type[FindingReferenceType.CWE]),
-                owasp=tuple(references_by_type[FindingReferenceType.OWASP]),
-                mitre_attack=tuple(references_by_type[FindingReferenceType.MITRE_ATTACK]),
-            ),
+            references=_references_from_items(references_by_type),
             raw_data=cast(dict[str, JSONValue], dict(record.raw_data or {})),
+            occurrence_count=record.occurrence_count or 1,
+            last_seen=_ensure_datetime(record.last_seen) if record.last_seen else None,
         )
 
     def _get_or_create_resource(
@@ -215,12 +711,31 @@ class SQLAlchemyFindingStore:
             FindingReferenceType.OWASP: references.owasp,
             FindingReferenceType.MITRE_ATTACK: references.mitre_attack,
         }
+        existing_items = {
+            (item.reference_type, item.reference_value): item for item in record.reference_items
+        }
         record.reference_items = [
-            FindingReferenceItemRecord(reference_type=reference_type, reference_value=value)
+            existing_items.get((reference_type, value))
+            or FindingReferenceItemRecord(reference_type=reference_type, reference_value=value)
             for reference_type, values in items_by_type.items()
             for value in sorted(set(values))
         ]
 
 
+def _references_from_items(by_type: dict[FindingReferenceType, list[str]]) -> FindingReferences:
+    return FindingReferences(
+        cve=tuple(by_type.get(FindingReferenceType.CVE, ())),
+        cwe=tuple(by_type.get(FindingReferenceType.CWE, ())),
+        owasp=tuple(by_type.get(FindingReferenceType.OWASP, ())),
+        mitre_attack=tuple(by_type.get(FindingReferenceType.MITRE_ATTACK, ())),
+    )
+
+
 def _ensure_datetime(value: datetime) -> datetime:
     return value
+
+
+def _as_utc(value: datetime) -> datetime:
+    if value.tzinfo is None:
+        return value.replace(tzinfo=UTC)
+    return value.astimezone(UTC)
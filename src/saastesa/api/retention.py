@@ -0,0 +1,310 @@
+import logging
+import os
+import re
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta
+from threading import Event, Thread
+from typing import Any
+
+from sqlalchemy import Engine, delete, exists, func, select, text
+from sqlalchemy.exc import IntegrityError
+
+from saastesa.api.db_models import (
+    FindingReferenceItemRecord,
+    FindingResourceRecord,
+    SecurityFindingRecord,
+)
+from saastesa.api.search import remove_from_search_index
+from saastesa.core.contracts import FindingDomain, FindingStatus
+
+logger = logging.getLogger(__name__)
+
+RETENTION_LOCK_KEY = 7_400_002
+_PARTITION_NAME = re.compile(r"^security_findings_p(\d{4})(\d{2})$")
+
+
+@dataclass(frozen=True)
+class RetentionPolicy:
+    max_age_days: int
+    statuses: tuple[FindingStatus, ...] = ()
+    domains: tuple[FindingDomain, ...] = ()
+    batch_size: int = 1000
+
+    @property
+    def filtered(self) -> bool:
+        return bool(self.statuses or self.domains)
+
+    def cutoff(self, now: datetime | None = None) -> datetime:
+        return (now or datetime.now(tz=UTC)) - timedelta(days=self.max_age_days)
+
+
+def load_retention_policy() -> RetentionPolicy | None:
+    max_age_days = int(os.getenv("TESA_RETENTION_DAYS", "0") or 0)
+    if max_age_days <= 0:
+        return None
+
+    return RetentionPolicy(
+        max_age_days=max_age_days,
+        statuses=tuple(FindingStatus(value) for value in _split_env("TESA_RETENTION_STATUSES")),
+        domains=tuple(FindingDomain(value) for value in _split_env("TESA_RETENTION_DOMAINS")),
+        batch_size=max(int(os.getenv("TESA_RETENTION_BATCH_SIZE", "1000")), 1),
+    )
+
+
+def prune_findings(
+    engine: Engine,
+    policy: RetentionPolicy,
+    now: datetime | None = None,
+    max_batches: int | None = None,
+) -> int:
+    cutoff = policy.cutoff(now)
+    deleted = 0
+
+    if engine.dialect.name == "postgresql" and not policy.filtered:
+        with engine.begin() as connection:
+            partitioned = is_partitioned(connection)
+        if partitioned:
+            deleted += drop_expired_partitions(engine, cutoff, policy.batch_size)
+
+    with engine.connect() as connection:
+        tenants = list(connection.scalars(select(SecurityFindingRecord.tenant_id).distinct()))
+    for tenant_id in tenants:
+        batches = 0
+        while max_batches is None or batches < max_batches:
+            batch_deleted = _delete_expired_batch(engine, policy, cutoff, tenant_id)
+            if batch_deleted == 0:
+                break
+            deleted += batch_deleted
+            batches += 1
+
+    _delete_orphaned_resources(engine, policy.batch_size)
+    return deleted
+
+
+def _delete_expired_batch(
+    engine: Engine, policy: RetentionPolicy, cutoff: datetime, tenant_id: str
+) -> int:
+    query = select(SecurityFindingRecord.id).where(
+        SecurityFindingRecord.tenant_id == tenant_id,
+        SecurityFindingRecord.time < cutoff,
+        func.coalesce(SecurityFindingRecord.last_seen, SecurityFindingRecord.time) < cutoff,
+    )
+    if policy.statuses:
+        query = query.where(SecurityFindingRecord.status.in_(policy.statuses))
+    if policy.domains:
+        query = query.where(SecurityFindingRecord.domain.in_(policy.domains))
+
+    with engine.begin() as connection:
+        finding_ids = list(
+            connection.scalars(query.order_by(SecurityFindingRecord.id).limit(policy.batch_size))
+        )
+        if not finding_ids:
+            return 0
+        connection.execute(
+            delete(FindingReferenceItemRecord).where(
+                FindingReferenceItemRecord.finding_id.in_(finding_ids)
+            )
+        )
+        connection.execute(
+            delete(SecurityFindingRecord).where(SecurityFindingRecord.id.in_(finding_ids))
+        )
+        remove_from_search_index(connection, engine.dialect.name, finding_ids)
+    return len(finding_ids)
+
+
+def _delete_orphaned_resources(engine: Engine, batch_size: int) -> None:
+    orphaned = ~exists().where(SecurityFindingRecord.resource_id == FindingResourceRecord.id)
+    while True:
+        try:
+            with engine.begin() as connection:
+                resource_ids = list(
+                    connection.scalars(
+                        select(FindingResourceRecord.id).where(orphaned).limit(batch_size)
+                    )
+                )
+                if not resource_ids:
+                    return
+                connection.execute(
+                    delete(FindingResourceRecord).where(
+                        FindingResourceRecord.id.in_(resource_ids), orphaned
+                    )
+                )
+        except IntegrityError:
+            logger.info("Deferred orphaned resource cleanup; a resource was reused mid-batch")
+            return
+
+
+def is_partitioned(connection: Any) -> bool:
+    if connection.dialect.name != "postgresql":
+        return False
+    return bool(
+        connection.scalar(
+            text(
+                "SELECT EXISTS (SELECT 1 FROM pg_partitioned_table pt "
+                "JOIN pg_class c ON c.oid = pt.partrelid WHERE c.relname = 'security_findings')"
+            )
+        )
+    )
+
+
+def ensure_monthly_partitions(
+    engine: Engine, now: datetime | None = None, months_ahead: int = 2
+) -> None:
+    month_start = (now or datetime.now(tz=UTC)).replace(
+        day=1, hour=0, minute=0, second=0, microsecond=0
+    )
+    with engine.begin() as connection:
+        if not is_partitioned(connection):
+            return
+        for _ in range(months_ahead + 1):
+            next_month = _add_month(month_start)
+            connection.execute(
+                text(
+                    f"CREATE TABLE IF NOT EXISTS {_partition_name(month_start)} "
+                    "PARTITION OF security_findings "
+                    f"FOR VALUES FROM ('{month_start.isoformat()}') TO ('{next_month.isoformat()}')"
+                )
+            )
+            month_start = next_month
+
+
+def drop_expired_partitions(engine: Engine, cutoff: datetime, batch_size: int = 1000) -> int:
+    with engine.begin() as connection:
+        partition_names = list(
+            connection.scalars(
+                text(
+                    "SELECT c.relname FROM pg_inherits i "
+                    "JOIN pg_class c ON c.oid = i.inhrelid "
+                    "JOIN pg_class p ON p.oid = i.inhparent "
+                    "WHERE p.relname = 'security_findings' ORDER BY c.relname"
+                )
+            )
+        )
+
+    dropped_rows = 0
+    for partition_name in partition_names:
+        match = _PARTITION_NAME.match(partition_name)
+        if match is None:
+            continue
+        partition_start = datetime(int(match.group(1)), int(match.group(2)), 1, tzinfo=UTC)
+        if _add_month(partition_start) > cutoff or _seen_since(engine, partition_name, cutoff):
+            continue
+
+        _delete_partition_references(engine, partition_name, batch_size)
+        with engine.begin() as connection:
+            dropped_rows += int(
+                connection.scalar(text(f"SELECT COUNT(*) FROM {partition_name}")) or 0
+            )
+            connection.execute(
+                text(f"ALTER TABLE security_findings DETACH PARTITION {partition_name}")
+            )
+            connection.execute(text(f"DROP TABLE {partition_name}"))
+        logger.info("Dropped expired findings partition %s", partition_name)
+    return dropped_rows
+
+
+def _seen_since(engine: Engine, partition_name: str, cutoff: datetime) -> bool:
+    with engine.connect() as connection:
+        return bool(
+            connection.scalar(
+                text(
+                    f"SELECT EXISTS (SELECT 1 FROM {partition_name} "
+                    "WHERE COALESCE(last_seen, time) >= :cutoff)"
+                ),
+                {"cutoff": cutoff},
+            )
+        )
+
+
+def _delete_partition_references(engine: Engine, partition_name: str, batch_size: int) -> None:
+    statement = text(
+        "DELETE FROM finding_reference_items WHERE id IN ("
+        "SELECT r.id FROM finding_reference_items r "
+        f"JOIN {partition_name} f ON f.id = r.finding_id LIMIT :batch_size)"
+    )
+    while True:
+        with engine.begin() as connection:
+            if connection.execute(statement, {"batch_size": batch_size}).rowcount == 0:
+                return
+
+
+class RetentionPruner:
+    def __init__(
+        self, engine: Engine, policy: RetentionPolicy, interval_seconds: float = 3600.0
+    ) -> None:
+        self.engine = engine
+        self.policy = policy
+        self.interval_seconds = interval_seconds
+        self._stopped = Event()
+        self._thread: Thread | None = None
+
+    def start(self) -> None:
+        if self._thread is not None:
+            return
+        self._stopped.clear()
+        self._thread = Thread(target=self._run, name="saastesa-retention", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float | None = None) -> None:
+        self._stopped.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def run_once(self) -> int:
+        with _pruning_lock(self.engine) as leader:
+            if not leader:
+                return 0
+            if self.engine.dialect.name == "postgresql":
+                ensure_monthly_partitions(self.engine)
+            deleted = prune_findings(self.engine, self.policy)
+        if deleted:
+            logger.info("Retention pruned %s findings", deleted)
+        return deleted
+
+    def _run(self) -> None:
+        while not self._stopped.is_set():
+            try:
+                self.run_once()
+            except Exception:  # noqa: BLE001
+                logger.exception("Retention pruning failed")
+            self._stopped.wait(self.interval_seconds)
+
+
+@contextmanager
+def _pruning_lock(engine: Engine) -> Iterator[bool]:
+    if engine.dialect.name != "postgresql":
+        yield True
+        return
+
+    with engine.connect() as connection:
+        leader = bool(
+            connection.scalar(
+                text("SELECT pg_try_advisory_lock(:key)"), {"key": RETENTION_LOCK_KEY}
+            )
+        )
+        connection.commit()
+        try:
+            yield leader
+        finally:
+            if leader:
+                connection.execute(
+                    text("SELECT pg_advisory_unlock(:key)"), {"key": RETENTION_LOCK_KEY}
+                )
+                connection.commit()
+
+
+def _split_env(name: str) -> list[str]:
+    return [value.strip().lower() for value in os.getenv(name, "").split(",") if value.strip()]
+
+
+def _partition_name(month_start: datetime) -> str:
+    return f"security_findings_p{month_start:%Y%m}"
+
+
+def _add_month(month_start: datetime) -> datetime:
+    if month_start.month == 12:
+        return month_start.replace(year=month_start.year + 1, month=1)
+    return month_start.replace(month=month_start.month + 1)
@@ -64,6 +64,8 @@ class SecurityFindingOut(BaseModel):
     resource: FindingResourceOut
     references: FindingReferencesOut
     raw_data: dict[str, JSONValue]
+    occurrence_count: int = Field(default=1, ge=1)
+    last_seen: datetime | None = None
 
 
 class IngestSignalsRequest(BaseModel):
@@ -79,6 +81,32 @@ class IngestSignalsResponse(BaseModel):
     findings: list[SecurityFindingOut]
 
 
+class FindingProjectionOut(BaseModel):
+    model_config = ConfigDict(extra="forbid")
+
+    finding_uid: str
+    standard: FindingStandard | None = None
+    schema_version: FindingSchemaVersion | None = None
+    status: FindingStatus | None = None
+    severity_id: int | None = None
+    severity: FindingSeverity | None = None
+    risk_score: int | None = None
+    title: str | None = None
+    description: str | None = None
+    category_name: str | None = None
+    class_name: FindingClass | None = None
+    type_name: str | None = None
+    domain: FindingDomain | None = None
+    activity_name: FindingActivity | None = None
+    time: datetime | None = None
+    source: str | None = None
+    resource: FindingResourceOut | None = None
+    references: FindingReferencesOut | None = None
+    raw_data: dict[str, JSONValue] | None = None
+    occurrence_count: int | None = None
+    last_seen: datetime | None = None
+
+
 class IngestFindingsRequest(BaseModel):
     model_config = ConfigDict(extra="forbid")
 
@@ -91,6 +119,13 @@ class IngestFindingsResponse(BaseModel):
     ingested: int
 
 
+class FindingSearchOut(BaseModel):
+    model_config = ConfigDict(extra="forbid")
+
+    findings: list[SecurityFindingOut]
+    next_cursor: str | None = None
+
+
 class FindingsSummaryOut(BaseModel):
     model_config = ConfigDict(extra="forbid")
 
@@ -98,3 +133,39 @@ class FindingsSummaryOut(BaseModel):
     medium: int
     high: int
     critical: int
+
+
+class TenantsOut(BaseModel):
+    model_config = ConfigDict(extra="forbid")
+
+    tenants: list[str]
+
+
+class TenantsSummaryOut(BaseModel):
+    model_config = ConfigDict(extra="forbid")
+
+    total: FindingsSummaryOut
+    tenants: dict[str, FindingsSummaryOut]
+
+
+class FindingFacetsOut(BaseModel):
+    model_config = ConfigDict(extra="forbid")
+
+    facets: dict[str, dict[str, int]]
+
+
+class ResourceRiskOut(BaseModel):
+    model_config = ConfigDict(extra="forbid")
+
+    resource: FindingResourceOut
+    findings: int
+    max_risk_score: int
+
+
+class DashboardOut(BaseModel):
+    model_config = ConfigDict(extra="forbid")
+
+    summary: FindingsSummaryOut
+    facets: dict[str, dict[str, int]]
+    recent: list[FindingProjectionOut]
+    top_resources: list[ResourceRiskOut]
@@ -0,0 +1,127 @@
+import json
+import re
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass
+from typing import Any
+
+from sqlalchemy import (
+    Double,
+    Select,
+    String,
+    Subquery,
+    cast,
+    column,
+    delete,
+    func,
+    insert,
+    literal_column,
+    select,
+    table,
+)
+from sqlalchemy.dialects.postgresql import TSVECTOR
+
+from saastesa.api.db_models import (
+    SEARCH_CONFIG,
+    SEARCH_TABLE,
+    SEARCH_VECTOR,
+    SecurityFindingRecord,
+)
+
+MAX_SEARCH_TERMS = 16
+
+_TERM = re.compile(r"\w+")
+_SEARCH_INDEX = table(
+    SEARCH_TABLE, column("rowid"), column("title"), column("description"), column("type_name")
+)
+
+SearchDocument = tuple[int, str, str, str]
+
+
+class InvalidCursorError(ValueError):
+    pass
+
+
+@dataclass(frozen=True)
+class SearchCursor:
+    score: float
+    finding_id: int
+
+    def encode(self) -> str:
+        payload = json.dumps([self.score, self.finding_id], separators=(",", ":"))
+        return urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+    @classmethod
+    def decode(cls, token: str) -> "SearchCursor":
+        try:
+            score, finding_id = json.loads(urlsafe_b64decode(token + "=" * (-len(token) % 4)))
+            return cls(float(score), int(finding_id))
+        except (TypeError, ValueError) as error:
+            raise InvalidCursorError("Invalid search cursor.") from error
+
+
+def search_terms(query: str) -> list[str]:
+    return _TERM.findall(query.lower())[:MAX_SEARCH_TERMS]
+
+
+def ranked_matches(terms: Sequence[str], dialect: str) -> Subquery:
+    if dialect == "postgresql":
+        config = literal_column(f"'{SEARCH_CONFIG}'", String)
+        document = literal_column(
+            f"{SecurityFindingRecord.__tablename__}.{SEARCH_VECTOR}", TSVECTOR
+        )
+        query = func.plainto_tsquery(config, " ".join(terms))
+        return (
+            select(
+                SecurityFindingRecord.id.label("finding_id"),
+                cast(func.ts_rank_cd(document, query), Double).label("score"),
+            )
+            .where(document.op("@@")(query))
+            .subquery("ranked")
+        )
+
+    index = literal_column(SEARCH_TABLE, String)
+    return (
+        select(
+            _SEARCH_INDEX.c.rowid.label("finding_id"), (-func.bm25(index)).label("score")
+        )
+        .where(index.op("MATCH")(" ".join(f'"{term}"' for term in terms)))
+        .subquery("ranked")
+    )
+
+
+def index_for_search(connection: Any, dialect: str, documents: Iterable[SearchDocument]) -> None:
+    if dialect != "sqlite":
+        return
+    rows = list(documents)
+    if rows:
+        remove_from_search_index(connection, dialect, [row[0] for row in rows])
+        connection.execute(
+            insert(_SEARCH_INDEX),
+            [
+                {"rowid": row[0], "title": row[1], "description": row[2], "type_name": row[3]}
+                for row in rows
+            ],
+        )
+
+
+def remove_from_search_index(connection: Any, dialect: str, finding_ids: Sequence[int]) -> None:
+    if dialect == "sqlite" and finding_ids:
+        connection.execute(delete(_SEARCH_INDEX).where(_SEARCH_INDEX.c.rowid.in_(finding_ids)))
+
+
+def reindex_for_search(connection: Any, dialect: str, finding_ids: Select[Any]) -> None:
+    if dialect != "sqlite":
+        return
+    connection.execute(delete(_SEARCH_INDEX).where(_SEARCH_INDEX.c.rowid.in_(finding_ids)))
+    connection.execute(
+        insert(_SEARCH_INDEX).from_select(
+            ["rowid", "title", "description", "type_name"],
+            select(
+                SecurityFindingRecord.id,
+                SecurityFindingRecord.title,
+                SecurityFindingRecord.description,
+                SecurityFindingRecord.type_name,
+            ).where(SecurityFindingRecord.id.in_(finding_ids)),
+        )
+    )
@@ -1,3 +1,4 @@
+from saastesa.api.columnar import ColumnarFindingStore
 from saastesa.api.repository import InMemoryFindingStore, SQLAlchemyFindingStore
 
-__all__ = ["InMemoryFindingStore", "SQLAlchemyFindingStore"]
+__all__ = ["ColumnarFindingStore", "InMemoryFindingStore", "SQLAlchemyFindingStore"]
@@ -0,0 +1,181 @@
+import json
+import os
+import re
+from collections import OrderedDict
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from threading import RLock
+from typing import TYPE_CHECKING, TypeVar
+
+from saastesa.config import load_settings
+from saastesa.core.contracts import DEFAULT_TENANT_ID
+
+if TYPE_CHECKING:
+    from sqlalchemy import Engine
+
+    from saastesa.api.cache import FindingCache
+    from saastesa.api.repository import SQLAlchemyFindingStore
+
+T = TypeVar("T")
+
+TENANT_HEADER = "X-TESA-Organization"
+DEFAULT_FAN_OUT_WORKERS = 8
+DEFAULT_MAX_TENANT_STORES = 1000
+
+_TENANT_ID = re.compile(r"^[a-z0-9][a-z0-9_.-]{0,63}$")
+_INVALID_TENANT_CHARS = re.compile(r"[^a-z0-9_.-]+")
+
+
+class InvalidTenantError(ValueError):
+    pass
+
+
+def normalize_tenant_id(value: str) -> str:
+    tenant_id = value.strip().lower()
+    if not _TENANT_ID.match(tenant_id):
+        raise InvalidTenantError(
+            f"Invalid organization {value!r}; use 1-64 lowercase letters, digits, '.', '_' or '-'."
+        )
+    return tenant_id
+
+
+def default_tenant_id() -> str:
+    organization = _INVALID_TENANT_CHARS.sub("-", load_settings().organization.strip().lower())
+    return organization.strip("-._")[:64] or DEFAULT_TENANT_ID
+
+
+def load_shard_map() -> dict[str, str]:
+    raw = os.getenv("TESA_SHARD_MAP", "").strip()
+    if not raw:
+        return {}
+    parsed = json.loads(raw)
+    if not isinstance(parsed, dict):
+        raise ValueError("TESA_SHARD_MAP must be a JSON object of organization to database URL.")
+    return {normalize_tenant_id(str(tenant)): str(url) for tenant, url in parsed.items()}
+
+
+class TenantStoreRouter:
+    def __init__(
+        self,
+        database_url: str,
+        auto_migrate: bool,
+        read_database_url: str | None = None,
+        shard_map: dict[str, str] | None = None,
+        default_tenant: str | None = None,
+        configure_engine: Callable[["Engine"], None] | None = None,
+        finding_cache: "FindingCache | None" = None,
+        max_stores: int = DEFAULT_MAX_TENANT_STORES,
+    ) -> None:
+        self.database_url = database_url
+        self.read_database_url = read_database_url
+        self.auto_migrate = auto_migrate
+        self.shard_map = dict(shard_map or {})
+        self.default_tenant = default_tenant or default_tenant_id()
+        self.configure_engine = configure_engine
+        self.finding_cache = finding_cache
+        self.max_stores = max(max_stores, 1)
+        self._lock = RLock()
+        self._pid = os.getpid()
+        self._engines: dict[str, tuple[Engine, Engine | None]] = {}
+        self._stores: OrderedDict[str, SQLAlchemyFindingStore] = OrderedDict()
+
+    def shard_url(self, tenant_id: str) -> str:
+        return self.shard_map.get(tenant_id, self.database_url)
+
+    def get(self, tenant_id: str | None = None) -> "SQLAlchemyFindingStore":
+        from saastesa.api.repository import SQLAlchemyFindingStore
+
+        tenant = tenant_id or self.default_tenant
+        with self._lock:
+            self._reset_after_fork()
+            store = self._stores.get(tenant)
+            if store is not None:
+                self._stores.move_to_end(tenant)
+                return store
+
+            engine, read_engine = self._shard_engines(self.shard_url(tenant))
+            store = SQLAlchemyFindingStore(
+                engine, read_engine=read_engine, tenant_id=tenant, cache=self.finding_cache
+            )
+            self._stores[tenant] = store
+            while len(self._stores) > self.max_stores:
+                self._stores.popitem(last=False)
+            return store
+
+    def tenants(self) -> list[str]:
+        shard_urls = self._shard_urls()
+        discovered = self._map(
+            lambda url: self._tenants_in_shard(url, self.shard_map), shard_urls
+        )
+        return sorted({tenant for tenants in discovered for tenant in tenants})
+
+    def fan_out(self, call: Callable[["SQLAlchemyFindingStore"], T]) -> dict[str, T]:
+        tenants = self.tenants()
+        results = self._map(lambda tenant: call(self.get(tenant)), tenants)
+        return dict(zip(tenants, results, strict=True))
+
+    def shard_engines(self) -> list["Engine"]:
+        return [self._shard_engines(url)[0] for url in self._shard_urls()]
+
+    def dispose(self) -> None:
+        with self._lock:
+            if self._pid == os.getpid():
+                for engine, read_engine in self._engines.values():
+                    engine.dispose()
+                    if read_engine is not None:
+                        read_engine.dispose()
+            self._engines.clear()
+            self._stores.clear()
+            if self.finding_cache is not None:
+                self.finding_cache.clear()
+
+    def _tenants_in_shard(self, shard_url: str, shard_map: dict[str, str]) -> list[str]:
+        from sqlalchemy import select
+
+        from saastesa.api.db_models import SecurityFindingRecord
+
+        engine, _ = self._shard_engines(shard_url)
+        with engine.connect() as connection:
+            tenants = list(connection.scalars(select(SecurityFindingRecord.tenant_id).distinct()))
+        return [
+            tenant for tenant in tenants if shard_map.get(tenant, self.database_url) == shard_url
+        ]
+
+    def _shard_engines(self, shard_url: str) -> tuple["Engine", "Engine | None"]:
+        from saastesa.api.db import create_db_engine
+        from saastesa.api.migrations import ensure_schema_current
+
+        with self._lock:
+            self._reset_after_fork()
+            engines = self._engines.get(shard_url)
+            if engines is not None:
+                return engines
+
+            engine = create_db_engine(shard_url)
+            read_engine = None
+            if shard_url == self.database_url and self.read_database_url:
+                read_engine = create_db_engine(self.read_database_url)
+            for configured in (engine, read_engine):
+                if configured is not None and self.configure_engine is not None:
+                    self.configure_engine(configured)
+            ensure_schema_current(engine, auto_migrate=self.auto_migrate)
+            self._engines[shard_url] = (engine, read_engine)
+            return engine, read_engine
+
+    def _shard_urls(self) -> list[str]:
+        return sorted({self.database_url, *self.shard_map.values()})
+
+    def _reset_after_fork(self) -> None:
+        if self._pid != os.getpid():
+            self._engines.clear()
+            self._stores.clear()
+            self._pid = os.getpid()
+
+    def _map(self, call: Callable[[str], T], items: list[str]) -> list[T]:
+        if len(items) <= 1:
+            return [call(item) for item in items]
+        with ThreadPoolExecutor(
+            max_workers=min(len(items), DEFAULT_FAN_OUT_WORKERS),
+            thread_name_prefix="saastesa-fan-out",
+        ) as executor:
+            return list(executor.map(call, items))
@@ -1,18 +1,17 @@
 import argparse
 from collections.abc import Sequence
 
-from saastesa.agent.runner import main as agent_main
-from saastesa.api.main import serve
-from saastesa.config import load_settings
-from saastesa.connectors.mock import MockThreatSignalProvider
-from saastesa.core.risk_scoring import summarize_scores
-from saastesa.demo.seed import generate_demo_findings
-from saastesa.logging import configure_logging
-from saastesa.sdk.api_client import TESAApiClient
-from saastesa.services.tesa_service import TESAService
-
-
-def _run(mock: bool) -> int:
+from saastesa.core.contracts import FindingDomain, FindingStatus
+from saastesa.pipelines.stream import DEFAULT_CHUNK_SIZE
+
+
+def _run(mock: bool, chunk_size: int = DEFAULT_CHUNK_SIZE) -> int:
+    from saastesa.config import load_settings
+    from saastesa.connectors.mock import MockThreatSignalProvider
+    from saastesa.logging import configure_logging
+    from saastesa.pipelines.stream import ConsoleSink
+    from saastesa.services.tesa_service import TESAService
+
     settings = load_settings()
     configure_logging(settings.log_level)
 
@@ -20,38 +19,278 @@ def _run(mock: bool) -> int:
     if not mock:
         raise NotImplementedError("Non-mock providers are not implemented yet.")
 
-    findings = TESAService(provider=provider).run_once()
-    summary = summarize_scores(findings)
-
     print(f"Organization: {settings.organization}")
     print(f"Environment: {settings.environment}")
     print("--- Findings ---")
-    for finding in findings:
-        print(
-            f"[{finding.risk_score}] {finding.title} ({finding.domain}/{finding.type_name}) :: "
-            f"{finding.description}"
-        )
+    sink = ConsoleSink()
+    TESAService(provider=provider).run_streaming(sink, chunk_size=chunk_size)
     print("--- Summary ---")
-    print(summary)
+    print(sink.summary)
+    return 0
+
+
+def _serve(args: argparse.Namespace) -> int:
+    from saastesa.api.main import serve
+
+    serve(workers=args.workers, server=args.server)
+    return 0
+
+
+def _run_agent(args: argparse.Namespace) -> int:
+    from saastesa.agent.runner import main as agent_main
+
+    agent_args = [
+        "--api-url",
+        args.api_url,
+        "--interval-seconds",
+        str(args.interval_seconds),
+        "--batch-size",
+        str(args.batch_size),
+        "--wire-format",
+        args.wire_format,
+    ]
+    if args.once:
+        agent_args.append("--once")
+    return agent_main(agent_args)
+
+
+def _seed_demo(args: argparse.Namespace) -> int:
+    import random
+
+    from saastesa.demo.seed import iter_demo_findings
+    from saastesa.pipelines.ingest import chunked
+    from saastesa.sdk.api_client import TESAApiClient
+
+    client = TESAApiClient(base_url=args.api_url)
+    findings = iter_demo_findings(
+        count=max(args.count, 1), days=args.days, rng=random.Random(args.seed)
+    )
+    ingested = 0
+    for batch in chunked(findings, args.batch_size):
+        ingested += int(client.send_findings(batch)["ingested"])
+    print(f"Seeded {ingested} findings to {args.api_url}")
+    return 0
+
+
+def _load_test(args: argparse.Namespace) -> int:
+    import json
+
+    from saastesa.demo.loadgen import HttpFindingSender, LoadProfile, run_load_test
+
+    total = args.total
+    if total is None and args.duration is None:
+        total = 10000
+    profile = LoadProfile(
+        rate=args.rate,
+        concurrency=args.concurrency,
+        agents=args.agents,
+        batch_size=args.batch_size,
+        total_findings=total,
+        duration_seconds=args.duration,
+        reuse_ratio=args.reuse_ratio,
+        seed=args.seed,
+        days=args.days,
+    )
+    report = run_load_test(profile, lambda: HttpFindingSender(args.api_url))
+    print(json.dumps(report.as_dict(), indent=2))
+    return 0 if report.errors == 0 else 1
+
+
+def _prune(args: argparse.Namespace) -> int:
+    from saastesa.api.db import create_db_engine, resolve_database_url
+    from saastesa.api.retention import RetentionPolicy, prune_findings
+
+    policy = RetentionPolicy(
+        max_age_days=args.days,
+        statuses=tuple(FindingStatus(status) for status in args.status),
+        domains=tuple(FindingDomain(domain) for domain in args.domain),
+        batch_size=args.batch_size,
+    )
+    engine = create_db_engine(args.database_url or resolve_database_url())
+    deleted = prune_findings(engine, policy)
+    print(f"Pruned {deleted} findings older than {args.days} days")
     return 0
 
 
+def _migrate(args: argparse.Namespace) -> int:
+    from saastesa.api.db import create_db_engine, resolve_database_url
+    from saastesa.api.migrations import (
+        DEFAULT_BACKFILL_CHUNK_SIZE,
+        LATEST_SCHEMA_VERSION,
+        current_schema_version,
+        run_migrations,
+    )
+
+    engine = create_db_engine(args.database_url or resolve_database_url())
+    version = current_schema_version(engine)
+    if args.check:
+        print(f"Schema version {version} (latest {LATEST_SCHEMA_VERSION})")
+        return 0 if version >= LATEST_SCHEMA_VERSION else 1
+
+    applied = run_migrations(
+        engine, chunk_size=args.chunk_size or DEFAULT_BACKFILL_CHUNK_SIZE, progress=print
+    )
+    print(f"Applied {len(applied)} migrations; schema is at version {LATEST_SCHEMA_VERSION}")
+    return 0
+
+
+def _export(args: argparse.Namespace) -> int:
+    from pathlib import Path
+
+    from saastesa.api.db import resolve_database_url
+    from saastesa.api.export import export_format, write_export
+    from saastesa.api.filters import parse_finding_filters
+    from saastesa.api.projection import FINDING_FIELDS, parse_fields
+    from saastesa.api.tenancy import TenantStoreRouter, load_shard_map, normalize_tenant_id
+
+    path = Path(args.output)
+    fields = parse_fields(args.fields) or FINDING_FIELDS
+    filters = parse_finding_filters(
+        (f"raw.{key}", value) for key, _, value in (item.partition("=") for item in args.raw)
+    )
+    router = TenantStoreRouter(
+        args.database_url or resolve_database_url(), auto_migrate=False, shard_map=load_shard_map()
+    )
+    tenant = normalize_tenant_id(args.organization) if args.organization else None
+    try:
+        chunks = router.get(tenant).iter_fields(
+            fields, batch_size=args.batch_size, filters=filters, raw_data_as_text=True
+        )
+        exported = write_export(chunks, fields, path, export_format(path, args.format))
+    finally:
+        router.dispose()
+    print(f"Exported {exported} findings to {path}")
+    return 0
+
+
+def _import(args: argparse.Namespace) -> int:
+    from pathlib import Path
+
+    from saastesa.api.db import resolve_database_url
+    from saastesa.api.importer import ImportFormatError, import_findings, read_findings
+    from saastesa.api.tenancy import TenantStoreRouter, load_shard_map, normalize_tenant_id
+
+    router = TenantStoreRouter(
+        args.database_url or resolve_database_url(), auto_migrate=True, shard_map=load_shard_map()
+    )
+    tenant = normalize_tenant_id(args.organization) if args.organization else None
+    try:
+        store = router.get(tenant)
+        imported = import_findings(
+            store.engine,
+            store.tenant_id,
+            read_findings(Path(path) for path in args.paths),
+            batch_size=args.batch_size,
+            progress=print,
+        )
+    except ImportFormatError as error:
+        print(f"Import stopped at invalid finding {error}")
+        return 1
+    finally:
+        router.dispose()
+    print(f"Imported {imported} findings")
+    return 0
+
+
+def _positive_int(value: str) -> int:
+    number = int(value)
+    if number <= 0:
+        raise argparse.ArgumentTypeError(f"must be a positive integer, got {value}")
+    return number
+
+
 def build_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(prog="saastesa", description="SaaS TESA CLI")
     subparsers = parser.add_subparsers(dest="command", required=True)
 
     run_parser = subparsers.add_parser("run", help="Run one threat analysis cycle")
     run_parser.add_argument("--mock", action="store_true", help="Use mock signal provider")
-    subparsers.add_parser("serve-api", help="Run FastAPI server")
+    run_parser.add_argument(
+        "--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE, help="Signals scored per chunk"
+    )
+    serve_parser = subparsers.add_parser("serve-api", help="Run FastAPI server")
+    serve_parser.add_argument(
+        "--workers", type=int, default=None, help="Worker processes (default TESA_API_WORKERS or 1)"
+    )
+    serve_parser.add_argument("--server", choices=["uvicorn", "gunicorn"], default=None)
     agent_parser = subparsers.add_parser("run-agent", help="Run distributed signal agent")
     agent_parser.add_argument("--api-url", default="http://localhost:8080")
     agent_parser.add_argument("--interval-seconds", type=int, default=30)
     agent_parser.add_argument("--once", action="store_true")
+    agent_parser.add_argument("--batch-size", type=int, default=DEFAULT_CHUNK_SIZE)
+    agent_parser.add_argument("--wire-format", choices=["json", "msgpack"], default="json")
 
-    seed_parser = subparsers.add_parser("seed-demo", help="Seed demo findings for dashboard presentations")
+    seed_parser = subparsers.add_parser(
+        "seed-demo", help="Seed demo findings for dashboard presentations"
+    )
     seed_parser.add_argument("--api-url", default="http://localhost:8080")
     seed_parser.add_argument("--count", type=int, default=250)
     seed_parser.add_argument("--days", type=int, default=30)
+    seed_parser.add_argument("--batch-size", type=int, default=DEFAULT_CHUNK_SIZE)
+    seed_parser.add_argument("--seed", type=int, default=None)
+
+    load_parser = subparsers.add_parser(
+        "load-test", help="Stream synthetic findings from simulated agents and report latency"
+    )
+    load_parser.add_argument("--api-url", default="http://localhost:8080")
+    load_parser.add_argument(
+        "--rate", type=float, default=0.0, help="Findings per second in total (0: unthrottled)"
+    )
+    load_parser.add_argument("--concurrency", type=int, default=4, help="Requests in flight")
+    load_parser.add_argument("--agents", type=int, default=16, help="Simulated agents")
+    load_parser.add_argument("--batch-size", type=int, default=100)
+    load_parser.add_argument("--total", type=int, default=None, help="Findings to send")
+    load_parser.add_argument("--duration", type=float, default=None, help="Seconds to run")
+    load_parser.add_argument(
+        "--reuse-ratio", type=float, default=0.2, help="Share of re-reported known findings"
+    )
+    load_parser.add_argument("--seed", type=int, default=0)
+    load_parser.add_argument("--days", type=int, default=30)
+
+    migrate_parser = subparsers.add_parser("migrate", help="Apply pending database migrations")
+    migrate_parser.add_argument("--database-url", default=None)
+    migrate_parser.add_argument("--chunk-size", type=int, default=None)
+    migrate_parser.add_argument(
+        "--check", action="store_true", help="Exit non-zero when migrations are pending"
+    )
+
+    prune_parser = subparsers.add_parser(
+        "prune", help="Delete findings past their retention period"
+    )
+    prune_parser.add_argument(
+        "--days", type=_positive_int, required=True, help="Maximum finding age in days"
+    )
+    prune_parser.add_argument(
+        "--status", action="append", default=[], choices=[status.value for status in FindingStatus]
+    )
+    prune_parser.add_argument(
+        "--domain", action="append", default=[], choices=[domain.value for domain in FindingDomain]
+    )
+    prune_parser.add_argument("--batch-size", type=int, default=1000)
+    prune_parser.add_argument("--database-url", default=None)
+
+    export_parser = subparsers.add_parser(
+        "export", help="Export findings as Parquet or an Arrow IPC stream"
+    )
+    export_parser.add_argument("output", help="Destination file (.parquet or .arrows)")
+    export_parser.add_argument(
+        "--format", choices=["parquet", "arrow"], default=None, help="Default: from the suffix"
+    )
+    export_parser.add_argument("--fields", default=None, help="Comma-separated finding fields")
+    export_parser.add_argument(
+        "--raw", action="append", default=[], metavar="KEY=VALUE", help="raw_data filter"
+    )
+    export_parser.add_argument("--organization", default=None)
+    export_parser.add_argument("--batch-size", type=int, default=10000)
+    export_parser.add_argument("--database-url", default=None)
+
+    import_parser = subparsers.add_parser(
+        "import", help="Bulk-load findings from NDJSON files (optionally gzip-compressed)"
+    )
+    import_parser.add_argument("paths", nargs="+", help="NDJSON files, one finding per line")
+    import_parser.add_argument("--organization", default=None)
+    import_parser.add_argument("--batch-size", type=int, default=50000)
+    import_parser.add_argument("--database-url", default=None)
     return parser
 
 
@@ -60,20 +299,23 @@ def main(argv: Sequence[str] | None = None) -> int:
     args = parser.parse_args(argv)
 
     if args.command == "run":
-        return _run(mock=args.mock)
+        return _run(mock=args.mock, chunk_size=args.chunk_size)
     if args.command == "serve-api":
-        serve()
-        return 0
+        return _serve(args)
     if args.command == "run-agent":
-        agent_args = ["--api-url", args.api_url, "--interval-seconds", str(args.interval_seconds)]
-        if args.once:
-            agent_args.append("--once")
-        return agent_main(agent_args)
+        return _run_agent(args)
     if args.command == "seed-demo":
-        findings = generate_demo_findings(count=args.count, days=args.days)
-        result = TESAApiClient(base_url=args.api_url).send_findings(findings)
-        print(f"Seeded {result['ingested']} findings to {args.api_url}")
-        return 0
+        return _seed_demo(args)
+    if args.command == "load-test":
+        return _load_test(args)
+    if args.command == "migrate":
+        return _migrate(args)
+    if args.command == "prune":
+        return _prune(args)
+    if args.command == "export":
+        return _export(args)
+    if args.command == "import":
+        return _import(args)
     parser.error("Unknown command")
     return 2
 
@@ -7,11 +7,48 @@ class Settings:
     environment: str
     organization: str
     log_level: str
+    dedup_window_seconds: int = 3600
+    dedup_cache_size: int = 10000
+    auto_migrate: bool = True
+    metrics_enabled: bool = False
+    profile_sql: bool = False
+    slow_query_ms: float = 100.0
+    read_your_writes_seconds: float = 5.0
+    finding_cache_size: int = 10000
+    idempotency_ttl_seconds: float = 3600.0
+    ingest_rate_per_second: float = 20.0
+    ingest_burst: int = 40
+    ingest_max_in_flight: int = 8
+    dashboard_cache_seconds: float = 10.0
+    admin_routes_enabled: bool = False
 
 
 def load_settings() -> Settings:
+    environment = os.getenv("TESA_ENV", "development")
+    local_environment = environment.lower() in {"development", "local", "dev", "test"}
     return Settings(
-        environment=os.getenv("TESA_ENV", "development"),
+        environment=environment,
         organization=os.getenv("TESA_ORGANIZATION", "unknown-org"),
         log_level=os.getenv("TESA_LOG_LEVEL", "INFO"),
+        dedup_window_seconds=int(os.getenv("TESA_DEDUP_WINDOW_SECONDS", "3600")),
+        dedup_cache_size=int(os.getenv("TESA_DEDUP_CACHE_SIZE", "10000")),
+        auto_migrate=_env_flag("TESA_AUTO_MIGRATE", default=local_environment),
+        metrics_enabled=_env_flag("TESA_METRICS_ENABLED", default=False),
+        profile_sql=_env_flag("TESA_PROFILE_SQL", default=False),
+        slow_query_ms=float(os.getenv("TESA_SLOW_QUERY_MS", "100")),
+        read_your_writes_seconds=float(os.getenv("TESA_READ_YOUR_WRITES_SECONDS", "5")),
+        finding_cache_size=int(os.getenv("TESA_FINDING_CACHE_SIZE", "10000")),
+        idempotency_ttl_seconds=float(os.getenv("TESA_IDEMPOTENCY_TTL_SECONDS", "3600")),
+        ingest_rate_per_second=float(os.getenv("TESA_INGEST_RATE_PER_SECOND", "20")),
+        ingest_burst=int(os.getenv("TESA_INGEST_BURST", "40")),
+        ingest_max_in_flight=int(os.getenv("TESA_INGEST_MAX_IN_FLIGHT", "8")),
+        dashboard_cache_seconds=float(os.getenv("TESA_DASHBOARD_CACHE_SECONDS", "10")),
+        admin_routes_enabled=_env_flag("TESA_ADMIN_ROUTES_ENABLED", default=False),
     )
+
+
+def _env_flag(name: str, default: bool) -> bool:
+    value = os.getenv(name, "").strip().lower()
+    if not value:
+        return default
+    return value in {"1", "true", "yes", "on"}
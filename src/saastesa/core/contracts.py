@@ -8,6 +8,7 @@ class FindingStandard(StrEnum):
 
 FindingSchemaVersion: TypeAlias = Literal["1.1.0"]
 CURRENT_FINDING_SCHEMA_VERSION: FindingSchemaVersion = "1.1.0"
+DEFAULT_TENANT_ID = "default"
 
 
 class FindingStatus(StrEnum):
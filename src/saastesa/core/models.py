@@ -59,3 +59,5 @@ class SecurityFinding:
     resource: FindingResource
     references: FindingReferences
     raw_data: dict[str, JSONValue]
+    occurrence_count: int = 1
+    last_seen: datetime | None = None
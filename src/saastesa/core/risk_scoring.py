@@ -1,4 +1,5 @@
 from collections.abc import Iterable
+from hashlib import sha256
 from uuid import NAMESPACE_URL, uuid5
 
 from saastesa.core.contracts import (
@@ -110,15 +111,37 @@ def build_finding(signal: ThreatSignal) -> SecurityFinding:
     )
 
 
+def finding_fingerprint(finding: SecurityFinding) -> str:
+    references = finding.references
+    parts = [
+        finding.source,
+        finding.type_name,
+        finding.resource.uid,
+        ",".join(sorted(set(references.cve))),
+        ",".join(sorted(set(references.cwe))),
+        ",".join(sorted(set(references.owasp))),
+        ",".join(sorted(set(references.mitre_attack))),
+    ]
+    return sha256("\x1f".join(parts).encode("utf-8")).hexdigest()
+
+
+RISK_BUCKETS = ("low", "medium", "high", "critical")
+RISK_BUCKET_CEILINGS = (("low", 30), ("medium", 60), ("high", 80))
+
+
+def risk_bucket(risk_score: int) -> str:
+    for bucket, ceiling in RISK_BUCKET_CEILINGS:
+        if risk_score <= ceiling:
+            return bucket
+    return "critical"
+
+
 def summarize_scores(findings: Iterable[SecurityFinding]) -> dict[str, int]:
-    buckets = {"low": 0, "medium": 0, "high": 0, "critical": 0}
-    for finding in findings:
-        if finding.risk_score <= 30:
-            buckets["low"] += 1
-        elif finding.risk_score <= 60:
-            buckets["medium"] += 1
-        elif finding.risk_score <= 80:
-            buckets["high"] += 1
-        else:
-            buckets["critical"] += 1
+    return summarize_risk_scores(finding.risk_score for finding in findings)
+
+
+def summarize_risk_scores(risk_scores: Iterable[int]) -> dict[str, int]:
+    buckets = dict.fromkeys(RISK_BUCKETS, 0)
+    for risk_score in risk_scores:
+        buckets[risk_bucket(risk_score)] += 1
     return buckets
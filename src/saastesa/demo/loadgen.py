@@ -0,0 +1,237 @@
+import math
+import random
+import time
+from collections import deque
+from collections.abc import Callable
+from dataclasses import asdict, dataclass
+from datetime import UTC, datetime
+from threading import Lock, Thread
+from typing import Any, Protocol
+
+import httpx
+
+from saastesa.demo.seed import iter_demo_findings
+
+FindingPayload = dict[str, Any]
+
+_SHED_STATUS_CODES = frozenset({429, 503})
+DEFAULT_SHED_RETRY_SECONDS = 1.0
+
+
+class FindingsShedError(RuntimeError):
+    def __init__(self, status_code: int, retry_after: float) -> None:
+        super().__init__(f"Server shed the batch with HTTP {status_code}")
+        self.status_code = status_code
+        self.retry_after = retry_after
+
+
+class FindingSender(Protocol):
+    def send(self, findings: list[FindingPayload]) -> None: ...
+
+    def close(self) -> None: ...
+
+
+SenderFactory = Callable[[], FindingSender]
+
+
+@dataclass(frozen=True)
+class LoadProfile:
+    rate: float = 0.0
+    concurrency: int = 4
+    agents: int = 16
+    batch_size: int = 100
+    total_findings: int | None = 10000
+    duration_seconds: float | None = None
+    reuse_ratio: float = 0.2
+    seed: int = 0
+    days: int = 30
+    known_findings_per_agent: int = 1000
+    max_shed_retries: int = 5
+
+
+@dataclass(frozen=True)
+class LoadReport:
+    batches: int
+    findings: int
+    new_findings: int
+    repeated_findings: int
+    shed: int
+    errors: int
+    elapsed_seconds: float
+    findings_per_second: float
+    latency_p50_ms: float
+    latency_p95_ms: float
+    latency_p99_ms: float
+    latency_max_ms: float
+
+    def as_dict(self) -> dict[str, Any]:
+        return asdict(self)
+
+
+class HttpFindingSender:
+    def __init__(self, api_url: str, timeout: float = 30.0) -> None:
+        self.url = f"{api_url.rstrip('/')}/api/v1/findings"
+        self._client = httpx.Client(timeout=timeout)
+
+    def send(self, findings: list[FindingPayload]) -> None:
+        response = self._client.post(self.url, json={"findings": findings})
+        if response.status_code in _SHED_STATUS_CODES:
+            raise FindingsShedError(response.status_code, _retry_after(response))
+        response.raise_for_status()
+
+    def close(self) -> None:
+        self._client.close()
+
+
+class SimulatedAgent:
+    def __init__(self, agent_id: int, profile: LoadProfile) -> None:
+        self.lock = Lock()
+        self._rng = random.Random(profile.seed * 1_000_003 + agent_id)
+        self._reuse_ratio = profile.reuse_ratio
+        self._findings = iter_demo_findings(days=profile.days, rng=self._rng)
+        self._known: deque[FindingPayload] = deque(maxlen=max(profile.known_findings_per_agent, 1))
+
+    def next_batch(self, size: int) -> tuple[list[FindingPayload], int]:
+        batch: list[FindingPayload] = []
+        repeated = 0
+        reported_at = datetime.now(tz=UTC).isoformat()
+        for _ in range(size):
+            if self._known and self._rng.random() < self._reuse_ratio:
+                batch.append({**self._rng.choice(self._known), "time": reported_at})
+                repeated += 1
+            else:
+                finding = next(self._findings)
+                self._known.append(finding)
+                batch.append(finding)
+        return batch, repeated
+
+
+class _Pacer:
+    def __init__(self, rate: float) -> None:
+        self.rate = rate
+        self._lock = Lock()
+        self._next_at = time.perf_counter()
+
+    def wait(self, findings: int) -> None:
+        if self.rate <= 0:
+            return
+        with self._lock:
+            now = time.perf_counter()
+            slot = max(self._next_at, now)
+            self._next_at = slot + findings / self.rate
+        if slot > now:
+            time.sleep(slot - now)
+
+
+class _Budget:
+    def __init__(self, total: int | None, deadline: float | None) -> None:
+        self._remaining = total
+        self._deadline = deadline
+        self._lock = Lock()
+
+    def claim(self, size: int) -> int:
+        if self._deadline is not None and time.perf_counter() >= self._deadline:
+            return 0
+        with self._lock:
+            if self._remaining is None:
+                return size
+            claimed = min(size, self._remaining)
+            self._remaining -= claimed
+            return claimed
+
+
+def run_load_test(profile: LoadProfile, sender_factory: SenderFactory) -> LoadReport:
+    if profile.total_findings is None and profile.duration_seconds is None:
+        raise ValueError("Load test needs total_findings or duration_seconds.")
+
+    agents = [SimulatedAgent(agent_id, profile) for agent_id in range(max(profile.agents, 1))]
+    pacer = _Pacer(profile.rate)
+    started = time.perf_counter()
+    budget = _Budget(
+        profile.total_findings,
+        started + profile.duration_seconds if profile.duration_seconds is not None else None,
+    )
+    lock = Lock()
+    latencies: list[float] = []
+    totals = {"batches": 0, "findings": 0, "repeated": 0, "shed": 0, "errors": 0}
+    next_agent = [0]
+
+    def worker() -> None:
+        sender = sender_factory()
+        try:
+            while (size := budget.claim(max(profile.batch_size, 1))) > 0:
+                with lock:
+                    agent = agents[next_agent[0] % len(agents)]
+                    next_agent[0] += 1
+                with agent.lock:
+                    batch, repeated = agent.next_batch(size)
+
+                pacer.wait(size)
+                shed = 0
+                while True:
+                    sent_at = time.perf_counter()
+                    try:
+                        sender.send(batch)
+                        failed = False
+                    except FindingsShedError as error:
+                        shed += 1
+                        if shed <= profile.max_shed_retries:
+                            time.sleep(error.retry_after)
+                            continue
+                        failed = True
+                    except Exception:  # noqa: BLE001
+                        failed = True
+                    break
+                elapsed_ms = (time.perf_counter() - sent_at) * 1000
+
+                with lock:
+                    latencies.append(elapsed_ms)
+                    totals["batches"] += 1
+                    totals["shed"] += shed
+                    if failed:
+                        totals["errors"] += 1
+                    else:
+                        totals["findings"] += size
+                        totals["repeated"] += repeated
+        finally:
+            sender.close()
+
+    threads = [
+        Thread(target=worker, name=f"saastesa-load-{index}", daemon=True)
+        for index in range(max(profile.concurrency, 1))
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    elapsed = time.perf_counter() - started
+    ordered = sorted(latencies)
+    return LoadReport(
+        batches=totals["batches"],
+        findings=totals["findings"],
+        new_findings=totals["findings"] - totals["repeated"],
+        repeated_findings=totals["repeated"],
+        shed=totals["shed"],
+        errors=totals["errors"],
+        elapsed_seconds=round(elapsed, 3),
+        findings_per_second=round(totals["findings"] / elapsed, 1) if elapsed else 0.0,
+        latency_p50_ms=_percentile(ordered, 50),
+        latency_p95_ms=_percentile(ordered, 95),
+        latency_p99_ms=_percentile(ordered, 99),
+        latency_max_ms=round(ordered[-1], 2) if ordered else 0.0,
+    )
+
+
+def _retry_after(response: httpx.Response) -> float:
+    try:
+        return max(float(response.headers.get("Retry-After", DEFAULT_SHED_RETRY_SECONDS)), 0.0)
+    except ValueError:
+        return DEFAULT_SHED_RETRY_SECONDS
+
+
+def _percentile(ordered: list[float], percentile: float) -> float:
+    if not ordered:
+        return 0.0
+    rank = max(math.ceil(percentile / 100 * len(ordered)), 1)
+    return round(ordered[rank - 1], 2)
@@ -1,7 +1,8 @@
+from collections.abc import Iterator
 from datetime import UTC, datetime, timedelta
 import random
 from typing import Any
-from uuid import uuid4
+from uuid import UUID
 
 DOMAIN_TYPES: dict[str, list[str]] = {
     "application": ["SQL Injection", "Dependency Vulnerability", "Secrets Exposure"],
@@ -13,68 +14,81 @@ DOMAIN_TYPES: dict[str, list[str]] = {
 
 SOURCES = ["sast", "dast", "sca", "iam", "cspm", "k8s", "edr", "siem"]
 STATUSES = ["open", "open", "open", "in_progress", "resolved"]
+PLATFORMS = ["aws", "gcp", "azure", "saas"]
+OWNERS = ["platform", "appsec", "sre", "infra"]
+DOMAINS = list(DOMAIN_TYPES)
+SEVERITY_IDS = [2, 3, 4, 5]
+SEVERITY_CUM_WEIGHTS = [20, 60, 90, 100]
 
 
-def generate_demo_findings(count: int = 200, days: int = 30) -> list[dict[str, Any]]:
-    now = datetime.now(tz=UTC)
-    findings: list[dict[str, Any]] = []
+def generate_demo_findings(
+    count: int = 200, days: int = 30, seed: int | None = None
+) -> list[dict[str, Any]]:
+    return list(iter_demo_findings(count=max(count, 1), days=days, rng=_rng(seed)))
 
-    for _ in range(max(count, 1)):
-        domain = random.choice(list(DOMAIN_TYPES.keys()))
-        type_name = random.choice(DOMAIN_TYPES[domain])
-        severity_id = random.choices([2, 3, 4, 5], weights=[20, 40, 30, 10], k=1)[0]
-        risk_score = random.randint(max(10, severity_id * 18), min(100, severity_id * 22))
+
+def iter_demo_findings(
+    count: int | None = None,
+    days: int = 30,
+    rng: random.Random | None = None,
+    now: datetime | None = None,
+) -> Iterator[dict[str, Any]]:
+    rng = rng or _rng(None)
+    now = now or datetime.now(tz=UTC)
+    max_day = max(days - 1, 0)
+    emitted = 0
+
+    while count is None or emitted < count:
+        domain = rng.choice(DOMAINS)
+        type_name = rng.choice(DOMAIN_TYPES[domain])
+        severity_id = rng.choices(SEVERITY_IDS, cum_weights=SEVERITY_CUM_WEIGHTS, k=1)[0]
+        risk_score = rng.randint(max(10, severity_id * 18), min(100, severity_id * 22))
         observed = now - timedelta(
-            days=random.randint(0, max(days - 1, 0)),
-            hours=random.randint(0, 23),
-            minutes=random.randint(0, 59),
+            days=rng.randint(0, max_day),
+            hours=rng.randint(0, 23),
+            minutes=rng.randint(0, 59),
         )
 
-        finding_uid = str(uuid4())
-        source = random.choice(SOURCES)
-        title = f"{type_name} detected in {domain} stack"
-        description = (
-            f"{type_name} indicates elevated {domain} exposure and requires triage."
-        )
+        yield {
+            "finding_uid": str(UUID(int=rng.getrandbits(128), version=4)),
+            "standard": "OCSF",
+            "schema_version": "1.1.0",
+            "status": rng.choice(STATUSES),
+            "severity_id": severity_id,
+            "severity": _severity_label(severity_id),
+            "risk_score": risk_score,
+            "title": f"{type_name} detected in {domain} stack",
+            "description": f"{type_name} indicates elevated {domain} exposure and requires triage.",
+            "category_name": _category_name(domain),
+            "class_name": "Security Finding",
+            "type_name": type_name,
+            "domain": domain,
+            "activity_name": "Create",
+            "time": observed.isoformat(),
+            "source": rng.choice(SOURCES),
+            "resource": {
+                "uid": f"asset-{rng.randint(1000, 9999)}",
+                "name": f"{domain}-service-{rng.randint(1, 50)}",
+                "type": _resource_type(domain),
+                "platform": rng.choice(PLATFORMS),
+            },
+            "references": {
+                "cve": ["CVE-2024-12345"] if rng.random() > 0.7 else [],
+                "cwe": ["CWE-79"] if domain == "application" else [],
+                "owasp": ["A05:2021"] if domain == "application" else [],
+                "mitre_attack": ["T1190"] if rng.random() > 0.6 else [],
+            },
+            "raw_data": {
+                "generated": True,
+                "demo": True,
+                "owner": rng.choice(OWNERS),
+            },
+        }
+        emitted += 1
 
-        findings.append(
-            {
-                "finding_uid": finding_uid,
-                "standard": "OCSF",
-                "schema_version": "1.1.0",
-                "status": random.choice(STATUSES),
-                "severity_id": severity_id,
-                "severity": _severity_label(severity_id),
-                "risk_score": risk_score,
-                "title": title,
-                "description": description,
-                "category_name": _category_name(domain),
-                "class_name": "Security Finding",
-                "type_name": type_name,
-                "domain": domain,
-                "activity_name": "Create",
-                "time": observed.isoformat(),
-                "source": source,
-                "resource": {
-                    "uid": f"asset-{random.randint(1000, 9999)}",
-                    "name": f"{domain}-service-{random.randint(1, 50)}",
-                    "type": _resource_type(domain),
-                    "platform": random.choice(["aws", "gcp", "azure", "saas"]),
-                },
-                "references": {
-                    "cve": ["CVE-2024-12345"] if random.random() > 0.7 else [],
-                    "cwe": ["CWE-79"] if domain == "application" else [],
-                    "owasp": ["A05:2021"] if domain == "application" else [],
-                    "mitre_attack": ["T1190"] if random.random() > 0.6 else [],
-                },
-                "raw_data": {
-                    "generated": True,
-                    "demo": True,
-                    "owner": random.choice(["platform", "appsec", "sre", "infra"]),
-                },
-            }
-        )
-    return findings
+
+def _rng(seed: int | None) -> random.Random:
+    return random.Random(seed) if seed is not None else random.Random()
 
 
 def _severity_label(severity_id: int) -> str:
@@ -1,4 +1,6 @@
+import json
 import logging
+from typing import Any
 
 
 def configure_logging(level: str) -> None:
@@ -6,3 +8,9 @@ def configure_logging(level: str) -> None:
         level=getattr(logging, level.upper(), logging.INFO),
         format="%(asctime)s %(levelname)s %(name)s :: %(message)s",
     )
+
+
+def log_event(logger: logging.Logger, event: str, level: int = logging.INFO, **fields: Any) -> None:
+    if not logger.isEnabledFor(level):
+        return
+    logger.log(level, json.dumps({"event": event, **fields}, default=str, sort_keys=True))
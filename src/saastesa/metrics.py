@@ -0,0 +1,268 @@
+import math
+import time
+from collections.abc import Callable, Iterator
+from contextlib import AbstractContextManager, contextmanager, nullcontext
+from contextvars import ContextVar
+from threading import Lock
+from typing import Any
+
+LabelKey = tuple[tuple[str, str], ...]
+
+DEFAULT_LATENCY_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+DEFAULT_SIZE_BUCKETS = (1, 5, 10, 50, 100, 500, 1000, 5000, 10000)
+
+_NULL_CONTEXT: AbstractContextManager[None] = nullcontext()
+
+
+def _label_key(labels: dict[str, str]) -> LabelKey:
+    return tuple(sorted(labels.items()))
+
+
+def _format_labels(key: LabelKey, extra: tuple[tuple[str, str], ...] = ()) -> str:
+    pairs = key + extra
+    if not pairs:
+        return ""
+    rendered = ",".join(f'{name}="{_escape(value)}"' for name, value in pairs)
+    return f"{{{rendered}}}"
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_value(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+class Counter:
+    def __init__(self, name: str, documentation: str) -> None:
+        self.name = name
+        self.documentation = documentation
+        self._lock = Lock()
+        self._values: dict[LabelKey, float] = {}
+
+    def inc(self, amount: float = 1.0, **labels: str) -> None:
+        key = _label_key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def value(self, **labels: str) -> float:
+        with self._lock:
+            return self._values.get(_label_key(labels), 0.0)
+
+    def snapshot(self) -> dict[LabelKey, float]:
+        with self._lock:
+            return dict(self._values)
+
+    def render(self) -> list[str]:
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} counter"]
+        with self._lock:
+            for key, value in sorted(self._values.items()):
+                lines.append(f"{self.name}{_format_labels(key)} {_format_value(value)}")
+        return lines
+
+
+class Histogram:
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        buckets: tuple[float, ...] = DEFAULT_LATENCY_BUCKETS,
+    ) -> None:
+        self.name = name
+        self.documentation = documentation
+        self.buckets = tuple(sorted(buckets)) + (math.inf,)
+        self._lock = Lock()
+        self._counts: dict[LabelKey, list[int]] = {}
+        self._sums: dict[LabelKey, float] = {}
+
+    def observe(self, value: float, **labels: str) -> None:
+        key = _label_key(labels)
+        with self._lock:
+            counts = self._counts.setdefault(key, [0] * len(self.buckets))
+            for index, bound in enumerate(self.buckets):
+                if value <= bound:
+                    counts[index] += 1
+                    break
+            self._sums[key] = self._sums.get(key, 0.0) + value
+
+    def count(self, **labels: str) -> int:
+        with self._lock:
+            return sum(self._counts.get(_label_key(labels), []))
+
+    def render(self) -> list[str]:
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} histogram"]
+        with self._lock:
+            for key, counts in sorted(self._counts.items()):
+                cumulative = 0
+                for bound, bucket_count in zip(self.buckets, counts, strict=True):
+                    cumulative += bucket_count
+                    bucket_labels = _format_labels(key, (("le", _format_value(bound)),))
+                    lines.append(f"{self.name}_bucket{bucket_labels} {cumulative}")
+                total = _format_value(self._sums[key])
+                lines.append(f"{self.name}_sum{_format_labels(key)} {total}")
+                lines.append(f"{self.name}_count{_format_labels(key)} {cumulative}")
+        return lines
+
+
+class Gauge:
+    def __init__(
+        self, name: str, documentation: str, collect: Callable[[], dict[LabelKey, float]]
+    ) -> None:
+        self.name = name
+        self.documentation = documentation
+        self.collect = collect
+
+    def render(self) -> list[str]:
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} gauge"]
+        for key, value in sorted(self.collect().items()):
+            lines.append(f"{self.name}{_format_labels(key)} {_format_value(value)}")
+        return lines
+
+
+class MetricsRegistry:
+    def __init__(self, enabled: bool = False) -> None:
+        self.enabled = enabled
+        self._metrics: list[Counter | Histogram | Gauge] = []
+
+    def counter(self, name: str, documentation: str) -> Counter:
+        metric = Counter(name, documentation)
+        self._metrics.append(metric)
+        return metric
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        buckets: tuple[float, ...] = DEFAULT_LATENCY_BUCKETS,
+    ) -> Histogram:
+        metric = Histogram(name, documentation, buckets)
+        self._metrics.append(metric)
+        return metric
+
+    def gauge(
+        self, name: str, documentation: str, collect: Callable[[], dict[LabelKey, float]]
+    ) -> Gauge:
+        metric = Gauge(name, documentation, collect)
+        self._metrics.append(metric)
+        return metric
+
+    def render(self) -> str:
+        lines: list[str] = []
+        for metric in self._metrics:
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+
+REGISTRY = MetricsRegistry()
+
+REQUEST_LATENCY = REGISTRY.histogram(
+    "saastesa_http_request_duration_seconds", "HTTP request latency by route."
+)
+STAGE_LATENCY = REGISTRY.histogram(
+    "saastesa_stage_duration_seconds", "Time spent in each ingest and query stage."
+)
+INGEST_BATCH_SIZE = REGISTRY.histogram(
+    "saastesa_ingest_batch_size", "Findings per ingest batch.", DEFAULT_SIZE_BUCKETS
+)
+INGESTED_FINDINGS = REGISTRY.counter("saastesa_ingested_findings_total", "Findings ingested.")
+DB_QUERIES_PER_REQUEST = REGISTRY.histogram(
+    "saastesa_db_queries_per_request",
+    "SQL statements executed per HTTP request.",
+    DEFAULT_SIZE_BUCKETS,
+)
+CACHE_REQUESTS = REGISTRY.counter(
+    "saastesa_cache_requests_total", "Cache lookups by cache and result."
+)
+SHED_REQUESTS = REGISTRY.counter(
+    "saastesa_shed_requests_total", "Ingest requests rejected by admission control by reason."
+)
+CACHE_HIT_RATIO = REGISTRY.gauge(
+    "saastesa_cache_hit_ratio",
+    "Share of cache lookups that were hits.",
+    lambda: _cache_hit_ratios(),
+)
+
+_request_queries: ContextVar[list[int] | None] = ContextVar(
+    "saastesa_request_queries", default=None
+)
+
+
+def configure_metrics(enabled: bool) -> None:
+    REGISTRY.enabled = enabled
+
+
+def stage_timer(stage: str) -> AbstractContextManager[None]:
+    if not REGISTRY.enabled:
+        return _NULL_CONTEXT
+    return _timed(stage)
+
+
+@contextmanager
+def _timed(stage: str) -> Iterator[None]:
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        STAGE_LATENCY.observe(time.perf_counter() - started, stage=stage)
+
+
+def record_ingest_batch(size: int) -> None:
+    if not REGISTRY.enabled:
+        return
+    INGEST_BATCH_SIZE.observe(size)
+    INGESTED_FINDINGS.inc(size)
+
+
+def record_cache_lookup(cache: str, hit: bool, count: int = 1) -> None:
+    if not REGISTRY.enabled or count <= 0:
+        return
+    CACHE_REQUESTS.inc(count, cache=cache, result="hit" if hit else "miss")
+
+
+def record_shed_request(reason: str) -> None:
+    if not REGISTRY.enabled:
+        return
+    SHED_REQUESTS.inc(reason=reason)
+
+
+@contextmanager
+def track_request_queries() -> Iterator[list[int]]:
+    counter = [0]
+    token = _request_queries.set(counter)
+    try:
+        yield counter
+    finally:
+        _request_queries.reset(token)
+
+
+def count_query(*_: Any) -> None:
+    counter = _request_queries.get()
+    if counter is not None:
+        counter[0] += 1
+
+
+def instrument_engine(engine: Any) -> None:
+    from sqlalchemy import event
+
+    if not event.contains(engine, "before_cursor_execute", count_query):
+        event.listen(engine, "before_cursor_execute", count_query)
+
+
+def _cache_hit_ratios() -> dict[LabelKey, float]:
+    totals: dict[str, list[float]] = {}
+    for key, value in CACHE_REQUESTS.snapshot().items():
+        labels = dict(key)
+        hits_and_total = totals.setdefault(labels.get("cache", ""), [0.0, 0.0])
+        if labels.get("result") == "hit":
+            hits_and_total[0] += value
+        hits_and_total[1] += value
+    return {
+        (("cache", cache),): hits / total
+        for cache, (hits, total) in totals.items()
+        if total
+    }
@@ -1,6 +1,108 @@
+from collections import OrderedDict
+from collections.abc import Callable, Collection, Iterable, Iterator
+from dataclasses import replace
+from datetime import UTC, datetime, timedelta
+from threading import Lock
+
 from saastesa.core.models import SecurityFinding, ThreatSignal
-from saastesa.core.risk_scoring import build_finding
+from saastesa.core.risk_scoring import build_finding, finding_fingerprint
+from saastesa.metrics import record_cache_lookup
+
+FingerprintLookup = Callable[[Collection[str], datetime], dict[str, tuple[str, datetime]]]
+
+
+def analyze_signals(signals: Iterable[ThreatSignal]) -> list[SecurityFinding]:
+    return list(iter_findings(signals))
+
+
+def iter_findings(signals: Iterable[ThreatSignal]) -> Iterator[SecurityFinding]:
+    for signal in signals:
+        yield build_finding(signal)
+
+
+class FindingCoalescer:
+    def __init__(
+        self,
+        window: timedelta,
+        max_entries: int = 10000,
+        lookup: FingerprintLookup | None = None,
+    ) -> None:
+        self.window = window
+        self.max_entries = max(max_entries, 1)
+        self.lookup = lookup
+        self._lock = Lock()
+        self._recent: OrderedDict[tuple[str, str], tuple[str, datetime]] = OrderedDict()
+
+    @property
+    def enabled(self) -> bool:
+        return self.window > timedelta(0)
+
+    def coalesce(
+        self,
+        findings: Iterable[SecurityFinding],
+        tenant_id: str = "",
+        lookup: FingerprintLookup | None = None,
+    ) -> list[SecurityFinding]:
+        if not self.enabled:
+            return list(findings)
+
+        findings = list(findings)
+        keys = [
+            ((tenant_id, finding_fingerprint(finding)), _as_utc(finding.time))
+            for finding in findings
+        ]
+        with self._lock:
+            missed = {key for key, seen_at in keys if self._cached_uid(key, seen_at) is None}
+        known = self._lookup(lookup or self.lookup, keys, missed)
+
+        coalesced: list[SecurityFinding] = []
+        with self._lock:
+            for finding, (key, seen_at) in zip(findings, keys, strict=True):
+                finding_uid = self._cached_uid(key, seen_at)
+                record_cache_lookup("dedup", finding_uid is not None)
+                if finding_uid is None:
+                    match = known.get(key[1])
+                    if match is not None and _as_utc(match[1]) >= seen_at - self.window:
+                        finding_uid = match[0]
+                    else:
+                        finding_uid = finding.finding_uid
+                self._remember(key, finding_uid, seen_at)
+                coalesced.append(replace(finding, finding_uid=finding_uid, last_seen=finding.time))
+        return coalesced
+
+    def _lookup(
+        self,
+        lookup: FingerprintLookup | None,
+        keys: list[tuple[tuple[str, str], datetime]],
+        missed: set[tuple[str, str]],
+    ) -> dict[str, tuple[str, datetime]]:
+        if lookup is None or not missed:
+            return {}
+        since = min(seen_at for key, seen_at in keys if key in missed) - self.window
+        return lookup({key[1] for key in missed}, since)
+
+    def _cached_uid(self, key: tuple[str, str], seen_at: datetime) -> str | None:
+        cached = self._recent.get(key)
+        if cached is None:
+            return None
+
+        finding_uid, last_seen = cached
+        if abs(seen_at - last_seen) > self.window:
+            del self._recent[key]
+            return None
+        return finding_uid
+
+    def _remember(self, key: tuple[str, str], finding_uid: str, seen_at: datetime) -> None:
+        cached = self._recent.get(key)
+        if cached is not None and cached[1] > seen_at:
+            seen_at = cached[1]
+        self._recent[key] = (finding_uid, seen_at)
+        self._recent.move_to_end(key)
+        while len(self._recent) > self.max_entries:
+            self._recent.popitem(last=False)
 
 
-def analyze_signals(signals: list[ThreatSignal]) -> list[SecurityFinding]:
-    return [build_finding(signal) for signal in signals]
+def _as_utc(value: datetime) -> datetime:
+    if value.tzinfo is None:
+        return value.replace(tzinfo=UTC)
+    return value.astimezone(UTC)
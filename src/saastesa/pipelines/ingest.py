@@ -1,9 +1,26 @@
-from collections.abc import Iterable
+from collections.abc import Iterable, Iterator
+from itertools import islice
+from typing import TypeVar
 
 from saastesa.connectors.base import ThreatSignalProvider
 from saastesa.core.models import ThreatSignal
 
+T = TypeVar("T")
+
 
 def ingest_signals(provider: ThreatSignalProvider) -> list[ThreatSignal]:
+    return list(iter_signals(provider))
+
+
+def iter_signals(provider: ThreatSignalProvider) -> Iterator[ThreatSignal]:
     signals: Iterable[ThreatSignal] = provider.fetch_signals()
-    return list(signals)
+    return iter(signals)
+
+
+def chunked(items: Iterable[T], size: int) -> Iterator[list[T]]:
+    if size <= 0:
+        raise ValueError("Chunk size must be positive.")
+
+    iterator = iter(items)
+    while chunk := list(islice(iterator, size)):
+        yield chunk
@@ -0,0 +1,71 @@
+import sys
+from collections.abc import Iterable
+from typing import Protocol, TextIO
+
+from saastesa.core.models import SecurityFinding, ThreatSignal
+from saastesa.core.risk_scoring import RISK_BUCKETS, summarize_scores
+from saastesa.metrics import record_ingest_batch
+from saastesa.pipelines.analyze import iter_findings
+from saastesa.pipelines.ingest import chunked
+
+DEFAULT_CHUNK_SIZE = 500
+
+
+class FindingSink(Protocol):
+    def write(self, findings: list[SecurityFinding]) -> None:
+        ...
+
+
+class FindingStoreWriter(Protocol):
+    def add(self, findings: list[SecurityFinding]) -> None:
+        ...
+
+
+class FindingApiWriter(Protocol):
+    def send_security_findings(self, findings: Iterable[SecurityFinding]) -> dict[str, object]:
+        ...
+
+
+class StoreSink:
+    def __init__(self, store: FindingStoreWriter) -> None:
+        self.store = store
+
+    def write(self, findings: list[SecurityFinding]) -> None:
+        self.store.add(findings)
+
+
+class ApiClientSink:
+    def __init__(self, client: FindingApiWriter) -> None:
+        self.client = client
+
+    def write(self, findings: list[SecurityFinding]) -> None:
+        self.client.send_security_findings(findings)
+
+
+class ConsoleSink:
+    def __init__(self, stream: TextIO | None = None) -> None:
+        self.stream = stream or sys.stdout
+        self.summary = dict.fromkeys(RISK_BUCKETS, 0)
+
+    def write(self, findings: list[SecurityFinding]) -> None:
+        for finding in findings:
+            print(
+                f"[{finding.risk_score}] {finding.title} ({finding.domain}/{finding.type_name}) :: "
+                f"{finding.description}",
+                file=self.stream,
+            )
+        for bucket, count in summarize_scores(findings).items():
+            self.summary[bucket] += count
+
+
+def stream_findings(
+    signals: Iterable[ThreatSignal],
+    sink: FindingSink,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> int:
+    written = 0
+    for chunk in chunked(iter_findings(signals), chunk_size):
+        sink.write(chunk)
+        record_ingest_batch(len(chunk))
+        written += len(chunk)
+    return written
@@ -1,42 +1,113 @@
 from collections.abc import Iterable
 from dataclasses import asdict
 from datetime import datetime
+import time
 from typing import cast
 from typing import Any
+import uuid
 
 import httpx
 
-from saastesa.core.models import ThreatSignal
+from saastesa.core.models import SecurityFinding, ThreatSignal
+from saastesa.wire import (
+    IDEMPOTENCY_HEADER,
+    MSGPACK_MEDIA_TYPE,
+    WireFormat,
+    is_msgpack,
+    packb,
+    require_msgpack,
+    unpackb,
+)
+
+
+RETRYABLE_STATUS_CODES = frozenset({409, 429, 502, 503, 504})
 
 
 class TESAApiClient:
-    def __init__(self, base_url: str, timeout: float = 10.0) -> None:
+    def __init__(
+        self,
+        base_url: str,
+        timeout: float = 10.0,
+        wire_format: WireFormat = "json",
+        retries: int = 2,
+        retry_backoff_seconds: float = 0.5,
+    ) -> None:
         self.base_url = base_url.rstrip("/")
         self.timeout = timeout
+        self.wire_format = wire_format
+        self.retries = max(retries, 0)
+        self.retry_backoff_seconds = retry_backoff_seconds
+        if wire_format == "msgpack":
+            require_msgpack()
 
     def _serialize_signal(self, signal: ThreatSignal) -> dict[str, Any]:
         payload = asdict(signal)
         detected_at = payload.get("detected_at")
-        if isinstance(detected_at, datetime):
+        if isinstance(detected_at, datetime) and self.wire_format == "json":
             payload["detected_at"] = detected_at.isoformat()
         return payload
 
+    def _serialize_finding(self, finding: SecurityFinding) -> dict[str, Any]:
+        payload = asdict(finding)
+        if self.wire_format == "json":
+            payload["time"] = finding.time.isoformat()
+            if finding.last_seen is not None:
+                payload["last_seen"] = finding.last_seen.isoformat()
+        payload["references"] = {
+            reference_type: list(values) for reference_type, values in payload["references"].items()
+        }
+        return payload
+
     def send_signals(self, signals: Iterable[ThreatSignal]) -> dict[str, Any]:
         payload = {"signals": [self._serialize_signal(signal) for signal in signals]}
-        with httpx.Client(timeout=self.timeout) as client:
-            response = client.post(f"{self.base_url}/api/v1/signals", json=payload)
-            response.raise_for_status()
-            return cast(dict[str, Any], response.json())
+        return self._post("/api/v1/signals", payload)
 
     def send_findings(self, findings: Iterable[dict[str, Any]]) -> dict[str, Any]:
-        payload = {"findings": list(findings)}
+        return self._post("/api/v1/findings", {"findings": list(findings)})
+
+    def send_security_findings(self, findings: Iterable[SecurityFinding]) -> dict[str, Any]:
+        return self.send_findings(self._serialize_finding(finding) for finding in findings)
+
+    def get_summary(self) -> dict[str, Any]:
         with httpx.Client(timeout=self.timeout) as client:
-            response = client.post(f"{self.base_url}/api/v1/findings", json=payload)
+            response = client.get(f"{self.base_url}/api/v1/summary")
             response.raise_for_status()
             return cast(dict[str, Any], response.json())
 
-    def get_summary(self) -> dict[str, Any]:
+    def _post(self, path: str, payload: dict[str, Any]) -> dict[str, Any]:
+        headers = {IDEMPOTENCY_HEADER: str(uuid.uuid4())}
+        if self.wire_format == "msgpack":
+            content = packb(payload)
+            headers.update({"Content-Type": MSGPACK_MEDIA_TYPE, "Accept": MSGPACK_MEDIA_TYPE})
         with httpx.Client(timeout=self.timeout) as client:
-            response = client.get(f"{self.base_url}/api/v1/summary")
+            for attempt in range(self.retries + 1):
+                last_attempt = attempt == self.retries
+                try:
+                    if self.wire_format == "msgpack":
+                        response = client.post(
+                            f"{self.base_url}{path}", content=content, headers=headers
+                        )
+                    else:
+                        response = client.post(
+                            f"{self.base_url}{path}", json=payload, headers=headers
+                        )
+                except httpx.TransportError:
+                    if last_attempt:
+                        raise
+                    time.sleep(self.retry_backoff_seconds * (attempt + 1))
+                    continue
+                if response.status_code in RETRYABLE_STATUS_CODES and not last_attempt:
+                    time.sleep(_retry_after(response, self.retry_backoff_seconds * (attempt + 1)))
+                    continue
+                break
             response.raise_for_status()
+            if is_msgpack(response.headers.get("content-type")):
+                return cast(dict[str, Any], unpackb(response.content))
             return cast(dict[str, Any], response.json())
+
+
+def _retry_after(response: httpx.Response, default: float) -> float:
+    try:
+        return max(float(response.headers.get("Retry-After", default)), 0.0)
+    except ValueError:
+        return default
@@ -1,7 +1,8 @@
 from saastesa.connectors.base import ThreatSignalProvider
 from saastesa.core.models import SecurityFinding
 from saastesa.pipelines.analyze import analyze_signals
-from saastesa.pipelines.ingest import ingest_signals
+from saastesa.pipelines.ingest import ingest_signals, iter_signals
+from saastesa.pipelines.stream import DEFAULT_CHUNK_SIZE, FindingSink, stream_findings
 
 
 class TESAService:
@@ -11,3 +12,6 @@ class TESAService:
     def run_once(self) -> list[SecurityFinding]:
         signals = ingest_signals(self.provider)
         return analyze_signals(signals)
+
+    def run_streaming(self, sink: FindingSink, chunk_size: int = DEFAULT_CHUNK_SIZE) -> int:
+        return stream_findings(iter_signals(self.provider), sink, chunk_size=chunk_size)
@@ -0,0 +1,69 @@
+from datetime import UTC, datetime
+from typing import Any, Literal
+
+IDEMPOTENCY_HEADER = "Idempotency-Key"
+JSON_MEDIA_TYPE = "application/json"
+MSGPACK_MEDIA_TYPE = "application/msgpack"
+
+WireFormat = Literal["json", "msgpack"]
+
+
+class WireFormatUnavailableError(RuntimeError):
+    pass
+
+
+def msgpack_available() -> bool:
+    try:
+        require_msgpack()
+    except WireFormatUnavailableError:
+        return False
+    return True
+
+
+def require_msgpack() -> None:
+    _msgpack()
+
+
+def packb(payload: Any) -> bytes:
+    return bytes(_msgpack().packb(payload, datetime=True, default=_encode))
+
+
+def unpackb(data: bytes) -> Any:
+    return _msgpack().unpackb(data, timestamp=3)
+
+
+def is_msgpack(content_type: str | None) -> bool:
+    return _media_type(content_type or "") == MSGPACK_MEDIA_TYPE
+
+
+def accepts_msgpack(accept: str | None) -> bool:
+    for value in (accept or "").split(","):
+        media_type, *params = value.split(";")
+        if _media_type(media_type) != MSGPACK_MEDIA_TYPE:
+            continue
+        name, _, quality = params[0].partition("=") if params else ("q", "", "1")
+        try:
+            return name.strip() != "q" or float(quality) > 0
+        except ValueError:
+            return True
+    return False
+
+
+def _media_type(value: str) -> str:
+    return value.split(";", 1)[0].strip().lower()
+
+
+def _encode(value: object) -> Any:
+    if isinstance(value, datetime):
+        return _msgpack().Timestamp.from_datetime(value.replace(tzinfo=UTC))
+    raise TypeError(f"Cannot encode {type(value).__name__} as MessagePack.")
+
+
+def _msgpack() -> Any:
+    try:
+        import msgpack
+    except ImportError as error:
+        raise WireFormatUnavailableError(
+            "MessagePack requires msgpack; install saastesa[msgpack]."
+        ) from error
+    return msgpack
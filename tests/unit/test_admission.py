@@ -0,0 +1,58 @@
+import pytest
+from fastapi.testclient import TestClient
+
+from saastesa.api.admission import AdmissionController, AdmissionRejectedError
+from saastesa.api.main import create_app
+from saastesa.api.tenancy import TENANT_HEADER
+
+
+def test_token_bucket_refills_per_client() -> None:
+    now = [0.0]
+    controller = AdmissionController(rate_per_second=2, burst=2, clock=lambda: now[0])
+
+    for _ in range(2):
+        with controller.admit("agent-a"):
+            pass
+    with pytest.raises(AdmissionRejectedError) as rejected:
+        with controller.admit("agent-a"):
+            pass
+    with controller.admit("agent-b"):
+        pass
+
+    assert rejected.value.reason == "rate_limit"
+    assert rejected.value.retry_after == pytest.approx(0.5)
+    assert rejected.value.retry_after_header == "1"
+    now[0] = 0.5
+    with controller.admit("agent-a"):
+        pass
+
+
+def test_in_flight_cap_sheds_until_work_finishes() -> None:
+    controller = AdmissionController(rate_per_second=0, max_in_flight=1)
+
+    with controller.admit("agent-a"):
+        with pytest.raises(AdmissionRejectedError) as rejected:
+            with controller.admit("agent-b"):
+                pass
+    with controller.admit("agent-b"):
+        assert controller.in_flight == 1
+
+    assert rejected.value.reason == "in_flight"
+    assert controller.in_flight == 0
+
+
+def test_ingest_routes_return_429_while_reads_pass(tmp_path, monkeypatch) -> None:
+    monkeypatch.setenv("TESA_INGEST_RATE_PER_SECOND", "0.01")
+    monkeypatch.setenv("TESA_INGEST_BURST", "2")
+    client = TestClient(create_app(database_url=f"sqlite+pysqlite:///{tmp_path / 'shed.db'}"))
+    payload = {"findings": []}
+
+    statuses = [client.post("/api/v1/findings", json=payload).status_code for _ in range(3)]
+    shed = client.post("/api/v1/signals", json={"signals": []})
+    other_tenant = client.post("/api/v1/findings", json=payload, headers={TENANT_HEADER: "beta"})
+
+    assert statuses == [200, 200, 429]
+    assert shed.status_code == 429
+    assert int(shed.headers["Retry-After"]) >= 1
+    assert other_tenant.status_code == 429
+    assert all(client.get("/api/v1/summary").status_code == 200 for _ in range(5))
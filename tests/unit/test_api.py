@@ -1,4 +1,4 @@
-from datetime import UTC, datetime
+from datetime import UTC, datetime, timedelta
 
 from fastapi.testclient import TestClient
 
@@ -87,3 +87,63 @@ def test_direct_standardized_finding_ingest() -> None:
     response = client.post("/api/v1/findings", json=payload)
     assert response.status_code == 200
     assert response.json()["ingested"] == 1
+
+    payload["findings"][0]["references"]["cwe"] = ["CWE-200", "CWE-284"]
+    assert client.post("/api/v1/findings", json=payload).status_code == 200
+    stored = client.get("/api/v1/findings").json()
+    assert len(stored) == 1
+    assert stored[0]["references"]["cwe"] == ["CWE-200", "CWE-284"]
+    assert stored[0]["references"]["mitre_attack"] == ["T1530"]
+
+    projected = client.get("/api/v1/findings?fields=title,risk_score,resource").json()
+    assert projected == [
+        {
+            "finding_uid": "finding-123",
+            "title": "Public bucket allows anonymous read",
+            "risk_score": 85,
+            "resource": payload["findings"][0]["resource"],
+        }
+    ]
+    assert client.get("/api/v1/findings?fields=raw_data,nope").status_code == 400
+
+    detail = client.get("/api/v1/findings/finding-123")
+    assert detail.status_code == 200
+    assert detail.json()["raw_data"] == {"region": "us-east-1"}
+    assert detail.json()["description"] == "Storage bucket is publicly readable."
+    assert client.get("/api/v1/findings/missing").status_code == 404
+
+
+def test_repeated_signals_coalesce_into_one_finding() -> None:
+    client = TestClient(create_app())
+    first_seen = datetime.now(tz=UTC)
+    for offset in (0, 30, 60):
+        payload = {
+            "signals": [
+                {
+                    "source": "iam",
+                    "signal_type": "stale_admin_credential",
+                    "severity": 5,
+                    "detected_at": (first_seen + timedelta(seconds=offset)).isoformat(),
+                    "metadata": {"asset_id": "user-42"},
+                }
+            ]
+        }
+        assert client.post("/api/v1/signals", json=payload).status_code == 200
+
+    findings = client.get("/api/v1/findings").json()
+    assert len(findings) == 1
+    assert findings[0]["occurrence_count"] == 3
+    assert findings[0]["last_seen"].startswith(
+        (first_seen + timedelta(seconds=60)).isoformat()[:19]
+    )
+
+
+def test_app_defers_database_work_until_first_store_access(tmp_path) -> None:
+    db_path = tmp_path / "lazy.db"
+    client = TestClient(create_app(database_url=f"sqlite+pysqlite:///{db_path}"))
+
+    assert client.get("/health").status_code == 200
+    assert not db_path.exists()
+
+    assert client.get("/api/v1/summary").status_code == 200
+    assert db_path.exists()
@@ -0,0 +1,36 @@
+from benchmarks.report import compare_reports
+from benchmarks.suite import run
+
+
+def test_suite_reports_every_stage_for_each_backend(tmp_path) -> None:
+    report = run(
+        sizes=[20],
+        database_urls={"sqlite": f"sqlite+pysqlite:///{tmp_path / 'bench.db'}"},
+        batch_size=10,
+        repeat=1,
+        seed=7,
+    )
+
+    results = report["results"]
+    assert results["analyze/20/analyze_signals"]["rows"] == 20
+    assert results["sqlite/20/store_insert"]["rows_per_second"] > 0
+    assert results["memory/20/columnar_insert"]["rows"] == 20
+    for name in ("store_upsert", "store_list_100", "store_summary", "http_list_100"):
+        assert results[f"sqlite/20/{name}"]["median_ms"] >= 0
+
+
+def test_compare_reports_flags_regressions_over_threshold() -> None:
+    baseline = {"results": {"fast": {"median_ms": 10.0}, "slow": {"median_ms": 10.0}}}
+    current = {
+        "results": {
+            "fast": {"median_ms": 11.0},
+            "slow": {"median_ms": 15.0},
+            "new": {"median_ms": 1.0},
+        }
+    }
+
+    comparison = compare_reports(current, baseline, max_regression_pct=20.0)
+
+    assert comparison["regressions"] == ["slow"]
+    assert comparison["changes"]["fast"]["change_pct"] == 10.0
+    assert "new" not in comparison["changes"]
@@ -0,0 +1,94 @@
+import gc
+import random
+import tracemalloc
+from datetime import UTC, datetime, timedelta
+
+from saastesa.api.columnar import ColumnarFindingStore
+from saastesa.api.importer import findings_from_payload
+from saastesa.api.repository import InMemoryFindingStore
+from saastesa.api.schemas import SecurityFindingOut
+from saastesa.core.contracts import FindingDomain, FindingStatus
+from saastesa.core.models import SecurityFinding, ThreatSignal
+from saastesa.core.risk_scoring import build_finding, summarize_scores
+from saastesa.demo.seed import iter_demo_findings
+
+
+def _demo_findings(count: int, seed: int = 3) -> list[SecurityFinding]:
+    return findings_from_payload(
+        SecurityFindingOut.model_validate(payload)
+        for payload in iter_demo_findings(count=count, rng=random.Random(seed))
+    )
+
+
+def test_columnar_store_round_trips_findings_in_insertion_order() -> None:
+    findings = _demo_findings(200)
+    naive = build_finding(
+        ThreatSignal("iam", "mfa_disabled", 4, datetime(2026, 1, 1, 12, 0), {"nested": {"a": 1}})
+    )
+    store = ColumnarFindingStore()
+    store.add([*findings, naive])
+
+    listed = store.list(limit=5)
+    assert listed[:-1] == findings[-4:]
+    assert listed[-1].time == datetime(2026, 1, 1, 12, 0, tzinfo=UTC)
+    assert listed[-1].raw_data == {"nested": {"a": 1}}
+    assert store.summary() == summarize_scores([*findings, naive])
+
+
+def test_ring_buffer_evicts_oldest_and_releases_dictionary_entries() -> None:
+    findings = _demo_findings(25)
+    store = ColumnarFindingStore(capacity=10)
+    store.add(findings)
+
+    assert len(store) == 10
+    assert store.list(limit=100) == findings[-10:]
+    assert store.list(limit=3) == findings[-3:]
+    assert store.summary() == summarize_scores(findings[-10:])
+    assert len(store._strings) <= 10 * len(store._string_codes)
+
+
+def test_filters_match_row_by_row_evaluation() -> None:
+    findings = _demo_findings(500, seed=11)
+    store = ColumnarFindingStore(capacity=300)
+    store.add(findings)
+    window = findings[-300:]
+
+    statuses = (FindingStatus.OPEN, FindingStatus.IN_PROGRESS)
+    domains = (FindingDomain.CLOUD,)
+    expected = [
+        finding
+        for finding in window
+        if finding.status in statuses and finding.domain in domains and finding.risk_score >= 40
+    ]
+
+    assert store.summary(statuses, domains, min_risk_score=40) == summarize_scores(expected)
+    assert store.list(limit=7, statuses=statuses, domains=domains, min_risk_score=40) == (
+        expected[-7:]
+    )
+    assert store.list(min_risk_score=1000) == []
+
+
+def test_columnar_store_uses_a_fraction_of_the_list_store_memory() -> None:
+    def retained_bytes(store: InMemoryFindingStore | ColumnarFindingStore) -> int:
+        gc.collect()
+        tracemalloc.start()
+        store.add(_demo_findings(5000))
+        gc.collect()
+        current, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        return current
+
+    list_bytes = retained_bytes(InMemoryFindingStore())
+    columnar_bytes = retained_bytes(ColumnarFindingStore())
+
+    assert columnar_bytes < list_bytes * 0.4
+
+
+def test_timestamps_survive_microsecond_precision() -> None:
+    seen = datetime(2026, 3, 1, tzinfo=UTC) + timedelta(microseconds=123457)
+    finding = build_finding(ThreatSignal("edr", "malware", 5, seen, {}))
+    store = ColumnarFindingStore()
+    store.add([finding])
+
+    assert store.list()[0].time == seen
+    assert store.list()[0].last_seen is None
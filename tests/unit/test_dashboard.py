@@ -0,0 +1,63 @@
+from datetime import UTC, datetime, timedelta
+
+import pytest
+from fastapi.testclient import TestClient
+
+from saastesa.api.main import create_app
+from saastesa.api.repository import SQLAlchemyFindingStore
+
+
+def _signals(count: int, offset: int = 0) -> dict[str, list[dict[str, object]]]:
+    started = datetime(2026, 6, 1, tzinfo=UTC)
+    return {
+        "signals": [
+            {
+                "source": ("iam", "sast", "edr")[index % 3],
+                "signal_type": f"signal_{index}",
+                "severity": 1 + index % 5,
+                "detected_at": (started + timedelta(minutes=index)).isoformat(),
+                "metadata": {"owner": "appsec" if index % 2 else "sre"},
+            }
+            for index in range(offset, offset + count)
+        ]
+    }
+
+
+def test_dashboard_combines_summary_facets_recent_and_resources(tmp_path) -> None:
+    client = TestClient(create_app(database_url=f"sqlite+pysqlite:///{tmp_path / 'dash.db'}"))
+    client.post("/api/v1/signals", json=_signals(9)).raise_for_status()
+
+    dashboard = client.get("/api/v1/dashboard", params={"limit": 4, "top_resources": 2}).json()
+    findings = client.get("/api/v1/findings").json()
+
+    assert dashboard["summary"] == client.get("/api/v1/summary").json()
+    assert sum(dashboard["facets"]["domain"].values()) == 9
+    assert dashboard["facets"]["severity"] == {
+        severity: sum(finding["severity"] == severity for finding in findings)
+        for severity in {finding["severity"] for finding in findings}
+    }
+    assert [item["finding_uid"] for item in dashboard["recent"]] == [
+        finding["finding_uid"] for finding in findings[-4:]
+    ]
+    assert "raw_data" not in dashboard["recent"][0]
+    assert [entry["resource"]["uid"] for entry in dashboard["top_resources"]] == ["sast", "edr"]
+    assert dashboard["top_resources"][0]["findings"] == 3
+
+    filtered = client.get("/api/v1/dashboard", params={"raw.owner": "appsec"}).json()
+    assert sum(filtered["facets"]["severity"].values()) == 4
+
+
+def test_dashboard_is_cached_until_the_store_is_written(tmp_path, monkeypatch) -> None:
+    client = TestClient(create_app(database_url=f"sqlite+pysqlite:///{tmp_path / 'dash.db'}"))
+    client.post("/api/v1/signals", json=_signals(3)).raise_for_status()
+    first = client.get("/api/v1/dashboard").json()
+
+    built = SQLAlchemyFindingStore.dashboard
+    monkeypatch.setattr(
+        SQLAlchemyFindingStore, "dashboard", lambda *args, **kwargs: pytest.fail("cache missed")
+    )
+    assert client.get("/api/v1/dashboard").json() == first
+
+    monkeypatch.setattr(SQLAlchemyFindingStore, "dashboard", built)
+    client.post("/api/v1/signals", json=_signals(2, offset=3)).raise_for_status()
+    assert len(client.get("/api/v1/dashboard").json()["recent"]) == 5
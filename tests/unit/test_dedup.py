@@ -0,0 +1,92 @@
+from collections.abc import Collection
+from dataclasses import replace
+from datetime import UTC, datetime, timedelta
+
+from fastapi.testclient import TestClient
+
+from saastesa.api.main import create_app
+from saastesa.core.models import SecurityFinding, ThreatSignal
+from saastesa.core.risk_scoring import build_finding, finding_fingerprint
+from saastesa.pipelines.analyze import FindingCoalescer
+from saastesa.sdk.api_client import TESAApiClient
+
+
+def _finding(signal_type: str, detected_at: datetime, asset_id: str = "asset-1") -> SecurityFinding:
+    metadata = {"asset_id": asset_id, "cwe": ["CWE-284"]}
+    return build_finding(ThreatSignal("cspm", signal_type, 4, detected_at, metadata))
+
+
+def test_fingerprint_ignores_detection_time() -> None:
+    now = datetime.now(tz=UTC)
+    first = _finding("public_bucket", now)
+    repeat = _finding("public_bucket", now + timedelta(minutes=5))
+    other_asset = _finding("public_bucket", now, asset_id="asset-2")
+
+    assert first.finding_uid != repeat.finding_uid
+    assert finding_fingerprint(first) == finding_fingerprint(repeat)
+    assert finding_fingerprint(first) != finding_fingerprint(other_asset)
+
+
+def test_coalescer_reuses_uid_within_window_only() -> None:
+    now = datetime.now(tz=UTC)
+    coalescer = FindingCoalescer(window=timedelta(minutes=10))
+
+    first, repeat, late = coalescer.coalesce(
+        [
+            _finding("public_bucket", now),
+            _finding("public_bucket", now + timedelta(minutes=5)),
+            _finding("public_bucket", now + timedelta(minutes=30)),
+        ]
+    )
+
+    assert repeat.finding_uid == first.finding_uid
+    assert repeat.last_seen == now + timedelta(minutes=5)
+    assert late.finding_uid != first.finding_uid
+
+
+def test_coalescer_falls_back_to_one_batched_lookup_after_eviction() -> None:
+    now = datetime.now(tz=UTC)
+    lookups: list[set[str]] = []
+    known_uid = "existing-finding"
+
+    def lookup(fingerprints: Collection[str], since: datetime) -> dict[str, tuple[str, datetime]]:
+        lookups.append(set(fingerprints))
+        return {fingerprint: (known_uid, now) for fingerprint in fingerprints if since <= now}
+
+    coalescer = FindingCoalescer(window=timedelta(minutes=10), max_entries=1, lookup=lookup)
+    coalescer.coalesce([_finding("public_bucket", now), _finding("open_port", now)])
+    repeat, stale = coalescer.coalesce(
+        [
+            _finding("public_bucket", now + timedelta(minutes=1)),
+            _finding("exposed_key", now + timedelta(minutes=30)),
+        ]
+    )
+
+    assert repeat.finding_uid == known_uid
+    assert stale.finding_uid != known_uid
+    assert [len(fingerprints) for fingerprints in lookups] == [2, 2]
+
+
+def test_disabled_coalescer_passes_findings_through() -> None:
+    finding = _finding("public_bucket", datetime.now(tz=UTC))
+    coalescer = FindingCoalescer(window=timedelta(0))
+
+    assert coalescer.coalesce([finding]) == [finding]
+
+
+def test_sdk_sends_last_seen_as_json(tmp_path, monkeypatch) -> None:
+    client = TestClient(create_app(database_url=f"sqlite+pysqlite:///{tmp_path / 'sdk.db'}"))
+    monkeypatch.setattr("saastesa.sdk.api_client.httpx.Client", lambda timeout: client)
+    detected_at = datetime(2026, 5, 1, 8, tzinfo=UTC)
+    finding = replace(
+        _finding("public_bucket", detected_at),
+        occurrence_count=3,
+        last_seen=detected_at + timedelta(hours=2),
+    )
+
+    result = TESAApiClient("http://testserver").send_security_findings([finding])
+
+    assert result["ingested"] == 1
+    stored = client.get("/api/v1/findings").json()[0]
+    assert stored["occurrence_count"] == 3
+    assert datetime.fromisoformat(stored["last_seen"]).replace(tzinfo=UTC) == finding.last_seen
@@ -0,0 +1,94 @@
+import json
+from datetime import UTC, datetime, timedelta
+
+import pytest
+from fastapi.testclient import TestClient
+
+from saastesa.api.db import create_db_engine
+from saastesa.api.main import create_app
+from saastesa.api.projection import FINDING_FIELDS
+from saastesa.api.repository import SQLAlchemyFindingStore
+from saastesa.cli import main
+from saastesa.core.models import ThreatSignal
+from saastesa.core.risk_scoring import build_finding
+
+pa = pytest.importorskip("pyarrow")
+pq = pytest.importorskip("pyarrow.parquet")
+
+
+def _seed(database_url: str, count: int) -> list[str]:
+    store = SQLAlchemyFindingStore(create_db_engine(database_url))
+    store.init()
+    started = datetime(2026, 3, 1, tzinfo=UTC)
+    findings = [
+        build_finding(
+            ThreatSignal(
+                "sast",
+                f"signal_{index}",
+                1 + index % 5,
+                started + timedelta(minutes=index),
+                {"cve": [f"CVE-2026-{index:04d}"], "owner": "appsec" if index % 2 else "sre"},
+            )
+        )
+        for index in range(count)
+    ]
+    store.add(findings)
+    return [finding.finding_uid for finding in findings]
+
+
+def test_cli_exports_parquet_in_bounded_batches(tmp_path) -> None:
+    database_url = f"sqlite+pysqlite:///{tmp_path / 'export.db'}"
+    uids = _seed(database_url, 25)
+    output = tmp_path / "findings.parquet"
+
+    assert main(["export", str(output), "--database-url", database_url, "--batch-size", "10"]) == 0
+
+    parquet = pq.ParquetFile(output)
+    table = parquet.read()
+    assert table.column_names == list(FINDING_FIELDS)
+    assert table.column("finding_uid").to_pylist() == uids
+    assert pa.types.is_dictionary(table.schema.field("severity").type)
+    assert table.column("time").type == pa.timestamp("us", tz="UTC")
+    first = table.slice(0, 1).to_pylist()[0]
+    assert first["references"]["cve"] == ["CVE-2026-0000"]
+    assert first["resource"]["uid"] == "sast"
+    assert json.loads(first["raw_data"])["owner"] == "sre"
+
+
+def test_cli_export_applies_fields_and_raw_filters(tmp_path) -> None:
+    database_url = f"sqlite+pysqlite:///{tmp_path / 'export.db'}"
+    _seed(database_url, 6)
+    output = tmp_path / "findings.arrows"
+
+    code = main(
+        [
+            "export",
+            str(output),
+            "--database-url",
+            database_url,
+            "--fields",
+            "risk_score,domain",
+            "--raw",
+            "owner=appsec",
+        ]
+    )
+
+    assert code == 0
+    table = pa.ipc.open_stream(output.read_bytes()).read_all()
+    assert table.column_names == ["finding_uid", "risk_score", "domain"]
+    assert table.num_rows == 3
+
+
+def test_export_route_streams_arrow_ipc(tmp_path) -> None:
+    database_url = f"sqlite+pysqlite:///{tmp_path / 'export.db'}"
+    uids = _seed(database_url, 12)
+    client = TestClient(create_app(database_url=database_url))
+
+    response = client.get("/api/v1/findings/export", params={"batch_size": 100})
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/vnd.apache.arrow.stream"
+    table = pa.ipc.open_stream(response.content).read_all()
+    assert table.column("finding_uid").to_pylist() == uids
+    assert table.column("status").to_pylist() == ["open"] * 12
+    assert client.get("/api/v1/findings/export", params={"fields": "nope"}).status_code == 400
@@ -0,0 +1,75 @@
+import os
+from collections import Counter
+from datetime import UTC, datetime, timedelta
+
+import pytest
+from fastapi.testclient import TestClient
+
+from saastesa.api.db import create_db_engine
+from saastesa.api.main import create_app
+from saastesa.api.projection import FINDING_FACETS
+from saastesa.api.repository import SQLAlchemyFindingStore
+from saastesa.core.models import ThreatSignal
+from saastesa.core.risk_scoring import build_finding
+
+
+def _seed(store: SQLAlchemyFindingStore, count: int) -> None:
+    started = datetime(2026, 7, 1, tzinfo=UTC)
+    store.add(
+        [
+            build_finding(
+                ThreatSignal(
+                    ("iam", "sast", "edr")[index % 3],
+                    f"signal_{index}",
+                    1 + index % 5,
+                    started + timedelta(minutes=index),
+                    {"owner": "appsec" if index % 2 else "sre"},
+                )
+            )
+            for index in range(count)
+        ]
+    )
+
+
+def _expected(store: SQLAlchemyFindingStore) -> dict[str, dict[str, int]]:
+    findings = store.list(limit=1000)
+    return {
+        "domain": dict(Counter(str(finding.domain) for finding in findings)),
+        "severity": dict(Counter(str(finding.severity) for finding in findings)),
+        "status": dict(Counter(str(finding.status) for finding in findings)),
+        "source": dict(Counter(finding.source for finding in findings)),
+        "resource.platform": dict(Counter(finding.resource.platform for finding in findings)),
+    }
+
+
+def test_facets_route_counts_every_facet_with_list_filters(tmp_path) -> None:
+    database_url = f"sqlite+pysqlite:///{tmp_path / 'facets.db'}"
+    store = SQLAlchemyFindingStore(create_db_engine(database_url))
+    store.init()
+    _seed(store, 12)
+    client = TestClient(create_app(database_url=database_url))
+
+    response = client.get("/api/v1/facets")
+    filtered = client.get("/api/v1/facets", params={"facets": "source,status", "raw.owner": "sre"})
+
+    assert response.status_code == 200
+    assert response.json()["facets"] == _expected(store)
+    assert filtered.json()["facets"] == {
+        "status": {"open": 6},
+        "source": {"iam": 2, "sast": 2, "edr": 2},
+    }
+    assert client.get("/api/v1/facets", params={"facets": "owner"}).status_code == 400
+
+
+@pytest.mark.skipif(
+    not os.getenv("TESA_TEST_POSTGRES_URL"),
+    reason="Set TESA_TEST_POSTGRES_URL to check PostgreSQL grouping sets.",
+)
+def test_postgres_facets_use_grouping_sets() -> None:
+    store = SQLAlchemyFindingStore(
+        create_db_engine(os.environ["TESA_TEST_POSTGRES_URL"]), tenant_id="facets"
+    )
+    store.init()
+    _seed(store, 12)
+
+    assert store.facets(FINDING_FACETS) == _expected(store)
@@ -0,0 +1,87 @@
+from datetime import UTC, datetime
+
+import pytest
+from fastapi.testclient import TestClient
+
+from saastesa.api.db import create_db_engine
+from saastesa.api.filters import (
+    InvalidFilterError,
+    RawDataFilter,
+    parse_finding_filters,
+)
+from saastesa.api.main import create_app
+from saastesa.api.repository import SQLAlchemyFindingStore
+from saastesa.core.models import ThreatSignal
+from saastesa.core.risk_scoring import build_finding
+
+
+def test_parse_finding_filters_reads_raw_prefixed_params() -> None:
+    filters = parse_finding_filters(
+        [("limit", "10"), ("raw.owner", "appsec"), ("raw.cloud.region", "us-east-1")]
+    )
+
+    assert filters.raw_data == (
+        RawDataFilter(("owner",), "appsec"),
+        RawDataFilter(("cloud", "region"), "us-east-1"),
+    )
+    assert RawDataFilter(("exposed",), "true").candidates() == ("true", True)
+    assert RawDataFilter(("score",), "NaN").candidates() == ("NaN",)
+    assert RawDataFilter(("score",), "-Infinity").candidates() == ("-Infinity",)
+    assert RawDataFilter(("port",), "443").document(443) == {"port": 443}
+    assert not parse_finding_filters([("limit", "10")]).active
+    with pytest.raises(InvalidFilterError):
+        parse_finding_filters([("raw.owner;drop", "x")])
+
+
+def test_store_filters_raw_data_by_string_nested_and_scalar_values(tmp_path) -> None:
+    store = SQLAlchemyFindingStore(create_db_engine(f"sqlite+pysqlite:///{tmp_path / 'raw.db'}"))
+    store.init()
+    now = datetime.now(tz=UTC)
+    metadata = [
+        {"owner": "appsec", "cloud": {"region": "us-east-1"}, "internet_exposed": True},
+        {"owner": "platform", "cloud": {"region": "eu-west-1"}, "internet_exposed": False},
+        {"owner": "appsec", "port": 443},
+    ]
+    findings = [
+        build_finding(ThreatSignal("cspm", f"signal_{index}", 3, now, values))
+        for index, values in enumerate(metadata)
+    ]
+    store.add(findings)
+
+    def matching(*params: tuple[str, str]) -> list[str]:
+        filters = parse_finding_filters(params)
+        return [finding.finding_uid for finding in store.list(filters=filters)]
+
+    assert matching(("raw.owner", "appsec")) == [findings[0].finding_uid, findings[2].finding_uid]
+    assert matching(("raw.cloud.region", "eu-west-1")) == [findings[1].finding_uid]
+    assert matching(("raw.internet_exposed", "true")) == [findings[0].finding_uid]
+    assert matching(("raw.owner", "appsec"), ("raw.port", "443")) == [findings[2].finding_uid]
+    assert matching(("raw.owner", "nobody")) == []
+    summary = store.summary(parse_finding_filters([("raw.owner", "appsec")]))
+    assert sum(summary.values()) == 2
+
+
+def test_findings_api_applies_raw_filters(tmp_path) -> None:
+    client = TestClient(create_app(database_url=f"sqlite+pysqlite:///{tmp_path / 'api.db'}"))
+    now = datetime.now(tz=UTC).isoformat()
+    signals = [
+        {
+            "source": "cspm",
+            "signal_type": signal_type,
+            "severity": 4,
+            "detected_at": now,
+            "metadata": {"owner": owner},
+        }
+        for signal_type, owner in (("public_bucket", "appsec"), ("mfa_disabled", "identity"))
+    ]
+    assert client.post("/api/v1/signals", json={"signals": signals}).status_code == 200
+
+    owned = client.get("/api/v1/findings", params={"raw.owner": "appsec"}).json()
+    assert [finding["raw_data"]["owner"] for finding in owned] == ["appsec"]
+    projected = client.get(
+        "/api/v1/findings", params={"raw.owner": "identity", "fields": "title"}
+    ).json()
+    assert len(projected) == 1
+    summary = client.get("/api/v1/summary", params={"raw.owner": "appsec"}).json()
+    assert sum(summary.values()) == 1
+    assert client.get("/api/v1/findings", params={"raw.bad key": "x"}).status_code == 400
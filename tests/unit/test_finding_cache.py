@@ -0,0 +1,101 @@
+from dataclasses import replace
+from datetime import UTC, datetime, timedelta
+from typing import Any
+
+from sqlalchemy import Engine, event
+
+from saastesa.api.cache import FindingCache
+from saastesa.api.db import create_db_engine
+from saastesa.api.repository import SQLAlchemyFindingStore
+from saastesa.core.models import SecurityFinding, ThreatSignal
+from saastesa.core.risk_scoring import build_finding
+from saastesa.metrics import CACHE_REQUESTS, configure_metrics
+
+
+def _findings(count: int) -> list[SecurityFinding]:
+    now = datetime.now(tz=UTC)
+    return [
+        build_finding(
+            ThreatSignal(
+                "iam", f"signal_{index}", 1 + index % 5, now + timedelta(seconds=index), {}
+            )
+        )
+        for index in range(count)
+    ]
+
+
+def _uids(findings: list[SecurityFinding]) -> list[str]:
+    return [finding.finding_uid for finding in findings]
+
+
+def _count_statements(engine: Engine) -> list[str]:
+    statements: list[str] = []
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def record(*args: Any) -> None:
+        statements.append(args[2])
+
+    return statements
+
+
+def test_warm_list_only_fetches_ids(tmp_path) -> None:
+    engine = create_db_engine(f"sqlite+pysqlite:///{tmp_path / 'cache.db'}")
+    store = SQLAlchemyFindingStore(engine, cache=FindingCache())
+    store.init()
+    findings = _findings(20)
+    store.add(findings)
+
+    configure_metrics(True)
+    try:
+        hits_before = CACHE_REQUESTS.value(cache="findings", result="hit")
+        cold = store.list(limit=10)
+        statements = _count_statements(engine)
+        warm = store.list(limit=10)
+        hits = CACHE_REQUESTS.value(cache="findings", result="hit") - hits_before
+    finally:
+        configure_metrics(False)
+
+    assert cold == warm
+    assert _uids(warm) == _uids(findings[-10:])
+    assert len(statements) == 1
+    assert hits == 10
+
+
+def test_add_and_other_writers_invalidate_cached_findings(tmp_path) -> None:
+    engine = create_db_engine(f"sqlite+pysqlite:///{tmp_path / 'cache.db'}")
+    store = SQLAlchemyFindingStore(engine, cache=FindingCache())
+    other_worker = SQLAlchemyFindingStore(engine, cache=FindingCache())
+    store.init()
+    finding = _findings(1)[0]
+    store.add([finding])
+    assert store.list()[0].occurrence_count == 1
+
+    store.add([replace(finding, title="Renamed")])
+    assert store.list()[0].title == "Renamed"
+    assert store.list()[0].occurrence_count == 1
+
+    seen_again = finding.time + timedelta(minutes=5)
+    other_worker.add([replace(finding, last_seen=seen_again)])
+    other_worker.add([finding, store.list()[0]])
+    assert store.list()[0].occurrence_count == 2
+    assert store.list()[0].last_seen.replace(tzinfo=UTC) == seen_again
+
+    other_worker.add([replace(finding, title="Renamed elsewhere")])
+    assert store.list()[0].title == "Renamed elsewhere"
+
+
+def test_cache_is_bounded_and_keyed_by_tenant(tmp_path) -> None:
+    engine = create_db_engine(f"sqlite+pysqlite:///{tmp_path / 'cache.db'}")
+    cache = FindingCache(max_entries=5)
+    acme = SQLAlchemyFindingStore(engine, tenant_id="acme", cache=cache)
+    globex = SQLAlchemyFindingStore(engine, tenant_id="globex", cache=cache)
+    acme.init()
+    findings = _findings(8)
+    acme.add(findings)
+    globex.add(findings[:2])
+
+    assert _uids(acme.list(limit=10)) == _uids(findings)
+    assert len(cache) == 5
+    assert _uids(globex.list(limit=10)) == _uids(findings[:2])
+    assert len(cache) == 5
+
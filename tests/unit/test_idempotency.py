@@ -0,0 +1,139 @@
+from datetime import UTC, datetime, timedelta
+
+import httpx
+import pytest
+from fastapi.testclient import TestClient
+
+from saastesa.api.db import create_db_engine
+from saastesa.api.idempotency import (
+    IdempotencyKey,
+    IdempotencyKeyInUseError,
+    IdempotencyKeyReusedError,
+    IdempotencyStore,
+)
+from saastesa.api.main import create_app
+from saastesa.api.repository import SQLAlchemyFindingStore
+from saastesa.api.schemas import IngestFindingsResponse
+from saastesa.api.tenancy import TENANT_HEADER
+from saastesa.core.models import ThreatSignal
+from saastesa.sdk.api_client import TESAApiClient
+
+SIGNALS = {
+    "signals": [
+        {
+            "source": "iam",
+            "signal_type": "mfa_disabled",
+            "severity": 3,
+            "detected_at": "2026-05-01T08:00:00+00:00",
+            "metadata": {},
+        }
+    ]
+}
+
+
+def test_replayed_batch_skips_scoring_and_storage(tmp_path, monkeypatch) -> None:
+    client = TestClient(create_app(database_url=f"sqlite+pysqlite:///{tmp_path / 'idem.db'}"))
+    headers = {"Idempotency-Key": "batch-1"}
+
+    first = client.post("/api/v1/signals", json=SIGNALS, headers=headers)
+    monkeypatch.setattr(
+        "saastesa.api.main.analyze_signals", lambda signals: pytest.fail("batch was re-scored")
+    )
+    replay = client.post("/api/v1/signals", json=SIGNALS, headers=headers)
+
+    assert replay.status_code == 200
+    assert replay.json() == first.json()
+    assert client.get("/api/v1/findings").json()[0]["occurrence_count"] == 1
+
+    reused = client.post(
+        "/api/v1/signals", json={"signals": SIGNALS["signals"] * 2}, headers=headers
+    )
+    other_tenant = client.post(
+        "/api/v1/findings", json={"findings": []}, headers={**headers, TENANT_HEADER: "beta"}
+    )
+    blank = client.post("/api/v1/findings", json={"findings": []}, headers={"Idempotency-Key": " "})
+    assert reused.status_code == 422
+    assert other_tenant.status_code == 200
+    assert blank.status_code == 400
+
+
+def test_store_expires_keys_and_rejects_concurrent_use(tmp_path) -> None:
+    now = [datetime(2026, 5, 1, tzinfo=UTC)]
+    store = SQLAlchemyFindingStore(create_db_engine(f"sqlite+pysqlite:///{tmp_path / 'idem.db'}"))
+    store.init()
+    keys = IdempotencyStore(ttl_seconds=60, clock=lambda: now[0])
+    key = IdempotencyKey(route="/api/v1/findings", key="k", fingerprint="a")
+    calls: list[int] = []
+
+    def work() -> IngestFindingsResponse:
+        calls.append(1)
+        with pytest.raises(IdempotencyKeyInUseError):
+            keys.run(store.engine, "acme", key, IngestFindingsResponse, work)
+        return _response(len(calls))
+
+    def run(
+        idempotency: IdempotencyStore, run_key: IdempotencyKey = key
+    ) -> IngestFindingsResponse:
+        return idempotency.run(store.engine, "acme", run_key, IngestFindingsResponse, work)
+
+    assert run(keys).ingested == 1
+    assert run(IdempotencyStore(ttl_seconds=60, clock=lambda: now[0])).ingested == 1
+    with pytest.raises(IdempotencyKeyReusedError):
+        run(keys, IdempotencyKey("/api/v1/findings", "k", "b"))
+    now[0] += timedelta(seconds=61)
+    assert run(keys).ingested == 2
+
+    failed = IdempotencyKey("/api/v1/signals", "k", "a")
+    with pytest.raises(RuntimeError):
+        keys.run(store.engine, "acme", failed, IngestFindingsResponse, _fail)
+    retried = keys.run(
+        store.engine, "acme", failed, IngestFindingsResponse, lambda: _response(3)
+    )
+    assert retried.ingested == 3
+
+
+def test_retry_on_another_worker_replays_the_first_response(tmp_path, monkeypatch) -> None:
+    database_url = f"sqlite+pysqlite:///{tmp_path / 'idem.db'}"
+    first_worker = TestClient(create_app(database_url=database_url))
+    second_worker = TestClient(create_app(database_url=database_url))
+    headers = {"Idempotency-Key": "batch-1"}
+
+    first = first_worker.post("/api/v1/signals", json=SIGNALS, headers=headers)
+    monkeypatch.setattr(
+        "saastesa.api.main.analyze_signals", lambda signals: pytest.fail("batch was re-scored")
+    )
+    retry = second_worker.post("/api/v1/signals", json=SIGNALS, headers=headers)
+
+    assert retry.status_code == 200
+    assert retry.json() == first.json()
+
+
+def _fail() -> IngestFindingsResponse:
+    raise RuntimeError("ingest failed")
+
+
+def _response(ingested: int) -> IngestFindingsResponse:
+    return IngestFindingsResponse(ingested=ingested)
+
+
+def test_sdk_retries_with_the_same_key(monkeypatch) -> None:
+    seen: list[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request.headers["Idempotency-Key"])
+        if len(seen) == 1:
+            return httpx.Response(503, headers={"Retry-After": "0"})
+        return httpx.Response(200, json={"ingested": 1, "findings": []})
+
+    client_class = httpx.Client
+    monkeypatch.setattr(
+        "saastesa.sdk.api_client.httpx.Client",
+        lambda timeout: client_class(transport=httpx.MockTransport(handler)),
+    )
+    sdk = TESAApiClient("http://testserver", retry_backoff_seconds=0)
+
+    signal = ThreatSignal("iam", "mfa_disabled", 3, datetime(2026, 5, 1, tzinfo=UTC), {})
+    assert sdk.send_signals([signal])["ingested"] == 1
+    sdk.send_signals([signal])
+
+    assert seen[0] == seen[1] != seen[2]
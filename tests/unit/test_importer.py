@@ -0,0 +1,101 @@
+import gzip
+from dataclasses import replace
+from datetime import UTC, datetime, timedelta
+
+from saastesa.api.db import create_db_engine
+from saastesa.api.importer import import_findings
+from saastesa.api.main import _to_findings_out
+from saastesa.api.repository import SQLAlchemyFindingStore
+from saastesa.cli import main
+from saastesa.core.models import FindingReferences, SecurityFinding, ThreatSignal
+from saastesa.core.risk_scoring import build_finding
+
+
+def _findings(count: int) -> list[SecurityFinding]:
+    started = datetime(2026, 2, 1, tzinfo=UTC)
+    return [
+        build_finding(
+            ThreatSignal(
+                "sast",
+                f"signal_{index}",
+                1 + index % 5,
+                started + timedelta(minutes=index),
+                {"cve": [f"CVE-2026-{index:04d}"], "title": f"Injection {index}"},
+            )
+        )
+        for index in range(count)
+    ]
+
+
+def _write_ndjson(path, findings: list[SecurityFinding]) -> None:
+    with gzip.open(path, "wt", encoding="utf-8") as handle:
+        for finding in _to_findings_out(findings):
+            handle.write(finding.model_dump_json() + "\n")
+
+
+def test_import_matches_add_for_new_repeated_and_updated_findings(tmp_path) -> None:
+    findings = _findings(6)
+    updated = replace(
+        findings[0],
+        title="Injection 0 (regressed)",
+        references=FindingReferences(("CVE-2026-9999",), ("CWE-89",), (), ()),
+    )
+    seen_again = replace(findings[2], last_seen=findings[2].time + timedelta(minutes=5))
+    batches = [findings, [findings[2], seen_again, findings[2], seen_again, updated]]
+
+    added = SQLAlchemyFindingStore(create_db_engine(f"sqlite+pysqlite:///{tmp_path / 'add.db'}"))
+    added.init()
+    imported = SQLAlchemyFindingStore(
+        create_db_engine(f"sqlite+pysqlite:///{tmp_path / 'import.db'}")
+    )
+    imported.init()
+    for batch in batches:
+        added.add(batch)
+        assert import_findings(imported.engine, imported.tenant_id, batch, batch_size=2) == len(
+            batch
+        )
+
+    assert imported.list(limit=10) == added.list(limit=10)
+    assert imported.list(limit=10)[2].occurrence_count == 2
+    assert imported.list(limit=10)[2].last_seen == seen_again.last_seen.replace(tzinfo=None)
+    assert imported.search("regressed")[0][0].finding_uid == findings[0].finding_uid
+
+
+def test_cli_imports_gzip_ndjson_with_progress(tmp_path, capsys) -> None:
+    source = tmp_path / "findings.ndjson.gz"
+    findings = _findings(5)
+    _write_ndjson(source, findings)
+    database_url = f"sqlite+pysqlite:///{tmp_path / 'cli.db'}"
+
+    code = main(
+        [
+            "import",
+            str(source),
+            "--database-url",
+            database_url,
+            "--organization",
+            "acme",
+            "--batch-size",
+            "2",
+        ]
+    )
+
+    assert code == 0
+    output = capsys.readouterr().out.splitlines()
+    assert output[0].startswith("Imported 2 findings (")
+    assert output[-1] == "Imported 5 findings"
+    store = SQLAlchemyFindingStore(create_db_engine(database_url), tenant_id="acme")
+    assert [finding.finding_uid for finding in store.list()] == [f.finding_uid for f in findings]
+    assert store.list()[0].references.cve == ("CVE-2026-0000",)
+
+
+def test_cli_import_reports_invalid_lines(tmp_path, capsys) -> None:
+    source = tmp_path / "broken.ndjson"
+    source.write_text('{"finding_uid": "x"}\n', encoding="utf-8")
+
+    code = main(
+        ["import", str(source), "--database-url", f"sqlite+pysqlite:///{tmp_path / 'bad.db'}"]
+    )
+
+    assert code == 1
+    assert f"{source}:1:" in capsys.readouterr().out
@@ -0,0 +1,63 @@
+from threading import Event, Thread
+
+import pytest
+
+from saastesa.api.db import create_db_engine
+from saastesa.api.lifecycle import DrainingError, IngestDrain
+from saastesa.api.main import gunicorn_command, serve
+from saastesa.api.migrations import LATEST_SCHEMA_VERSION, current_schema_version
+
+
+def test_drain_waits_for_in_flight_batches() -> None:
+    drain = IngestDrain()
+    entered = Event()
+    release = Event()
+
+    def ingest() -> None:
+        with drain.track():
+            entered.set()
+            release.wait(timeout=5)
+
+    worker = Thread(target=ingest)
+    worker.start()
+    entered.wait(timeout=5)
+
+    assert drain.in_flight == 1
+    assert drain.drain(timeout=0.05) is False
+    release.set()
+    assert drain.drain(timeout=5) is True
+    worker.join(timeout=5)
+    assert drain.in_flight == 0
+
+
+def test_draining_rejects_new_batches() -> None:
+    drain = IngestDrain()
+    assert drain.drain(timeout=0) is True
+
+    with pytest.raises(DrainingError):
+        with drain.track():
+            pass
+
+
+def test_gunicorn_command_uses_uvicorn_workers_and_app_factory() -> None:
+    command = gunicorn_command("0.0.0.0", 8080, workers=4, grace_seconds=20)
+
+    assert command[:2] == ["gunicorn", "saastesa.api.main:get_app()"]
+    assert command[command.index("--worker-class") + 1] == "uvicorn.workers.UvicornWorker"
+    assert command[command.index("--workers") + 1] == "4"
+    assert command[command.index("--graceful-timeout") + 1] == "20"
+
+
+def test_serve_migrates_once_before_starting_workers(tmp_path, monkeypatch) -> None:
+    database_url = f"sqlite+pysqlite:///{tmp_path / 'serve.db'}"
+    monkeypatch.setenv("TESA_DATABASE_URL", database_url)
+    started: list[int] = []
+
+    def run(*args: object, workers: int, **kwargs: object) -> None:
+        started.append(current_schema_version(create_db_engine(database_url)))
+        started.append(workers)
+
+    monkeypatch.setattr("saastesa.api.main.uvicorn.run", run)
+    serve(workers=4)
+
+    assert started == [LATEST_SCHEMA_VERSION, 4]
@@ -0,0 +1,114 @@
+import httpx
+import pytest
+from fastapi.testclient import TestClient
+
+from saastesa.api.main import create_app
+from saastesa.demo.loadgen import (
+    FindingsShedError,
+    HttpFindingSender,
+    LoadProfile,
+    SimulatedAgent,
+    run_load_test,
+)
+from saastesa.demo.seed import generate_demo_findings
+
+
+class _TestClientSender:
+    def __init__(self, client: TestClient) -> None:
+        self.client = client
+
+    def send(self, findings: list[dict]) -> None:
+        self.client.post("/api/v1/findings", json={"findings": findings}).raise_for_status()
+
+    def close(self) -> None:
+        pass
+
+
+class _SheddingSender(_TestClientSender):
+    def __init__(self, client: TestClient, sheds: int) -> None:
+        super().__init__(client)
+        self.sheds = sheds
+
+    def send(self, findings: list[dict]) -> None:
+        if self.sheds > 0:
+            self.sheds -= 1
+            raise FindingsShedError(429, 0.0)
+        super().send(findings)
+
+
+def test_seeded_demo_findings_are_reproducible() -> None:
+    first = generate_demo_findings(count=5, seed=42)
+    second = generate_demo_findings(count=5, seed=42)
+
+    assert [finding["finding_uid"] for finding in first] == [
+        finding["finding_uid"] for finding in second
+    ]
+    assert [finding["domain"] for finding in first] == [finding["domain"] for finding in second]
+
+
+def test_agents_mix_new_and_repeated_findings() -> None:
+    agent = SimulatedAgent(0, LoadProfile(reuse_ratio=0.5, seed=3))
+
+    first_batch, first_repeated = agent.next_batch(50)
+    second_batch, second_repeated = agent.next_batch(200)
+
+    assert first_repeated < 50
+    assert 50 < second_repeated < 150
+    uids = {finding["finding_uid"] for finding in first_batch + second_batch}
+    assert len(uids) == 250 - first_repeated - second_repeated
+
+
+def test_load_test_reports_throughput_and_latency_percentiles(tmp_path) -> None:
+    client = TestClient(create_app(database_url=f"sqlite+pysqlite:///{tmp_path / 'load.db'}"))
+    profile = LoadProfile(
+        concurrency=4, agents=3, batch_size=10, total_findings=95, reuse_ratio=0.3, seed=1
+    )
+
+    report = run_load_test(profile, lambda: _TestClientSender(client))
+
+    assert report.errors == 0
+    assert report.shed == 0
+    assert report.batches == 10
+    assert report.findings == 95
+    assert report.new_findings + report.repeated_findings == 95
+    assert report.findings_per_second > 0
+    assert 0 < report.latency_p50_ms <= report.latency_p95_ms <= report.latency_p99_ms
+    stored = client.get("/api/v1/findings?limit=1000").json()
+    assert len(stored) == report.new_findings
+
+
+def test_http_sender_raises_shed_errors_with_retry_after(monkeypatch) -> None:
+    responses = iter(
+        [
+            httpx.Response(429, headers={"Retry-After": "2"}),
+            httpx.Response(503),
+            httpx.Response(500),
+        ]
+    )
+    client_class = httpx.Client
+    monkeypatch.setattr(
+        "saastesa.demo.loadgen.httpx.Client",
+        lambda timeout: client_class(transport=httpx.MockTransport(lambda _: next(responses))),
+    )
+    sender = HttpFindingSender("http://testserver")
+
+    with pytest.raises(FindingsShedError) as limited:
+        sender.send([])
+    with pytest.raises(FindingsShedError) as unavailable:
+        sender.send([])
+    with pytest.raises(httpx.HTTPStatusError):
+        sender.send([])
+
+    assert (limited.value.status_code, limited.value.retry_after) == (429, 2.0)
+    assert (unavailable.value.status_code, unavailable.value.retry_after) == (503, 1.0)
+
+
+def test_load_test_backs_off_and_reports_shed_batches_separately(tmp_path) -> None:
+    client = TestClient(create_app(database_url=f"sqlite+pysqlite:///{tmp_path / 'load.db'}"))
+    profile = LoadProfile(concurrency=1, batch_size=10, total_findings=30, max_shed_retries=2)
+
+    retried = run_load_test(profile, lambda: _SheddingSender(client, sheds=2))
+    gave_up = run_load_test(profile, lambda: _SheddingSender(client, sheds=3))
+
+    assert (retried.shed, retried.errors, retried.findings) == (2, 0, 30)
+    assert (gave_up.shed, gave_up.errors, gave_up.findings) == (3, 1, 20)
@@ -0,0 +1,77 @@
+from datetime import UTC, datetime
+
+from fastapi.testclient import TestClient
+
+from saastesa.api.main import create_app
+from saastesa.metrics import (
+    STAGE_LATENCY,
+    MetricsRegistry,
+    configure_metrics,
+    stage_timer,
+)
+
+
+def test_registry_renders_prometheus_text() -> None:
+    registry = MetricsRegistry(enabled=True)
+    requests = registry.counter("demo_requests_total", "Demo requests.")
+    latency = registry.histogram("demo_latency_seconds", "Demo latency.", buckets=(0.1, 1.0))
+
+    requests.inc(route="/a")
+    requests.inc(2, route="/a")
+    latency.observe(0.05, route="/a")
+    latency.observe(5.0, route="/a")
+
+    rendered = registry.render()
+    assert "# TYPE demo_requests_total counter" in rendered
+    assert 'demo_requests_total{route="/a"} 3' in rendered
+    assert 'demo_latency_seconds_bucket{route="/a",le="0.1"} 1' in rendered
+    assert 'demo_latency_seconds_bucket{route="/a",le="+Inf"} 2' in rendered
+    assert 'demo_latency_seconds_count{route="/a"} 2' in rendered
+
+
+def test_stage_timer_is_inert_when_disabled() -> None:
+    configure_metrics(False)
+    before = STAGE_LATENCY.count(stage="unit-test")
+
+    with stage_timer("unit-test"):
+        pass
+
+    assert STAGE_LATENCY.count(stage="unit-test") == before
+
+
+def test_metrics_endpoint_reports_routes_stages_and_queries(monkeypatch) -> None:
+    monkeypatch.setenv("TESA_METRICS_ENABLED", "1")
+    try:
+        client = TestClient(create_app())
+        payload = {
+            "signals": [
+                {
+                    "source": "iam",
+                    "signal_type": "stale_admin_credential",
+                    "severity": 5,
+                    "detected_at": datetime.now(tz=UTC).isoformat(),
+                    "metadata": {"asset_id": "user-7"},
+                }
+            ]
+        }
+        assert client.post("/api/v1/signals", json=payload).status_code == 200
+        assert client.get("/api/v1/findings").status_code == 200
+
+        response = client.get("/metrics")
+    finally:
+        configure_metrics(False)
+
+    assert response.status_code == 200
+    body = response.text
+    assert 'route="/api/v1/signals"' in body
+    assert 'saastesa_stage_duration_seconds_count{stage="upsert"}' in body
+    assert 'saastesa_stage_duration_seconds_count{stage="serialize"}' in body
+    assert "saastesa_ingested_findings_total" in body
+    assert 'saastesa_db_queries_per_request_count{route="/api/v1/findings"}' in body
+    assert 'saastesa_cache_requests_total{cache="dedup",result="miss"}' in body
+
+
+def test_metrics_endpoint_is_absent_when_disabled() -> None:
+    client = TestClient(create_app())
+
+    assert client.get("/metrics").status_code == 404
@@ -0,0 +1,63 @@
+import io
+from collections.abc import Iterator
+from datetime import UTC, datetime
+
+from saastesa.core.models import SecurityFinding, ThreatSignal
+from saastesa.pipelines.ingest import chunked
+from saastesa.pipelines.stream import ConsoleSink, stream_findings
+from saastesa.services.tesa_service import TESAService
+
+
+class _CountingProvider:
+    def __init__(self, total: int) -> None:
+        self.total = total
+        self.produced = 0
+
+    def fetch_signals(self) -> Iterator[ThreatSignal]:
+        now = datetime.now(tz=UTC)
+        for index in range(self.total):
+            self.produced += 1
+            yield ThreatSignal("iam", f"signal_{index}", 3, now, {})
+
+
+class _RecordingSink:
+    def __init__(self, provider: _CountingProvider) -> None:
+        self.provider = provider
+        self.chunk_sizes: list[int] = []
+        self.produced_at_write: list[int] = []
+
+    def write(self, findings: list[SecurityFinding]) -> None:
+        self.chunk_sizes.append(len(findings))
+        self.produced_at_write.append(self.provider.produced)
+
+
+def test_chunked_splits_iterables_lazily() -> None:
+    assert list(chunked(range(7), 3)) == [[0, 1, 2], [3, 4, 5], [6]]
+    assert list(chunked([], 3)) == []
+
+
+def test_streaming_pipeline_keeps_provider_lazy() -> None:
+    provider = _CountingProvider(total=25)
+    sink = _RecordingSink(provider)
+
+    written = TESAService(provider=provider).run_streaming(sink, chunk_size=10)
+
+    assert written == 25
+    assert sink.chunk_sizes == [10, 10, 5]
+    assert sink.produced_at_write == [10, 20, 25]
+
+
+def test_console_sink_accumulates_summary_across_chunks() -> None:
+    now = datetime.now(tz=UTC)
+    signals = [
+        ThreatSignal("a", "s1", 1, now, {}),
+        ThreatSignal("c", "s3", 5, now, {"privileged_access": True}),
+        ThreatSignal("d", "s4", 5, now, {"internet_exposed": True}),
+    ]
+    output = io.StringIO()
+    sink = ConsoleSink(stream=output)
+
+    stream_findings(signals, sink, chunk_size=2)
+
+    assert sink.summary == {"low": 1, "medium": 0, "high": 0, "critical": 2}
+    assert len(output.getvalue().splitlines()) == 3
@@ -0,0 +1,38 @@
+import json
+import logging
+import re
+
+from fastapi.testclient import TestClient
+
+from saastesa.api.main import create_app
+
+
+def test_profile_header_reports_query_counts_in_server_timing() -> None:
+    client = TestClient(create_app())
+
+    unprofiled = client.get("/api/v1/findings")
+    profiled = client.get("/api/v1/findings", headers={"X-TESA-Profile": "1"})
+
+    assert "server-timing" not in unprofiled.headers
+    match = re.match(
+        r'db;dur=[\d.]+;desc="(\d+) statements", app;dur=[\d.]+',
+        profiled.headers["server-timing"],
+    )
+    assert match is not None
+    assert int(match.group(1)) >= 1
+
+
+def test_profiling_env_logs_slow_queries(monkeypatch, caplog) -> None:
+    monkeypatch.setenv("TESA_PROFILE_SQL", "true")
+    monkeypatch.setenv("TESA_SLOW_QUERY_MS", "0")
+    client = TestClient(create_app())
+
+    with caplog.at_level(logging.WARNING, logger="saastesa.sql.slow"):
+        response = client.get("/api/v1/summary")
+
+    assert "server-timing" in response.headers
+    events = [json.loads(record.getMessage()) for record in caplog.records]
+    assert events
+    assert events[0]["event"] == "slow_query"
+    assert events[0]["request"] == "GET /api/v1/summary"
+    assert events[0]["statement"].startswith("SELECT")
@@ -0,0 +1,52 @@
+from datetime import UTC, datetime, timedelta
+from typing import Any
+
+import pytest
+from sqlalchemy import event
+
+from saastesa.api.db import create_db_engine
+from saastesa.api.projection import UnknownFieldError, parse_fields
+from saastesa.api.repository import SQLAlchemyFindingStore
+from saastesa.core.models import ThreatSignal
+from saastesa.core.risk_scoring import build_finding
+
+
+def test_parse_fields_keeps_model_order_and_always_includes_uid() -> None:
+    assert parse_fields(None) is None
+    assert parse_fields(" ") is None
+    assert parse_fields("time, title,title") == ("finding_uid", "title", "time")
+    with pytest.raises(UnknownFieldError, match="nope"):
+        parse_fields("title,nope")
+
+
+def test_projected_list_skips_deferred_columns(tmp_path) -> None:
+    engine = create_db_engine(f"sqlite+pysqlite:///{tmp_path / 'projection.db'}")
+    store = SQLAlchemyFindingStore(engine)
+    store.init()
+    now = datetime.now(tz=UTC)
+    findings = [
+        build_finding(
+            ThreatSignal(
+                "sast",
+                f"signal_{index}",
+                3,
+                now + timedelta(seconds=index),
+                {"cve": [f"CVE-2026-000{index}"], "blob": "x" * 4096},
+            )
+        )
+        for index in range(3)
+    ]
+    store.add(findings)
+
+    statements: list[str] = []
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def record(*args: Any) -> None:
+        statements.append(args[2])
+
+    rows = store.list_fields(("finding_uid", "title", "references"), limit=2)
+
+    assert [row["finding_uid"] for row in rows] == [finding.finding_uid for finding in findings[1:]]
+    assert [row["references"] for row in rows] == [finding.references for finding in findings[1:]]
+    assert set(rows[0]) == {"finding_uid", "title", "references"}
+    assert not any("raw_data" in sql or "description" in sql for sql in statements)
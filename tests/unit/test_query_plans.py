@@ -0,0 +1,166 @@
+import os
+from datetime import UTC, datetime, timedelta
+
+import pytest
+from sqlalchemy import Engine, Select, select, text
+
+from saastesa.api.db import create_db_engine
+from saastesa.api.db_models import FindingReferenceItemRecord, SecurityFindingRecord
+from saastesa.api.filters import finding_filter_clauses, parse_finding_filters
+from saastesa.api.repository import SQLAlchemyFindingStore
+from saastesa.api.search import ranked_matches, search_terms
+from saastesa.core.contracts import (
+    DEFAULT_TENANT_ID,
+    FindingDomain,
+    FindingReferenceType,
+    FindingStatus,
+)
+from saastesa.core.models import ThreatSignal
+from saastesa.core.risk_scoring import build_finding
+
+QUERY_SHAPES: list[tuple[str, Select[tuple[int]], set[str]]] = [
+    (
+        "recent findings",
+        select(SecurityFindingRecord.id)
+        .where(SecurityFindingRecord.tenant_id == DEFAULT_TENANT_ID)
+        .order_by(SecurityFindingRecord.time.desc(), SecurityFindingRecord.id.desc())
+        .limit(100),
+        {"ix_security_findings_tenant_time_id"},
+    ),
+    (
+        "domain timeline",
+        select(SecurityFindingRecord.id)
+        .where(
+            SecurityFindingRecord.tenant_id == DEFAULT_TENANT_ID,
+            SecurityFindingRecord.domain == FindingDomain.APPLICATION,
+        )
+        .order_by(SecurityFindingRecord.time.desc())
+        .limit(100),
+        {"ix_security_findings_tenant_domain_time"},
+    ),
+    (
+        "riskiest by status",
+        select(SecurityFindingRecord.id)
+        .where(
+            SecurityFindingRecord.tenant_id == DEFAULT_TENANT_ID,
+            SecurityFindingRecord.status == FindingStatus.IN_PROGRESS,
+        )
+        .order_by(SecurityFindingRecord.risk_score.desc())
+        .limit(100),
+        {"ix_security_findings_tenant_status_risk_score"},
+    ),
+    (
+        "open findings timeline",
+        select(SecurityFindingRecord.id)
+        .where(
+            SecurityFindingRecord.tenant_id == DEFAULT_TENANT_ID,
+            SecurityFindingRecord.status == FindingStatus.OPEN,
+        )
+        .order_by(SecurityFindingRecord.time.desc())
+        .limit(100),
+        {
+            "ix_security_findings_tenant_open_time",
+            "ix_security_findings_tenant_status_risk_score",
+            "ix_security_findings_tenant_time_id",
+        },
+    ),
+    (
+        "reference lookup",
+        select(FindingReferenceItemRecord.finding_id).where(
+            FindingReferenceItemRecord.reference_value == "CVE-2024-0001",
+            FindingReferenceItemRecord.reference_type == FindingReferenceType.CVE,
+        ),
+        {"ix_finding_reference_items_value_type"},
+    ),
+]
+
+
+def _seed(engine: Engine) -> None:
+    store = SQLAlchemyFindingStore(engine, tenant_id=DEFAULT_TENANT_ID)
+    store.init()
+    now = datetime.now(tz=UTC)
+    store.add(
+        [
+            build_finding(
+                ThreatSignal(
+                    source,
+                    f"signal_{index}",
+                    1 + index % 5,
+                    now - timedelta(hours=index),
+                    {"cve": ["CVE-2024-0001"], "status": "open" if index % 3 else "in_progress"},
+                )
+            )
+            for index, source in enumerate(["sast", "iam", "edr"] * 20)
+        ]
+    )
+
+
+def _explain(engine: Engine, statement: Select[tuple[int]]) -> str:
+    compiled = statement.compile(engine, compile_kwargs={"literal_binds": True})
+    with engine.connect() as connection:
+        if engine.dialect.name == "sqlite":
+            rows = connection.execute(text(f"EXPLAIN QUERY PLAN {compiled}")).all()
+            return "\n".join(str(row[-1]) for row in rows)
+        connection.execute(text("ANALYZE security_findings"))
+        connection.execute(text("SET enable_seqscan = off"))
+        rows = connection.execute(text(f"EXPLAIN {compiled}")).all()
+        return "\n".join(str(row[0]) for row in rows)
+
+
+@pytest.mark.parametrize(("name", "statement", "expected_indexes"), QUERY_SHAPES)
+def test_sqlite_query_plans_use_composite_indexes(
+    tmp_path, name: str, statement: Select[tuple[int]], expected_indexes: set[str]
+) -> None:
+    engine = create_db_engine(f"sqlite+pysqlite:///{tmp_path / 'plans.db'}")
+    _seed(engine)
+
+    plan = _explain(engine, statement)
+
+    assert any(index in plan for index in expected_indexes), f"{name}: {plan}"
+
+
+@pytest.mark.skipif(
+    not os.getenv("TESA_TEST_POSTGRES_URL"),
+    reason="Set TESA_TEST_POSTGRES_URL to check PostgreSQL query plans.",
+)
+@pytest.mark.parametrize(("name", "statement", "expected_indexes"), QUERY_SHAPES)
+def test_postgres_query_plans_use_composite_indexes(
+    name: str, statement: Select[tuple[int]], expected_indexes: set[str]
+) -> None:
+    engine = create_db_engine(os.environ["TESA_TEST_POSTGRES_URL"])
+    _seed(engine)
+
+    plan = _explain(engine, statement)
+
+    assert any(index in plan for index in expected_indexes), f"{name}: {plan}"
+
+
+@pytest.mark.skipif(
+    not os.getenv("TESA_TEST_POSTGRES_URL"),
+    reason="Set TESA_TEST_POSTGRES_URL to check PostgreSQL query plans.",
+)
+def test_postgres_raw_data_filters_use_gin_index() -> None:
+    engine = create_db_engine(os.environ["TESA_TEST_POSTGRES_URL"])
+    _seed(engine)
+    filters = parse_finding_filters([("raw.status", "in_progress")])
+
+    plan = _explain(
+        engine,
+        select(SecurityFindingRecord.id).where(*finding_filter_clauses(filters, "postgresql")),
+    )
+
+    assert "ix_security_findings_raw_data" in plan, plan
+
+
+@pytest.mark.skipif(
+    not os.getenv("TESA_TEST_POSTGRES_URL"),
+    reason="Set TESA_TEST_POSTGRES_URL to check PostgreSQL query plans.",
+)
+def test_postgres_search_uses_full_text_index() -> None:
+    engine = create_db_engine(os.environ["TESA_TEST_POSTGRES_URL"])
+    _seed(engine)
+    ranked = ranked_matches(search_terms("signal"), "postgresql")
+
+    plan = _explain(engine, select(ranked.c.finding_id))
+
+    assert "ix_security_findings_search" in plan, plan
@@ -0,0 +1,86 @@
+from datetime import UTC, datetime
+
+from fastapi.testclient import TestClient
+
+from saastesa.api.db import create_db_engine
+from saastesa.api.main import create_app
+from saastesa.api.replicas import is_sticky, primary_reads, sticky_until
+from saastesa.api.store import SQLAlchemyFindingStore
+from saastesa.core.models import ThreatSignal
+from saastesa.pipelines.analyze import analyze_signals
+
+
+def _findings(asset_id: str) -> list:
+    return analyze_signals(
+        [
+            ThreatSignal(
+                source="iam",
+                signal_type="stale_admin_credential",
+                severity=4,
+                detected_at=datetime.now(tz=UTC),
+                metadata={"asset_id": asset_id},
+            )
+        ]
+    )
+
+
+def _stores(tmp_path) -> tuple[str, str, SQLAlchemyFindingStore]:
+    primary_url = f"sqlite+pysqlite:///{tmp_path / 'primary.db'}"
+    replica_url = f"sqlite+pysqlite:///{tmp_path / 'replica.db'}"
+    replica = SQLAlchemyFindingStore(create_db_engine(replica_url))
+    replica.init()
+    replica.add(_findings("replica-only"))
+    return primary_url, replica_url, replica
+
+
+def test_store_writes_to_primary_and_reads_from_replica(tmp_path) -> None:
+    primary_url, replica_url, _ = _stores(tmp_path)
+    store = SQLAlchemyFindingStore(create_db_engine(primary_url), create_db_engine(replica_url))
+    store.init()
+
+    store.add(_findings("primary-asset"))
+
+    assert [finding.resource.uid for finding in store.list()] == ["replica-only"]
+    with primary_reads():
+        assert [finding.resource.uid for finding in store.list()] == ["primary-asset"]
+
+
+def test_reads_stick_to_primary_after_an_ingest(tmp_path) -> None:
+    primary_url, replica_url, _ = _stores(tmp_path)
+    app = create_app(database_url=primary_url, read_database_url=replica_url)
+    writer = TestClient(app)
+    other_reader = TestClient(app)
+    payload = {
+        "signals": [
+            {
+                "source": "iam",
+                "signal_type": "stale_admin_credential",
+                "severity": 4,
+                "detected_at": datetime.now(tz=UTC).isoformat(),
+                "metadata": {"asset_id": "primary-asset"},
+            }
+        ]
+    }
+
+    assert writer.get("/health").json()["read_replica"] is True
+    assert [item["resource"]["uid"] for item in writer.get("/api/v1/findings").json()] == [
+        "replica-only"
+    ]
+
+    ingest = writer.post("/api/v1/signals", json=payload)
+    assert ingest.status_code == 200
+    assert "tesa_primary_until" in ingest.cookies
+
+    assert [item["resource"]["uid"] for item in writer.get("/api/v1/findings").json()] == [
+        "primary-asset"
+    ]
+    assert [item["resource"]["uid"] for item in other_reader.get("/api/v1/findings").json()] == [
+        "replica-only"
+    ]
+
+
+def test_stickiness_cookie_expires() -> None:
+    assert is_sticky(sticky_until(5, now=100.0), now=104.0)
+    assert not is_sticky(sticky_until(5, now=100.0), now=106.0)
+    assert not is_sticky("not-a-timestamp")
+    assert not is_sticky(None)
@@ -0,0 +1,132 @@
+import os
+from dataclasses import replace
+from datetime import UTC, datetime, timedelta
+
+import pytest
+from sqlalchemy import func, select, text
+
+from saastesa.api.db import create_db_engine
+from saastesa.api.db_models import (
+    FindingReferenceItemRecord,
+    FindingResourceRecord,
+    SecurityFindingRecord,
+)
+from saastesa.api.repository import SQLAlchemyFindingStore
+from saastesa.api.retention import (
+    RETENTION_LOCK_KEY,
+    RetentionPolicy,
+    RetentionPruner,
+    prune_findings,
+)
+from saastesa.cli import main
+from saastesa.core.contracts import FindingStatus
+from saastesa.core.models import SecurityFinding, ThreatSignal
+from saastesa.core.risk_scoring import build_finding
+
+
+def _finding(name: str, detected_at: datetime, status: FindingStatus) -> SecurityFinding:
+    finding = build_finding(
+        ThreatSignal(
+            "sca",
+            name,
+            3,
+            detected_at,
+            {"asset_id": f"asset-{name}", "cve": ["CVE-2024-0001"]},
+        )
+    )
+    return replace(finding, status=status)
+
+
+def _count(store: SQLAlchemyFindingStore, column: object) -> int:
+    with store.engine.connect() as connection:
+        return int(connection.scalar(select(func.count(column))) or 0)
+
+
+def _store(tmp_path) -> SQLAlchemyFindingStore:
+    store = SQLAlchemyFindingStore(
+        create_db_engine(f"sqlite+pysqlite:///{tmp_path / 'retention.db'}")
+    )
+    store.init()
+    return store
+
+
+def test_prune_deletes_expired_findings_in_batches(tmp_path) -> None:
+    store = _store(tmp_path)
+    now = datetime.now(tz=UTC)
+    store.add(
+        [
+            _finding("old_open", now - timedelta(days=120), FindingStatus.OPEN),
+            _finding("old_resolved_1", now - timedelta(days=100), FindingStatus.RESOLVED),
+            _finding("old_resolved_2", now - timedelta(days=95), FindingStatus.RESOLVED),
+            _finding("recent_resolved", now - timedelta(days=5), FindingStatus.RESOLVED),
+        ]
+    )
+
+    policy = RetentionPolicy(max_age_days=90, statuses=(FindingStatus.RESOLVED,), batch_size=1)
+    assert prune_findings(store.engine, policy, now=now, max_batches=1) == 1
+    assert prune_findings(store.engine, policy, now=now) == 1
+
+    remaining = {finding.type_name for finding in store.list()}
+    assert remaining == {"Old Open", "Recent Resolved"}
+    assert _count(store, FindingReferenceItemRecord.id) == 2
+    assert _count(store, FindingResourceRecord.id) == 2
+
+
+def test_prune_without_filters_removes_everything_past_cutoff(tmp_path) -> None:
+    store = _store(tmp_path)
+    now = datetime.now(tz=UTC)
+    store.add(
+        [
+            _finding("old_open", now - timedelta(days=40), FindingStatus.OPEN),
+            _finding("fresh_open", now - timedelta(days=1), FindingStatus.OPEN),
+        ]
+    )
+
+    assert prune_findings(store.engine, RetentionPolicy(max_age_days=30), now=now) == 1
+    assert [finding.type_name for finding in store.list()] == ["Fresh Open"]
+
+
+def test_prune_keeps_old_findings_that_were_seen_recently(tmp_path) -> None:
+    store = _store(tmp_path)
+    now = datetime.now(tz=UTC)
+    recurring = _finding("recurring", now - timedelta(days=200), FindingStatus.OPEN)
+    store.add([recurring, _finding("stale", now - timedelta(days=200), FindingStatus.OPEN)])
+    store.add([replace(recurring, last_seen=now - timedelta(days=2))])
+
+    assert prune_findings(store.engine, RetentionPolicy(max_age_days=30), now=now) == 1
+    assert [finding.type_name for finding in store.list()] == ["Recurring"]
+    assert _count(store, FindingResourceRecord.id) == 1
+
+
+@pytest.mark.parametrize("days", ["0", "-3"])
+def test_prune_cli_rejects_non_positive_days(tmp_path, capsys, days) -> None:
+    store = _store(tmp_path)
+    store.add([_finding("old", datetime(2020, 1, 1, tzinfo=UTC), FindingStatus.OPEN)])
+    database_url = str(store.engine.url)
+
+    with pytest.raises(SystemExit) as exited:
+        main(["prune", "--days", days, "--database-url", database_url])
+
+    assert exited.value.code == 2
+    assert "must be a positive integer" in capsys.readouterr().err
+    assert _count(store, SecurityFindingRecord.id) == 1
+
+
+@pytest.mark.skipif(
+    not os.getenv("TESA_TEST_POSTGRES_URL"),
+    reason="Set TESA_TEST_POSTGRES_URL to check the PostgreSQL pruner lock.",
+)
+def test_postgres_pruner_skips_cycles_while_another_worker_prunes() -> None:
+    store = SQLAlchemyFindingStore(
+        create_db_engine(os.environ["TESA_TEST_POSTGRES_URL"]), tenant_id="retention-lock"
+    )
+    store.init()
+    store.add([_finding("locked", datetime(2020, 1, 1, tzinfo=UTC), FindingStatus.OPEN)])
+    pruner = RetentionPruner(store.engine, RetentionPolicy(max_age_days=30))
+
+    with store.engine.connect() as other_worker:
+        other_worker.execute(text("SELECT pg_advisory_lock(:key)"), {"key": RETENTION_LOCK_KEY})
+        assert pruner.run_once() == 0
+        other_worker.execute(text("SELECT pg_advisory_unlock(:key)"), {"key": RETENTION_LOCK_KEY})
+
+    assert pruner.run_once() >= 1
@@ -1,17 +1,21 @@
 import json
 from datetime import UTC, datetime
+from typing import Any
 
-from sqlalchemy import inspect, text
+import pytest
+from sqlalchemy import Engine, inspect, text
 
 from saastesa.api.db import create_db_engine
+from saastesa.api.migrations import (
+    LATEST_SCHEMA_VERSION,
+    current_schema_version,
+    ensure_schema_current,
+    run_migrations,
+)
 from saastesa.api.repository import SQLAlchemyFindingStore
 
 
-def test_migrates_legacy_security_findings_schema(tmp_path) -> None:
-    db_path = tmp_path / "legacy.db"
-    engine = create_db_engine(f"sqlite+pysqlite:///{db_path}")
-    now = datetime.now(tz=UTC)
-
+def _create_legacy_table(engine: Engine) -> None:
     with engine.begin() as connection:
         connection.execute(
             text(
@@ -45,31 +49,37 @@ def test_migrates_legacy_security_findings_schema(tmp_path) -> None:
             )
         )
 
-        payload = {
-            "id": 1,
-            "finding_uid": "legacy-1",
-            "standard": "OCSF",
-            "schema_version": "1.1.0",
-            "status": "open",
-            "severity_id": 5,
-            "severity": "critical",
-            "risk_score": 90,
-            "title": "Legacy finding",
-            "description": "from old schema",
-            "category_name": "Infrastructure Security",
-            "class_name": "Security Finding",
-            "type_name": "Privilege Escalation",
-            "domain": "infrastructure",
-            "activity_name": "Create",
-            "time": now,
-            "source": "legacy",
-            "resource_uid": "res-1",
-            "resource_name": "prod-api",
-            "resource_type": "service",
-            "resource_platform": "aws",
-            "references_json": json.dumps({"cve": ["CVE-2026-0001"], "cwe": ["CWE-269"]}),
-            "raw_data": json.dumps({"legacy": True}),
-        }
+
+def _legacy_payload(row_id: int, now: datetime, resource_uid: str = "res-1") -> dict[str, Any]:
+    return {
+        "id": row_id,
+        "finding_uid": f"legacy-{row_id}",
+        "standard": "OCSF",
+        "schema_version": "1.1.0",
+        "status": "open",
+        "severity_id": 5,
+        "severity": "critical",
+        "risk_score": 90,
+        "title": "Legacy finding",
+        "description": "from old schema",
+        "category_name": "Infrastructure Security",
+        "class_name": "Security Finding",
+        "type_name": "Privilege Escalation",
+        "domain": "infrastructure",
+        "activity_name": "Create",
+        "time": now,
+        "source": "legacy",
+        "resource_uid": resource_uid,
+        "resource_name": "prod-api",
+        "resource_type": "service",
+        "resource_platform": "aws",
+        "references_json": json.dumps({"cve": ["CVE-2026-0001"], "cwe": ["CWE-269"]}),
+        "raw_data": json.dumps({"legacy": True}),
+    }
+
+
+def _insert_legacy_rows(engine: Engine, payloads: list[dict[str, Any]]) -> None:
+    with engine.begin() as connection:
         connection.execute(
             text(
                 """
@@ -86,9 +96,18 @@ def test_migrates_legacy_security_findings_schema(tmp_path) -> None:
                 )
                 """
             ),
-            payload,
+            payloads,
         )
 
+
+def test_migrates_legacy_security_findings_schema(tmp_path) -> None:
+    db_path = tmp_path / "legacy.db"
+    engine = create_db_engine(f"sqlite+pysqlite:///{db_path}")
+    now = datetime.now(tz=UTC)
+
+    _create_legacy_table(engine)
+    _insert_legacy_rows(engine, [_legacy_payload(1, now)])
+
     store = SQLAlchemyFindingStore(engine)
     store.init()
 
@@ -96,7 +115,8 @@ def test_migrates_legacy_security_findings_schema(tmp_path) -> None:
     assert "security_findings_legacy" not in inspector.get_table_names()
     assert "finding_resources" in inspector.get_table_names()
     assert "finding_reference_items" in inspector.get_table_names()
-    assert "resource_id" in {column["name"] for column in inspector.get_columns("security_findings")}
+    columns = inspector.get_columns("security_findings")
+    assert "resource_id" in {column["name"] for column in columns}
 
     findings = store.list(limit=10)
     assert len(findings) == 1
@@ -106,3 +126,71 @@ def test_migrates_legacy_security_findings_schema(tmp_path) -> None:
     assert finding.resource.uid == "res-1"
     assert finding.references.cve == ("CVE-2026-0001",)
     assert finding.references.cwe == ("CWE-269",)
+    assert current_schema_version(engine) == LATEST_SCHEMA_VERSION
+
+
+def test_legacy_findings_are_assigned_to_configured_organization(tmp_path, monkeypatch) -> None:
+    monkeypatch.setenv("TESA_ORGANIZATION", "Acme")
+    engine = create_db_engine(f"sqlite+pysqlite:///{tmp_path / 'legacy.db'}")
+    now = datetime.now(tz=UTC)
+    _create_legacy_table(engine)
+    _insert_legacy_rows(engine, [_legacy_payload(row_id, now) for row_id in range(1, 4)])
+
+    run_migrations(engine, chunk_size=2)
+
+    with engine.connect() as connection:
+        tenants = list(connection.scalars(text("SELECT DISTINCT tenant_id FROM security_findings")))
+    assert tenants == ["acme"]
+    assert len(SQLAlchemyFindingStore(engine, tenant_id="acme").list(limit=10)) == 3
+    assert SQLAlchemyFindingStore(engine, tenant_id="globex").list(limit=10) == []
+
+
+def test_legacy_backfill_streams_in_chunks_and_resumes(tmp_path) -> None:
+    engine = create_db_engine(f"sqlite+pysqlite:///{tmp_path / 'legacy.db'}")
+    now = datetime.now(tz=UTC)
+    _create_legacy_table(engine)
+    _insert_legacy_rows(
+        engine,
+        [
+            _legacy_payload(row_id, now, resource_uid=f"res-{row_id % 2}")
+            for row_id in range(1, 6)
+        ],
+    )
+
+    def interrupt(message: str) -> None:
+        if message.startswith("Backfilled"):
+            raise KeyboardInterrupt
+
+    with pytest.raises(KeyboardInterrupt):
+        run_migrations(engine, chunk_size=2, progress=interrupt)
+    assert current_schema_version(engine) == 0
+    assert "security_findings_legacy" in inspect(engine).get_table_names()
+
+    messages: list[str] = []
+    run_migrations(engine, chunk_size=2, progress=messages.append)
+
+    assert "Backfilled 2 legacy findings (through id 4)" in messages
+    assert "Backfilled 3 legacy findings (through id 5)" in messages
+    assert "security_findings_legacy" not in inspect(engine).get_table_names()
+    findings = SQLAlchemyFindingStore(engine).list(limit=10)
+    assert sorted(finding.finding_uid for finding in findings) == [
+        f"legacy-{row_id}" for row_id in range(1, 6)
+    ]
+    assert {finding.resource.uid for finding in findings} == {"res-0", "res-1"}
+    assert all(finding.references.cve == ("CVE-2026-0001",) for finding in findings)
+
+
+def test_startup_refuses_outdated_schema_without_auto_migrate(tmp_path) -> None:
+    engine = create_db_engine(f"sqlite+pysqlite:///{tmp_path / 'legacy.db'}")
+    _create_legacy_table(engine)
+
+    with pytest.raises(RuntimeError, match="saastesa migrate"):
+        ensure_schema_current(engine, auto_migrate=False)
+
+
+def test_fresh_database_is_created_and_stamped(tmp_path) -> None:
+    engine = create_db_engine(f"sqlite+pysqlite:///{tmp_path / 'fresh.db'}")
+
+    assert ensure_schema_current(engine, auto_migrate=False) == LATEST_SCHEMA_VERSION
+    assert current_schema_version(engine) == LATEST_SCHEMA_VERSION
+    assert run_migrations(engine) == []
@@ -0,0 +1,118 @@
+from dataclasses import replace
+from datetime import UTC, datetime, timedelta
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import delete, text
+
+from saastesa.api.db import create_db_engine
+from saastesa.api.db_models import SEARCH_TABLE, SchemaMigrationRecord
+from saastesa.api.main import create_app
+from saastesa.api.migrations import run_migrations
+from saastesa.api.repository import SQLAlchemyFindingStore
+from saastesa.api.search import InvalidCursorError, SearchCursor, search_terms
+from saastesa.core.models import SecurityFinding, ThreatSignal
+from saastesa.core.risk_scoring import build_finding
+
+
+def _finding(index: int, title: str, description: str = "Derived finding.") -> SecurityFinding:
+    return build_finding(
+        ThreatSignal(
+            "sast",
+            f"signal_{index}",
+            3,
+            datetime.now(tz=UTC) + timedelta(seconds=index),
+            {"title": title, "description": description},
+        )
+    )
+
+
+def test_search_cursor_round_trips_and_rejects_garbage() -> None:
+    cursor = SearchCursor(-1.2345678901234, 42)
+
+    assert SearchCursor.decode(cursor.encode()) == cursor
+    with pytest.raises(InvalidCursorError):
+        SearchCursor.decode("not-a-cursor")
+    assert search_terms("SQL-injection in  'login'") == ["sql", "injection", "in", "login"]
+
+
+def test_store_search_ranks_and_paginates_matches(tmp_path) -> None:
+    store = SQLAlchemyFindingStore(
+        create_db_engine(f"sqlite+pysqlite:///{tmp_path / 'search.db'}"), tenant_id="acme"
+    )
+    store.init()
+    injections = [
+        _finding(index, f"SQL injection in service {index}", "Unsanitized query parameters.")
+        for index in range(5)
+    ]
+    strongest = _finding(5, "SQL injection", "SQL injection through a stored SQL query.")
+    unrelated = _finding(6, "Public bucket", "Anonymous read access.")
+    store.add([*injections, strongest, unrelated])
+
+    pages: list[list[str]] = []
+    cursor = None
+    while True:
+        findings, cursor = store.search("sql injection", limit=2, cursor=cursor)
+        pages.append([finding.finding_uid for finding in findings])
+        if cursor is None:
+            break
+
+    matched = [uid for page in pages for uid in page]
+    assert [len(page) for page in pages] == [2, 2, 2]
+    assert matched[0] == strongest.finding_uid
+    assert sorted(matched) == sorted(f.finding_uid for f in [*injections, strongest])
+    assert [finding.title for finding in store.search("bucket")[0]] == ["Public bucket"]
+    assert store.search("!!!") == ([], None)
+
+    store.add([replace(unrelated, title="Exposed storage bucket")])
+    assert store.search("exposed")[0][0].finding_uid == unrelated.finding_uid
+    assert store.search("public") == ([], None)
+
+    other_tenant = SQLAlchemyFindingStore(store.engine, tenant_id="globex")
+    assert other_tenant.search("injection") == ([], None)
+
+
+def test_search_endpoint_returns_cursor_pages(tmp_path) -> None:
+    client = TestClient(create_app(database_url=f"sqlite+pysqlite:///{tmp_path / 'api.db'}"))
+    now = datetime.now(tz=UTC).isoformat()
+    signals = [
+        {
+            "source": "cspm",
+            "signal_type": f"public_bucket_{index}",
+            "severity": 4,
+            "detected_at": now,
+            "metadata": {"title": f"Public bucket {index}", "owner": "appsec" if index else "iam"},
+        }
+        for index in range(3)
+    ]
+    assert client.post("/api/v1/signals", json={"signals": signals}).status_code == 200
+
+    first = client.get("/api/v1/findings/search", params={"q": "bucket", "limit": 2}).json()
+    assert len(first["findings"]) == 2
+    second = client.get(
+        "/api/v1/findings/search", params={"q": "bucket", "cursor": first["next_cursor"]}
+    ).json()
+    assert len(second["findings"]) == 1
+    assert second["next_cursor"] is None
+
+    owned = client.get("/api/v1/findings/search", params={"q": "bucket", "raw.owner": "iam"})
+    assert [finding["title"] for finding in owned.json()["findings"]] == ["Public bucket 0"]
+    bad_cursor = client.get("/api/v1/findings/search", params={"q": "x", "cursor": "??"})
+    assert bad_cursor.status_code == 400
+    assert client.get("/api/v1/findings/search").status_code == 422
+
+
+def test_search_migration_backfills_existing_findings(tmp_path) -> None:
+    engine = create_db_engine(f"sqlite+pysqlite:///{tmp_path / 'backfill.db'}")
+    store = SQLAlchemyFindingStore(engine)
+    store.init()
+    store.add([_finding(index, f"Weak cipher suite {index}") for index in range(5)])
+    with engine.begin() as connection:
+        connection.execute(text(f"DROP TABLE {SEARCH_TABLE}"))
+        connection.execute(delete(SchemaMigrationRecord).where(SchemaMigrationRecord.version == 6))
+
+    messages: list[str] = []
+    run_migrations(engine, chunk_size=2, progress=messages.append)
+
+    assert len(store.search("cipher", limit=10)[0]) == 5
+    assert messages[-1] == "Indexed 5 findings for search (through id 5)"
@@ -0,0 +1,129 @@
+import json
+from datetime import UTC, datetime
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, select
+
+from saastesa.api.db_models import SecurityFindingRecord
+from saastesa.api.main import create_app
+from saastesa.api.tenancy import (
+    InvalidTenantError,
+    TenantStoreRouter,
+    default_tenant_id,
+    normalize_tenant_id,
+)
+from saastesa.core.models import SecurityFinding, ThreatSignal
+from saastesa.core.risk_scoring import build_finding
+
+
+def _signals(signal_type: str = "stale_admin_credential") -> dict[str, object]:
+    return {
+        "signals": [
+            {
+                "source": "iam",
+                "signal_type": signal_type,
+                "severity": 5,
+                "detected_at": datetime.now(tz=UTC).isoformat(),
+                "metadata": {"privileged_access": True},
+            }
+        ]
+    }
+
+
+def _finding(signal_type: str) -> SecurityFinding:
+    return build_finding(ThreatSignal("iam", signal_type, 5, datetime.now(tz=UTC), {}))
+
+
+def test_tenant_ids_are_normalized_and_validated(monkeypatch) -> None:
+    assert normalize_tenant_id(" Acme ") == "acme"
+    with pytest.raises(InvalidTenantError):
+        normalize_tenant_id("acme corp")
+
+    monkeypatch.setenv("TESA_ORGANIZATION", "Acme Corp!")
+    assert default_tenant_id() == "acme-corp"
+
+
+def test_findings_are_isolated_by_organization_header(tmp_path) -> None:
+    client = TestClient(create_app(database_url=f"sqlite+pysqlite:///{tmp_path / 'tenants.db'}"))
+
+    for tenant in ("acme", "globex"):
+        response = client.post(
+            "/api/v1/signals", json=_signals(), headers={"X-TESA-Organization": tenant}
+        )
+        assert response.status_code == 200
+
+    acme = client.get("/api/v1/findings", headers={"X-TESA-Organization": "acme"}).json()
+    globex = client.get("/api/v1/findings", headers={"X-TESA-Organization": "globex"}).json()
+    assert len(acme) == 1
+    assert len(globex) == 1
+    assert acme[0]["finding_uid"] != globex[0]["finding_uid"]
+    assert client.get("/api/v1/findings").json() == []
+
+    invalid = client.get("/api/v1/findings", headers={"X-TESA-Organization": "no spaces"})
+    assert invalid.status_code == 400
+
+
+def test_shard_map_routes_tenants_to_separate_databases(tmp_path) -> None:
+    primary_url = f"sqlite+pysqlite:///{tmp_path / 'primary.db'}"
+    shard_url = f"sqlite+pysqlite:///{tmp_path / 'globex.db'}"
+    router = TenantStoreRouter(
+        primary_url, auto_migrate=True, shard_map={"globex": shard_url}, default_tenant="acme"
+    )
+
+    router.get("acme").add([_finding("public_bucket")])
+    router.get("initech").add([_finding("mfa_disabled")])
+    router.get("globex").add([_finding("sql_injection"), _finding("mfa_disabled")])
+
+    with create_engine(shard_url).connect() as connection:
+        shard_tenants = set(connection.scalars(select(SecurityFindingRecord.tenant_id).distinct()))
+    assert shard_tenants == {"globex"}
+    assert router.tenants() == ["acme", "globex", "initech"]
+
+    counts = router.fan_out(lambda store: len(store.list(limit=100)))
+    assert counts == {"acme": 1, "globex": 2, "initech": 1}
+    router.dispose()
+
+
+def test_router_keeps_a_bounded_number_of_tenant_stores(tmp_path) -> None:
+    router = TenantStoreRouter(
+        f"sqlite+pysqlite:///{tmp_path / 'primary.db'}", auto_migrate=True, max_stores=2
+    )
+    acme = router.get("acme")
+    globex = router.get("globex")
+    assert router.get("acme") is acme
+    router.get("initech")
+
+    assert router.get("acme") is acme
+    assert router.get("globex") is not globex
+    assert router.get("globex").write_version > globex.write_version
+    assert len(router._stores) == 2
+    router.dispose()
+
+
+def test_admin_summary_merges_tenant_summaries(tmp_path, monkeypatch) -> None:
+    assert TestClient(create_app()).get("/api/v1/admin/tenants").status_code == 404
+
+    monkeypatch.setenv("TESA_ADMIN_ROUTES_ENABLED", "true")
+    monkeypatch.setenv(
+        "TESA_SHARD_MAP",
+        json.dumps({"globex": f"sqlite+pysqlite:///{tmp_path / 'globex.db'}"}),
+    )
+    client = TestClient(create_app())
+    for tenant, signal_type in (
+        ("acme", "public_bucket"),
+        ("globex", "public_bucket"),
+        ("globex", "sql_injection"),
+    ):
+        client.post(
+            "/api/v1/signals",
+            json=_signals(signal_type),
+            headers={"X-TESA-Organization": tenant},
+        )
+
+    assert client.get("/api/v1/admin/tenants").json() == {"tenants": ["acme", "globex"]}
+
+    summary = client.get("/api/v1/admin/summary").json()
+    assert sum(summary["tenants"]["acme"].values()) == 1
+    assert sum(summary["tenants"]["globex"].values()) == 2
+    assert sum(summary["total"].values()) == 3
@@ -0,0 +1,76 @@
+from datetime import UTC, datetime
+
+import pytest
+from fastapi.testclient import TestClient
+
+from saastesa.api.main import create_app
+from saastesa.core.models import ThreatSignal
+from saastesa.sdk.api_client import TESAApiClient
+from saastesa.wire import MSGPACK_MEDIA_TYPE, accepts_msgpack, packb, unpackb
+
+pytest.importorskip("msgpack")
+
+DETECTED_AT = datetime(2026, 4, 1, 9, 30, 15, 123456, tzinfo=UTC)
+
+
+def _client(tmp_path) -> TestClient:
+    return TestClient(create_app(database_url=f"sqlite+pysqlite:///{tmp_path / 'wire.db'}"))
+
+
+def test_timestamps_round_trip_natively() -> None:
+    decoded = unpackb(packb({"aware": DETECTED_AT, "naive": DETECTED_AT.replace(tzinfo=None)}))
+
+    assert decoded == {"aware": DETECTED_AT, "naive": DETECTED_AT}
+    assert accepts_msgpack("application/json, application/msgpack;q=0.9")
+    assert not accepts_msgpack("application/msgpack;q=0")
+    assert not accepts_msgpack(None)
+
+
+def test_signals_and_findings_negotiate_msgpack(tmp_path) -> None:
+    client = _client(tmp_path)
+    body = packb(
+        {
+            "signals": [
+                {
+                    "source": "sast",
+                    "signal_type": "sql_injection",
+                    "severity": 4,
+                    "detected_at": DETECTED_AT,
+                    "metadata": {"cve": ["CVE-2026-0001"]},
+                }
+            ]
+        }
+    )
+    headers = {"Content-Type": MSGPACK_MEDIA_TYPE, "Accept": MSGPACK_MEDIA_TYPE}
+
+    ingested = client.post("/api/v1/signals", content=body, headers=headers)
+
+    assert ingested.status_code == 200
+    assert ingested.headers["content-type"] == MSGPACK_MEDIA_TYPE
+    finding = unpackb(ingested.content)["findings"][0]
+    assert finding["time"] == DETECTED_AT
+    assert finding["references"]["cve"] == ["CVE-2026-0001"]
+
+    listed = client.get("/api/v1/findings", headers={"Accept": MSGPACK_MEDIA_TYPE})
+    projected = client.get(
+        "/api/v1/findings", params={"fields": "risk_score"}, headers={"Accept": MSGPACK_MEDIA_TYPE}
+    )
+    as_json = client.get("/api/v1/findings")
+
+    assert unpackb(listed.content)[0]["finding_uid"] == finding["finding_uid"]
+    assert unpackb(projected.content) == [
+        {"finding_uid": finding["finding_uid"], "risk_score": finding["risk_score"]}
+    ]
+    assert as_json.json()[0]["finding_uid"] == finding["finding_uid"]
+    assert client.post("/api/v1/signals", content=b"\xc1", headers=headers).status_code == 400
+
+
+def test_sdk_sends_msgpack(tmp_path, monkeypatch) -> None:
+    monkeypatch.setattr("saastesa.sdk.api_client.httpx.Client", lambda timeout: _client(tmp_path))
+    sdk = TESAApiClient("http://testserver", wire_format="msgpack")
+
+    result = sdk.send_signals([ThreatSignal("iam", "mfa_disabled", 3, DETECTED_AT, {})])
+
+    assert result["ingested"] == 1
+    assert result["findings"][0]["time"] == DETECTED_AT
+    assert sdk.send_findings([])["ingested"] == 0